@@ -1,9 +1,50 @@
+import argparse
+
 from src.games_list_extractor import VRDBExtractor
+from src.http_cache import CACHE_MAX_BYTES, CACHE_TTL, ResponseCache
+from src.metrics import metrics, profiled
+from src.output_formats import CSV, DEFAULT_CATALOG_FORMATS, EXCEL, JSON, PARQUET
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Extract the VRDB games catalog.")
+    parser.add_argument('--pipelined', action='store_true',
+                        help="Fetch pages concurrently and parse them in parallel")
+    parser.add_argument('--fetchers', type=int, default=8, help="Concurrent fetchers in pipelined mode")
+    parser.add_argument('--full', action='store_true',
+                        help="Re-crawl every page instead of refreshing the last crawl incrementally")
+    parser.add_argument('--export-only', action='store_true',
+                        help="Rebuild the catalog outputs from the page spool without crawling")
+    parser.add_argument('--formats', nargs='+', choices=[PARQUET, EXCEL, JSON, CSV], default=DEFAULT_CATALOG_FORMATS,
+                        help="Catalog output formats (default: %(default)s)")
+    parser.add_argument('--cache-dir', help="Cache VRDB responses in this directory")
+    parser.add_argument('--cache-ttl', type=float, default=CACHE_TTL, help="Seconds a cached page stays fresh")
+    parser.add_argument('--cache-max-mb', type=float, default=CACHE_MAX_BYTES / 1024 / 1024,
+                        help="Size cap of the response cache in MiB")
+    parser.add_argument('--offline', action='store_true',
+                        help="Serve every page from the response cache without touching vrdb.app")
+    parser.add_argument('--metrics-file',
+                        help="Write the crawl's stage timings and counters here (.json, else Prometheus text)")
+    parser.add_argument('--profile-dir', help="Dump a cProfile and tracemalloc report of the crawl to this directory")
+    args = parser.parse_args()
+
     try:
-        extractor = VRDBExtractor()
-        output_file = extractor.run()
-        print(f"Successfully extracted VR games data to: {output_file}")
+        cache = None
+        if args.cache_dir:
+            cache = ResponseCache(args.cache_dir, ttl=args.cache_ttl, max_bytes=int(args.cache_max_mb * 1024 * 1024),
+                                  offline=args.offline)
+        elif args.offline:
+            parser.error("--offline needs --cache-dir")
+        extractor = VRDBExtractor(pool_size=args.fetchers, cache=cache, output_formats=tuple(args.formats))
+        with profiled(args.profile_dir, 'vrdb_crawl'):
+            if args.export_only:
+                output_files = extractor.export()
+            elif args.pipelined:
+                output_files = extractor.run_pipelined(num_fetchers=args.fetchers, incremental=not args.full)
+            else:
+                output_files = extractor.run(incremental=not args.full)
+        print(f"Successfully extracted VR games data to: {', '.join(output_files)}")
     except Exception as e:
-        print(f"Error: {str(e)}")
\ No newline at end of file
+        print(f"Error: {str(e)}")
+    finally:
+        if args.metrics_file:
+            metrics.write(args.metrics_file)
\ No newline at end of file
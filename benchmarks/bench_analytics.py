@@ -0,0 +1,49 @@
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.fixtures import RELATIVE_TIMES
+from src.review_analytics import game_aggregates, parse_helpful_votes, parse_review_times
+
+
+def make_reviews(num_rows: int, num_games: int, seed: int = 0) -> pd.DataFrame:
+    """Synthetic review columns drawn from the texts the store shows, with one scrape time per game."""
+    rng = np.random.default_rng(seed)
+    times = np.array(RELATIVE_TIMES + [f"{n} months ago" for n in range(2, 12)] + ['2023-05-01', 'N/A'],
+                     dtype=object)
+    votes = np.array(['N/A', '1 person found this helpful']
+                     + [f"{n} people found this helpful" for n in range(2, 300)], dtype=object)
+    game_codes = rng.integers(0, num_games, num_rows)
+    scrape_times = pd.Timestamp('2026-01-01', tz='UTC') + pd.to_timedelta(rng.integers(0, 86400 * 300, num_games),
+                                                                            unit='s')
+    return pd.DataFrame({
+        'game_id': pd.Categorical.from_codes(game_codes, [str(1_000_000 + i) for i in range(num_games)]),
+        'rating': rng.integers(1, 6, num_rows).astype(np.int8),
+        'time': times[rng.integers(0, len(times), num_rows)],
+        'helpful_votes': votes[np.minimum(rng.geometric(0.2, num_rows) - 1, len(votes) - 1)],
+        'scraped_at': scrape_times[game_codes],
+    })
+
+
+def timed(label: str, func):
+    started = time.perf_counter()
+    result = func()
+    print(f"  {label:<22} {time.perf_counter() - started:8.2f} s")
+    return result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Time the vectorized review analytics on synthetic reviews.")
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000, 10_000_000])
+    parser.add_argument('--games', type=int, default=5000)
+    args = parser.parse_args()
+
+    for num_rows in args.rows:
+        reviews = make_reviews(num_rows, args.games)
+        print(f"{num_rows} reviews of {args.games} games")
+        reviews['reviewed_at'] = timed('parse_review_times', lambda: parse_review_times(reviews['time'],
+                                                                                        reviews['scraped_at']))
+        reviews['helpful_count'] = timed('parse_helpful_votes', lambda: parse_helpful_votes(reviews['helpful_votes']))
+        timed('game_aggregates', lambda: game_aggregates(reviews))
@@ -0,0 +1,37 @@
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+from benchmarks.fixture_server import VRDBFixtureServer
+from src.games_list_extractor import VRDBExtractor
+
+
+def time_crawl(mode: str, base_url: str, output_dir: str, num_fetchers: int) -> float:
+    extractor = VRDBExtractor(base_url=base_url, pool_size=num_fetchers)
+    output_file = os.path.join(output_dir, f"{mode}.xlsx")
+    output_file_json = os.path.join(output_dir, f"{mode}.json")
+
+    started_at = time.perf_counter()
+    if mode == 'sequential':
+        extractor.run(output_file, output_file_json)
+    else:
+        extractor.run_pipelined(output_file, output_file_json, num_fetchers=num_fetchers)
+    return time.perf_counter() - started_at
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compare sequential and pipelined VRDB crawls offline.")
+    parser.add_argument('--pages', type=int, default=40)
+    parser.add_argument('--latency', type=float, default=0.1, help="Simulated per-request latency in seconds")
+    parser.add_argument('--fetchers', type=int, default=8)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    with VRDBFixtureServer(num_pages=args.pages, latency=args.latency) as server, \
+            tempfile.TemporaryDirectory() as output_dir:
+        for mode in ('sequential', 'pipelined'):
+            elapsed = time_crawl(mode, server.base_url, output_dir, args.fetchers)
+            print(f"{mode:<10} {args.pages} pages in {elapsed:6.2f}s - {args.pages / elapsed:6.2f} pages/s")
@@ -0,0 +1,55 @@
+import argparse
+import glob
+import logging
+import os
+import timeit
+import tracemalloc
+
+from benchmarks.fixtures import make_vrdb_page
+from src.games_list_extractor import VRDBExtractor
+
+
+def load_pages(pages_dir: str, sizes: list) -> dict:
+    """Saved VRDB pages from `pages_dir` (*.html), or generated pages of the given sizes."""
+    if pages_dir:
+        pages = {}
+        for path in sorted(glob.glob(os.path.join(pages_dir, '*.html'))):
+            with open(path, 'rb') as f:
+                pages[os.path.basename(path)] = f.read()
+        return pages
+    return {f"{size} games": make_vrdb_page(1, size).encode('utf-8') for size in sizes}
+
+
+def peak_memory(func) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compare raw-HTML and BeautifulSoup script extraction.")
+    parser.add_argument('--pages-dir', help="Directory of saved VRDB listing pages (*.html)")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[25, 500, 5000], help="Games per generated page")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    extractor = VRDBExtractor()
+
+    for name, raw_page in load_pages(args.pages_dir, args.sizes).items():
+        html_content = raw_page.decode('utf-8')
+        if extractor.scan_script_content(raw_page) != extractor.extract_script_content_soup(html_content):
+            raise SystemExit(f"Scanned script differs from the BeautifulSoup result on {name}")
+
+        modes = {
+            'soup': lambda: extractor.extract_script_content_soup(html_content),
+            'scan str': lambda: extractor.scan_script_content(html_content),
+            'scan bytes': lambda: extractor.scan_script_content(raw_page),
+        }
+        print(f"{name} ({len(raw_page) / 1024:.0f} KiB)")
+        for mode, func in modes.items():
+            elapsed = min(timeit.repeat(func, number=5, repeat=args.repeat)) / 5
+            print(f"  {mode:<11} {elapsed * 1000:9.3f} ms  peak {peak_memory(func) / 1024:10.1f} KiB")
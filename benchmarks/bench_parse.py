@@ -0,0 +1,62 @@
+import argparse
+import json
+import logging
+import os
+import timeit
+
+from benchmarks.fixtures import make_vrdb_page
+from src.games_list_extractor import VRDBExtractor
+
+# Listing page, and the DataFrame (`to_json(orient='split')`) the original regex cascade parsed from it
+BASELINE_PAGE = os.path.join(os.path.dirname(__file__), 'baseline', 'vrdb_page.html')
+BASELINE_PARSED = os.path.join(os.path.dirname(__file__), 'baseline', 'vrdb_page_parsed.json')
+
+
+def parsed_as_json(df) -> dict:
+    """`df` in the form BASELINE_PARSED is saved in."""
+    return json.loads(df.to_json(orient='split', index=False, double_precision=15))
+
+
+def check_baseline(extractor: VRDBExtractor) -> None:
+    """Fail unless both parsers give the output the original parser gave on the recorded page."""
+    with open(BASELINE_PAGE, encoding='utf-8') as f:
+        script_content = extractor.extract_script_content(f.read())
+    with open(BASELINE_PARSED, encoding='utf-8') as f:
+        expected = json.load(f)
+    for parse in (extractor.parse_game_data, extractor.parse_game_data_regex):
+        if parsed_as_json(parse(script_content)) != expected:
+            raise SystemExit(f"{parse.__name__} differs from the original parser on {BASELINE_PAGE}")
+
+
+def bench_page(extractor: VRDBExtractor, size: int, num_developers: int, repeat: int) -> None:
+    script_content = extractor.extract_script_content(make_vrdb_page(1, size, num_developers=num_developers))
+
+    expected = extractor.parse_game_data_regex(script_content)
+    actual = extractor.parse_game_data(script_content)
+    if not expected.equals(actual):
+        raise SystemExit(f"Scanner output differs from the regex parser on a {size}-game page")
+
+    number = max(1, 2000 // size)
+    regex_time = min(timeit.repeat(lambda: extractor.parse_game_data_regex(script_content),
+                                   number=number, repeat=repeat)) / number
+    scanner_time = min(timeit.repeat(lambda: extractor.parse_game_data(script_content),
+                                     number=number, repeat=repeat)) / number
+    print(f"{size:>6} games {num_developers:>5} developers  regex {regex_time * 1000:9.2f} ms  "
+          f"scanner {scanner_time * 1000:9.2f} ms  speedup {regex_time / scanner_time:7.2f}x")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compare the regex cascade and the single-pass scanner.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[25, 500, 5000], help="Games per fixture page")
+    parser.add_argument('--developers', type=int, nargs='+', default=[0, 100],
+                        help="Entries in the developer filter list that follows the games")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    extractor = VRDBExtractor()
+    check_baseline(extractor)
+
+    for num_developers in args.developers:
+        for size in args.sizes:
+            bench_page(extractor, size, num_developers, args.repeat)
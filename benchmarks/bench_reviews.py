@@ -0,0 +1,69 @@
+import argparse
+import glob
+import logging
+import os
+import pathlib
+import tempfile
+import time
+
+from benchmarks.fixtures import make_meta_store_page
+from src.review_cards import EXTRACT_WITH_SCRIPT, EXTRACT_WITH_WEBDRIVER
+from src.selenium_reviews_extractor import MetaReviewsExtractor
+
+
+def snapshot_paths(pages_dir: str, sizes: list, work_dir: str) -> dict:
+    """Saved store page snapshots from `pages_dir` (*.html), or generated ones of the given sizes."""
+    if pages_dir:
+        return {os.path.basename(path): path for path in sorted(glob.glob(os.path.join(pages_dir, '*.html')))}
+    paths = {}
+    for size in sizes:
+        path = os.path.join(work_dir, f"store_page_{size}.html")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(make_meta_store_page(size))
+        paths[f"{size} reviews"] = path
+    return paths
+
+
+def time_extraction(extractor: MetaReviewsExtractor, mode: str, repeat: int):
+    extractor.extraction_mode = mode
+    best = float('inf')
+    reviews = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        reviews = extractor.extract_reviews('https://www.meta.com/experiences/benchmark')
+        best = min(best, time.perf_counter() - started)
+    return best, reviews
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compare per-field WebDriver lookups with one-script review "
+                                                 "extraction on store page snapshots.")
+    parser.add_argument('--pages-dir', help="Directory of saved Meta store pages (*.html)")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000], help="Reviews per generated page")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    extractor = MetaReviewsExtractor()
+    extractor.setup_logger = lambda game_id: logging.getLogger('bench_reviews')
+    try:
+        extractor.start_driver()
+    except Exception as e:
+        print(f"Chrome is not available, skipping the review extraction benchmark: {e}")
+        raise SystemExit(0)
+
+    try:
+        with tempfile.TemporaryDirectory() as work_dir:
+            for name, path in snapshot_paths(args.pages_dir, args.sizes, work_dir).items():
+                extractor.driver.get(pathlib.Path(path).resolve().as_uri())
+                script_time, script_reviews = time_extraction(extractor, EXTRACT_WITH_SCRIPT, args.repeat)
+                webdriver_time, webdriver_reviews = time_extraction(extractor, EXTRACT_WITH_WEBDRIVER, args.repeat)
+                if script_reviews != webdriver_reviews:
+                    raise SystemExit(f"Script extraction differs from WebDriver lookups on {name}")
+
+                print(f"{name}: {len(script_reviews)} reviews")
+                print(f"  {EXTRACT_WITH_WEBDRIVER:<10} {webdriver_time * 1000:10.1f} ms")
+                print(f"  {EXTRACT_WITH_SCRIPT:<10} {script_time * 1000:10.1f} ms  "
+                      f"({webdriver_time / script_time:.1f}x)")
+    finally:
+        extractor.close_driver_pool()
@@ -0,0 +1,115 @@
+import argparse
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.fixtures import GAMES_PER_PAGE, make_vrdb_page
+
+
+class VRDBFixtureServer:
+    """
+    Local stand-in for https://vrdb.app/games serving generated listing pages.
+
+    Pages 1..num_pages hold `games_per_page` games, later pages are empty. `latency` adds a
+    per-request delay so network-bound crawl modes can be compared offline. Responses carry an
+    ETag and honour If-None-Match; `update_pages` changes pages to simulate catalog updates.
+    """
+
+    def __init__(self, num_pages: int = 20, games_per_page: int = GAMES_PER_PAGE, latency: float = 0.0,
+                 host: str = '127.0.0.1', port: int = 0):
+        self.num_pages = num_pages
+        self.games_per_page = games_per_page
+        self.latency = latency
+        self.requests_served = 0
+        self._pages = {}
+        self._revisions = {}
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                if parsed.path.rstrip('/') != '/games':
+                    self.send_error(404)
+                    return
+                page = int(parse_qs(parsed.query).get('page', ['1'])[0])
+                body = server.page_body(page)
+                etag = '"%s"' % hashlib.md5(body).hexdigest()
+                if server.latency:
+                    time.sleep(server.latency)
+                with server._lock:
+                    server.requests_served += 1
+
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('ETag', etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/games"
+
+    def page_body(self, page: int) -> bytes:
+        with self._lock:
+            if page not in self._pages:
+                num_games = self.games_per_page if page <= self.num_pages else 0
+                seed = self._revisions.get(page, 0)
+                self._pages[page] = make_vrdb_page(page, num_games, seed=seed).encode('utf-8')
+            return self._pages[page]
+
+    def update_pages(self, pages: list) -> None:
+        """Give the listed pages new content, leaving every other page unchanged."""
+        with self._lock:
+            for page in pages:
+                self._revisions[page] = self._revisions.get(page, 0) + 1
+                self._pages.pop(page, None)
+
+    def start(self) -> 'VRDBFixtureServer':
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Serve generated VRDB listing pages locally.")
+    parser.add_argument('--pages', type=int, default=180)
+    parser.add_argument('--games-per-page', type=int, default=GAMES_PER_PAGE)
+    parser.add_argument('--latency', type=float, default=0.0, help="Per-request delay in seconds")
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    fixture_server = VRDBFixtureServer(args.pages, args.games_per_page, args.latency, port=args.port)
+    print(f"Serving {args.pages} VRDB pages at {fixture_server.base_url}")
+    fixture_server.httpd.serve_forever()
@@ -0,0 +1,195 @@
+import html
+import json
+import random
+import re
+
+from src import review_cards
+from src.selenium_reviews_extractor import GAME_DETAILS_XPATH
+
+GENRES = ['Action', 'Adventure', 'Casual', 'Fighting', 'Hangout', 'Music', 'Puzzle', 'Racing', 'RPG',
+          'Shooter', 'Simulation', 'Sports', 'Strategy', 'World Creation']
+PLATFORMS = ['Meta Quest 3S', 'Meta Quest 3', 'Meta Quest Pro', 'Meta Quest 2']
+LANGUAGES = ['English', 'French', 'German', 'Italian', 'Japanese', 'Korean', 'Spanish']
+GAME_MODES = ['Single User', 'Multiplayer', 'Co-op']
+AGE_RATINGS = ['Everyone', 'Everyone 10+', 'Teen', 'Mature 17+']
+
+# Number of games VRDB lists per page
+GAMES_PER_PAGE = 25
+
+
+def _js_string(value: str) -> str:
+    return json.dumps(value)
+
+
+def _js_array(values: list) -> str:
+    return json.dumps(values, separators=(',', ':'))
+
+
+def make_vrdb_game(game_id: int, rng: random.Random, quirks: bool = False) -> str:
+    """
+    Render one game the way the VRDB SvelteKit payload does (unquoted keys, JSON values).
+
+    With `quirks`, some names hold escaped quotes and backslashes and the keys come in random order.
+    """
+    fields = [
+        ('id', _js_string(str(game_id))),
+        ('name', _js_string(f"Game {game_id} {rng.choice(GENRES)} VR")),
+        ('genres', _js_array(rng.sample(GENRES, rng.randint(1, 3)))),
+        ('store_link', _js_string(f"https://www.meta.com/experiences/{game_id}")),
+        ('developer', _js_string(f"Studio {rng.randint(1, 500)}") if rng.random() > 0.05 else 'null'),
+        ('publisher', _js_string(f"Publisher {rng.randint(1, 200)}") if rng.random() > 0.05 else 'null'),
+        ('platforms', _js_array(rng.sample(PLATFORMS, rng.randint(1, len(PLATFORMS))))),
+        ('release_date', _js_string(f"20{rng.randint(16, 24)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}")),
+        ('rating_score', repr(round(rng.uniform(1, 5), 6))),
+        ('rating_count', str(rng.randint(0, 150000))),
+        ('game_mode', _js_string(rng.choice(GAME_MODES))),
+        ('languages', _js_array(rng.sample(LANGUAGES, rng.randint(1, 4)))),
+        ('age_rating', _js_string(rng.choice(AGE_RATINGS))),
+        ('space_required', _js_string(f"{rng.randint(100, 9000)} MB") if rng.random() > 0.5 else 'null'),
+        ('price_USD_amount', str(rng.choice([0, 499, 999, 1999, 2999]))),
+    ]
+    price = int(fields[-1][1])
+    fields.append(('price_USD_formatted', _js_string(f"${price / 100:.2f}")))
+    if quirks:
+        if rng.random() < 0.3:
+            fields[1] = ('name', _js_string(f'Game {game_id} "{rng.choice(GENRES)}" \\ VR'))
+        rng.shuffle(fields)
+    return '{' + ','.join(f"{key}:{value}" for key, value in fields) + '}'
+
+
+def make_vrdb_filters(num_developers: int) -> str:
+    """Render the filter lists that follow the games: objects with an id and a name but no store link."""
+    developers = ','.join(f'{{id:"{i}",name:"Studio {i}",count:{i % 17}}}' for i in range(1, num_developers + 1))
+    genres = ','.join(f'{{id:"{i}",name:{_js_string(genre)}}}' for i, genre in enumerate(GENRES, 1))
+    return f'filters:{{genres:[{genres}],developers:[{developers}]}}'
+
+
+def make_vrdb_page(page: int, num_games: int = GAMES_PER_PAGE, seed: int = 0, num_developers: int = 0,
+                   quirks: bool = False) -> str:
+    """
+    Render a VRDB listing page holding `num_games` games.
+
+    A page with no games keeps the `resolve({id:1` script but has an empty list, like the
+    first page past the end of the catalog. `num_developers` appends a developer filter list;
+    `quirks` renders the games with escaped names and shuffled keys (see `make_vrdb_game`).
+    """
+    rng = random.Random(seed * 1_000_003 + page)
+    first_id = 1_000_000_000_000 + page * 10_000
+    games = ','.join(make_vrdb_game(first_id + i, rng, quirks) for i in range(num_games))
+    data = f"games:[{games}]"
+    if num_developers:
+        data += ',' + make_vrdb_filters(num_developers)
+
+    return (
+        '<!doctype html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+        '<title>VRDB - Games</title>\n'
+        '<link rel="stylesheet" href="/_app/immutable/assets/0.css">\n'
+        '<script type="module">import("/_app/immutable/entry/start.js")</script>\n'
+        '</head>\n<body>\n<div style="display: contents">'
+        + ''.join(f'<div class="game-card"><a href="/games/{first_id + i}">Game {first_id + i}</a></div>'
+                  for i in range(num_games))
+        + '</div>\n<script>\n{__sveltekit_1 = {base: new URL(".", location).pathname.slice(0, -1)};'
+        'const data = [null,null];Promise.all([import("/_app/immutable/entry/start.js")])'
+        '.then(([kit]) => {kit.start(document.body, data);});'
+        f'__sveltekit_1.resolve({{id:1,data:{{{data},page:{page},total:null}},error:void 0}})}}\n'
+        '</script>\n</body>\n</html>\n'
+    )
+
+
+REVIEW_TITLES = ['Great game', 'Not worth it', 'Fun with friends', 'Needs more content', 'Motion sickness',
+                 'Best VR experience', 'Buggy after update', 'Solid', 'Refund requested', 'Masterpiece']
+REVIEW_WORDS = ['graphics', 'controls', 'multiplayer', 'story', 'update', 'price', 'comfort', 'hand tracking',
+                'the developers', 'my kids', 'Quest 3', 'performance', 'levels', 'soundtrack']
+RELATIVE_TIMES = ['2 hours ago', 'yesterday', '3 days ago', 'last week', '2 weeks ago', 'a month ago',
+                  '5 months ago', 'a year ago', '2 years ago']
+
+
+def _xpath_classes(xpath: str) -> str:
+    """Class attribute satisfying a locator written as @class='...' or contains(@class, '...') tests."""
+    exact = re.search(r"@class='([^']*)'", xpath)
+    if exact:
+        return exact.group(1)
+    return ' '.join(re.findall(r"contains\(\s*@class,\s*'([^']*)'\)", xpath))
+
+
+def make_meta_review_card(review_id: int, rng: random.Random) -> str:
+    """
+    Render one review card with the class names the scraper's locators expect.
+
+    About one card in ten lacks its title element, so the text-line fallbacks get exercised.
+    """
+    stars = rng.randint(1, 5)
+    content = ' '.join(f"The {rng.choice(REVIEW_WORDS)} is {rng.choice(['great', 'okay', 'bad'])}."
+                       for _ in range(rng.randint(1, 6)))
+    title = html.escape(f"{rng.choice(REVIEW_TITLES)} #{review_id}")
+    title_div = (f'<div class="{_xpath_classes(review_cards.TITLE_XPATH)}">{title}</div>'
+                 if rng.random() > 0.1 else f'<div>{title}</div>')
+    return (
+        f'<div class="{_xpath_classes(review_cards.REVIEW_CARD_XPATH)}">'
+        + title_div
+        + f'<div class="{review_cards.STARS_CLASS}">'
+        + ''.join(f'<span class="{review_cards.STAR_CLASS}">★</span>' for _ in range(stars))
+        + ''.join('<span class="x1rg5ohu">☆</span>' for _ in range(5 - stars))
+        + '</div>'
+        + f'<span class="{_xpath_classes(review_cards.TIME_XPATH)}">{rng.choice(RELATIVE_TIMES)}</span>'
+        + f'<div class="{_xpath_classes(review_cards.CONTENT_XPATH)}">{html.escape(content)}</div>'
+        + f'<span class="{_xpath_classes(review_cards.AUTHOR_XPATH)}">player_{rng.randint(1, 10 ** 6)}</span>'
+        + f'<span class="{_xpath_classes(review_cards.HELPFULNESS_XPATH)}">'
+          f'{rng.randint(0, 300)} people found this helpful</span>'
+        + '</div>'
+    )
+
+
+def make_meta_game_details(rng: random.Random) -> str:
+    """Render the game details panel: one line per label followed by one line per value."""
+    details = [
+        ('Game modes', rng.choice(GAME_MODES)),
+        ('Supported player modes', 'Sitting, Standing, Roomscale'),
+        ('Supported controllers', 'Touch controllers'),
+        ('Supported platforms', ', '.join(rng.sample(PLATFORMS, rng.randint(1, len(PLATFORMS))))),
+        ('Category', 'Games'),
+        ('Genres', ', '.join(rng.sample(GENRES, rng.randint(1, 3)))),
+        ('Languages', ', '.join(rng.sample(LANGUAGES, rng.randint(1, 4)))),
+        ('Version', f"1.{rng.randint(0, 40)}.{rng.randint(0, 9)}"),
+        ('Developer', f"Studio {rng.randint(1, 500)}"),
+        ('Publisher', f"Publisher {rng.randint(1, 200)}"),
+        ('Release date', f"{rng.choice(['Jan', 'Mar', 'Jun', 'Oct'])} {rng.randint(1, 28)}, 20{rng.randint(16, 24)}"),
+        ('Space required', f"{rng.uniform(0.1, 9):.2f} GB"),
+        ('Comfort level', rng.choice(['Comfortable', 'Moderate', 'Intense'])),
+    ]
+    lines = ''.join(f'<div>{html.escape(label)}</div><div>{html.escape(value)}</div>' for label, value in details)
+    return f'<div class="{_xpath_classes(GAME_DETAILS_XPATH)}">{lines}</div>'
+
+
+def make_meta_store_page(num_reviews: int, seed: int = 0) -> str:
+    """Render a Meta store page snapshot holding the game details panel and `num_reviews` loaded review cards."""
+    rng = random.Random(seed)
+    details = make_meta_game_details(rng)
+    cards = ''.join(make_meta_review_card(i, rng) for i in range(num_reviews))
+    return (
+        '<!doctype html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+        '<title>Game on Meta Quest | Quest VR Games | Meta Store</title>\n</head>\n<body>\n'
+        f'{details}\n<div id="reviews">{cards}</div>\n</body>\n</html>\n'
+    )
+
+
+def make_meta_review_node(review_id: int, rng: random.Random) -> dict:
+    """One review as the store's paginated review API returns it."""
+    return {
+        'id': str(review_id),
+        'review_title': f"{rng.choice(REVIEW_TITLES)} #{review_id}",
+        'score': rng.randint(1, 5),
+        'date': 1_600_000_000 + rng.randint(0, 140_000_000),
+        'review_description': ' '.join(f"The {rng.choice(REVIEW_WORDS)} is {rng.choice(['great', 'okay', 'bad'])}."
+                                       for _ in range(rng.randint(1, 6))),
+        'author': {'alias': f"player_{rng.randint(1, 10 ** 6)}"},
+        'helpful_count': rng.randint(0, 300),
+    }
+
+
+def make_meta_review_response(nodes: list, end_cursor: str, has_next_page: bool) -> dict:
+    """GraphQL response holding one page of reviews, shaped like the store's review connection."""
+    return {'data': {'node': {'__typename': 'Application', 'reviews': {
+        'edges': [{'node': node, 'cursor': node['id']} for node in nodes],
+        'page_info': {'end_cursor': end_cursor, 'has_next_page': has_next_page},
+    }}}}
@@ -0,0 +1,127 @@
+import argparse
+import glob
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl
+
+from benchmarks.fixtures import make_meta_review_node, make_meta_review_response
+from src.review_api import CURSOR_VARIABLES, find_review_connection
+
+
+class ReviewApiFixtureServer:
+    """
+    Local stand-in for the store's review GraphQL endpoint.
+
+    Serves recorded responses from `recordings_dir` (*.json, in name order, each page's end
+    cursor leading to the next file) or, without recordings, `num_reviews` generated reviews in
+    pages of `page_size`. Requests are POSTs to /api/graphql/ with form or JSON bodies whose
+    `variables` carry the cursor, like the ones the browser sends.
+    """
+
+    def __init__(self, num_reviews: int = 1000, page_size: int = 10, recordings_dir: str = None,
+                 latency: float = 0.0, host: str = '127.0.0.1', port: int = 0):
+        self.latency = latency
+        self.requests_served = 0
+        self._lock = threading.Lock()
+        self._responses = {}  # cursor (None for the first page) -> response body
+        if recordings_dir:
+            self._load_recordings(recordings_dir)
+        else:
+            self._generate(num_reviews, page_size)
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self):
+                if self.path.split('?')[0].rstrip('/') != '/api/graphql':
+                    self.send_error(404)
+                    return
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0))).decode('utf-8')
+                fields = json.loads(body) if body.lstrip().startswith('{') else dict(parse_qsl(body))
+                variables = fields.get('variables', {})
+                variables = json.loads(variables) if isinstance(variables, str) else variables
+                cursor = next((variables[key] for key in CURSOR_VARIABLES if variables.get(key) is not None), None)
+
+                if server.latency:
+                    time.sleep(server.latency)
+                with server._lock:
+                    server.requests_served += 1
+                response = server._responses.get(cursor)
+                if response is None:
+                    self.send_error(400, f"Unknown cursor {cursor}")
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(response)))
+                self.end_headers()
+                self.wfile.write(response)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    def _generate(self, num_reviews: int, page_size: int) -> None:
+        rng = random.Random(0)
+        nodes = [make_meta_review_node(i, rng) for i in range(num_reviews)]
+        cursor = None
+        for start in range(0, max(num_reviews, 1), page_size):
+            end_cursor = f"cursor-{start + page_size}"
+            has_next_page = start + page_size < num_reviews
+            response = make_meta_review_response(nodes[start:start + page_size], end_cursor, has_next_page)
+            self._responses[cursor] = json.dumps(response).encode('utf-8')
+            cursor = end_cursor
+
+    def _load_recordings(self, recordings_dir: str) -> None:
+        cursor = None
+        for path in sorted(glob.glob(os.path.join(recordings_dir, '*.json'))):
+            with open(path, 'rb') as f:
+                response = f.read()
+            self._responses[cursor] = response
+            connection = find_review_connection(json.loads(response))
+            if connection is None:
+                raise ValueError(f"No paginated review list in {path}")
+            cursor = connection[1]
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/api/graphql/"
+
+    def start(self) -> 'ReviewApiFixtureServer':
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Serve recorded or generated review API responses locally.")
+    parser.add_argument('--reviews', type=int, default=1000)
+    parser.add_argument('--page-size', type=int, default=10)
+    parser.add_argument('--recordings-dir', help="Directory of recorded review responses (*.json)")
+    parser.add_argument('--latency', type=float, default=0.0, help="Per-request delay in seconds")
+    parser.add_argument('--port', type=int, default=8766)
+    args = parser.parse_args()
+
+    fixture_server = ReviewApiFixtureServer(args.reviews, args.page_size, args.recordings_dir, args.latency,
+                                            port=args.port)
+    print(f"Serving review pages at {fixture_server.url}")
+    fixture_server.httpd.serve_forever()
@@ -0,0 +1,223 @@
+import argparse
+import datetime
+import json
+import logging
+import os
+import pathlib
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.fixtures import make_meta_review_node, make_meta_store_page, make_vrdb_page
+from src.games_list_extractor import VRDBExtractor
+from src.review_api import review_from_node
+from src.review_manifest import ReviewManifest
+from src.selenium_reviews_extractor import MetaReviewsExtractor
+
+# Games per recorded VRDB listing page
+SUITE_VRDB_SIZES = [25, 500, 5000]
+
+# Review cards per recorded Meta store page, and reviews per `save_game_reviews` run
+SUITE_REVIEW_SIZES = [10, 1000, 10000]
+
+# Format version of the results file, bumped when its layout changes
+RESULTS_VERSION = 1
+
+
+def record_fixtures(fixtures_dir: str, vrdb_sizes: List[int], review_sizes: List[int]) -> Dict[str, Dict[int, str]]:
+    """
+    Paths of the VRDB listing pages (vrdb_<games>.html) and Meta store pages (store_<reviews>.html)
+    in `fixtures_dir`. Missing pages are generated, so saved copies of real pages dropped in under
+    the same names are used as they are.
+    """
+    os.makedirs(fixtures_dir, exist_ok=True)
+    fixtures = {'vrdb': {}, 'store': {}}
+    for kind, sizes, render in (('vrdb', vrdb_sizes, lambda size: make_vrdb_page(1, size)),
+                                ('store', review_sizes, make_meta_store_page)):
+        for size in sizes:
+            path = os.path.join(fixtures_dir, f"{kind}_{size}.html")
+            if not os.path.exists(path):
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(render(size))
+            fixtures[kind][size] = path
+    return fixtures
+
+
+def measure(name: str, fixture: str, items: int, func: Callable[[], Any], repeat: int,
+            setup: Optional[Callable[[], Any]] = None) -> Dict[str, Any]:
+    """Time `repeat` calls of `func` (each after an untimed `setup`) and summarise them in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    best = min(timings)
+    return {
+        'benchmark': name,
+        'fixture': fixture,
+        'items': items,
+        'status': 'ok',
+        'repeat': repeat,
+        'best_ms': round(best, 3),
+        'mean_ms': round(statistics.mean(timings), 3),
+        'stdev_ms': round(statistics.stdev(timings), 3) if len(timings) > 1 else 0.0,
+        'items_per_s': round(items / best * 1000, 1) if best else None,
+    }
+
+
+def skipped(name: str, fixture: str, items: int, reason: str) -> Dict[str, Any]:
+    return {'benchmark': name, 'fixture': fixture, 'items': items, 'status': 'skipped', 'reason': reason}
+
+
+def bench_catalog(fixtures: Dict[int, str], work_dir: str, repeat: int) -> List[Dict[str, Any]]:
+    """`extract_script_content`, `parse_game_data` and `save_to_files` on each VRDB listing page."""
+    extractor = VRDBExtractor()
+    results = []
+    for size, path in sorted(fixtures.items()):
+        fixture = os.path.basename(path)
+        with open(path, 'rb') as f:
+            html_content = f.read()
+        script_content = extractor.extract_script_content(html_content)
+        df = extractor.parse_game_data(script_content)
+        excel_output = os.path.join(work_dir, f"catalog_{size}.xlsx")
+        json_output = os.path.join(work_dir, f"catalog_{size}.json")
+
+        results.append(measure('extract_script_content', fixture, size,
+                               lambda: extractor.extract_script_content(html_content), repeat))
+        results.append(measure('parse_game_data', fixture, len(df),
+                               lambda: extractor.parse_game_data(script_content), repeat))
+        results.append(measure('save_to_files', fixture, len(df),
+                               lambda: extractor.save_to_files(df, excel_output, json_output), repeat))
+    extractor.session.close()
+    return results
+
+
+def bench_save_reviews(sizes: List[int], work_dir: str, repeat: int) -> List[Dict[str, Any]]:
+    """`save_game_reviews` of 10 to 10000 reviews into a scratch output folder."""
+    results = []
+    for size in sizes:
+        rng = random.Random(size)
+        reviews = [review_from_node(make_meta_review_node(i, rng)) for i in range(size)]
+        output_dir = os.path.join(work_dir, f"reviews_{size}")
+        os.makedirs(os.path.join(output_dir, 'xlsx_games_reviews'), exist_ok=True)
+        os.makedirs(os.path.join(output_dir, 'csv_games_reviews'), exist_ok=True)
+        manifest = ReviewManifest(os.path.join(output_dir, 'review_manifest.db'))
+        extractor = MetaReviewsExtractor(review_manifest=manifest, output_dir=output_dir)
+
+        # A new game name per run, otherwise every run after the first is skipped as unchanged
+        runs = iter(range(repeat))
+        try:
+            results.append(measure('save_game_reviews', f"{size} reviews", size,
+                                   lambda: extractor.save_game_reviews(reviews, f"benchmark_{next(runs)}"), repeat))
+        finally:
+            extractor.close_review_manifest()
+    return results
+
+
+def bench_browser(fixtures: Dict[int, str], repeat: int) -> List[Dict[str, Any]]:
+    """`extract_reviews` and `extract_additional_games_details` on each store page, opened over file://."""
+    extractor = MetaReviewsExtractor()
+    extractor.setup_logger = lambda game_id: logging.getLogger('bench_suite')
+    url = 'https://www.meta.com/experiences/benchmark'
+    try:
+        extractor.start_driver()
+    except Exception as e:
+        reason = f"Chrome is not available: {str(e).splitlines()[0] if str(e) else type(e).__name__}"
+        return [skipped(name, os.path.basename(path), size, reason)
+                for size, path in sorted(fixtures.items())
+                for name in ('extract_reviews', 'extract_additional_games_details')]
+
+    results = []
+    try:
+        for size, path in sorted(fixtures.items()):
+            fixture = os.path.basename(path)
+            uri = pathlib.Path(path).resolve().as_uri()
+
+            # Each run harvests the cards afresh, so the page is reloaded before it
+            results.append(measure('extract_reviews', fixture, size, lambda: extractor.extract_reviews(url), repeat,
+                                   setup=lambda: extractor.driver.get(uri)))
+            results.append(measure('extract_additional_games_details', fixture, size,
+                                   lambda: extractor.extract_additional_games_details(url), repeat))
+    finally:
+        extractor.close_driver_pool()
+    return results
+
+
+def run_metadata() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'version': RESULTS_VERSION,
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def result_key(result: Dict[str, Any]) -> str:
+    return f"{result['benchmark']} [{result['fixture']}]"
+
+
+def print_results(results: List[Dict[str, Any]], baseline: Optional[Dict[str, Any]] = None) -> None:
+    """Table of the best times, with the change against a previous results file when one is given."""
+    previous = {result_key(result): result for result in (baseline or {}).get('results', [])
+                if result.get('status') == 'ok'}
+    for result in results:
+        key = result_key(result)
+        if result['status'] != 'ok':
+            print(f"{key:<55} {'skipped':>12}  {result['reason']}")
+            continue
+        line = f"{key:<55} {result['best_ms']:10.2f} ms  mean {result['mean_ms']:10.2f} ms"
+        if key in previous:
+            line += f"  {result['best_ms'] / previous[key]['best_ms']:6.2f}x vs {baseline['meta'].get('commit')}"
+        print(line)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Time the catalog and review pipeline stages on recorded fixture "
+                                                 "pages, without network access.")
+    parser.add_argument('--fixtures-dir', help="Directory of recorded pages (vrdb_<games>.html, "
+                                               "store_<reviews>.html); missing ones are generated into it")
+    parser.add_argument('--vrdb-sizes', type=int, nargs='+', default=SUITE_VRDB_SIZES)
+    parser.add_argument('--review-sizes', type=int, nargs='+', default=SUITE_REVIEW_SIZES)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--no-browser', action='store_true', help="Skip the benchmarks that need Chrome")
+    parser.add_argument('--output', help="Write the results as JSON to this file")
+    parser.add_argument('--compare', help="Results file of an earlier run to compare against")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        fixtures = record_fixtures(args.fixtures_dir or os.path.join(work_dir, 'fixtures'), args.vrdb_sizes,
+                                   args.review_sizes)
+        results = bench_catalog(fixtures['vrdb'], work_dir, args.repeat)
+        results += bench_save_reviews(args.review_sizes, work_dir, args.repeat)
+        if args.no_browser:
+            results += [skipped(name, os.path.basename(path), size, "--no-browser")
+                        for size, path in sorted(fixtures['store'].items())
+                        for name in ('extract_reviews', 'extract_additional_games_details')]
+        else:
+            results += bench_browser(fixtures['store'], args.repeat)
+
+    print_results(results, baseline)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'meta': run_metadata(), 'results': results}, f, indent=2)
+        print(f"Results written to {args.output}", file=sys.stderr)
@@ -0,0 +1,68 @@
+import json
+import logging
+import os
+from typing import Dict, List, Any
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogSink:
+    """
+    Append-only NDJSON spool of parsed catalog pages.
+
+    Each page is written as one line `{"page": n, "games": [...]}` and fsync'ed as soon as it
+    is parsed, so a crawl that dies part way keeps every completed page on disk. The final
+    DataFrame is built from the spool in one pass; when a page was written more than once the
+    last line wins.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def reset(self) -> None:
+        """Start an empty spool."""
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        open(self.path, 'w').close()
+
+    def write_page(self, page: int, games_df: pd.DataFrame) -> None:
+        """Append one parsed page and flush it to disk."""
+        games_json = games_df.to_json(orient='records', double_precision=15)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(f'{{"page": {page}, "games": {games_json}}}\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def read_pages(self) -> Dict[int, List[Dict[str, Any]]]:
+        """Read the spooled pages, skipping a line torn by a crash mid-write."""
+        pages = {}
+        if not os.path.exists(self.path):
+            return pages
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping unreadable line {line_number} in {self.path}")
+                    continue
+                pages[record['page']] = record['games']
+        return pages
+
+    def compact(self, stop_page: int) -> None:
+        """Rewrite the spool with one line per page, dropping pages at or past `stop_page`."""
+        pages = self.read_pages()
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for page in sorted(pages):
+                if page < stop_page:
+                    f.write(json.dumps({'page': page, 'games': pages[page]}) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Build the catalog DataFrame from the spool, in page order."""
+        pages = self.read_pages()
+        return pd.DataFrame([game for page in sorted(pages) for game in pages[page]])
@@ -0,0 +1,179 @@
+import itertools
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Number of concurrent page fetchers
+NUM_FETCHERS = 8
+
+# Number of threads parsing fetched pages
+NUM_PARSERS = 2
+
+# Capacity of the queues between the fetch, parse and write stages
+PIPELINE_QUEUE_SIZE = 16
+
+# How often blocked stages re-check for cancellation (seconds)
+POLL_INTERVAL = 0.1
+
+# Parse result for a page that has not changed since the last crawl
+UNCHANGED_PAGE = object()
+
+
+class CrawlPipeline:
+    """
+    Fetch -> parse -> write pipeline for the paginated VRDB catalog.
+
+    A bounded pool of fetchers claims page numbers in increasing order, parsers turn the
+    fetched HTML into DataFrames (or UNCHANGED_PAGE) and the writer (the calling thread) hands
+    the pages to `write_page` strictly in page order. The crawl ends at the first empty page,
+    even when later pages finish first.
+    """
+
+    def __init__(self, fetch_page: Callable[[int], Any], parse_page: Callable[[int, Any], Any],
+                 num_fetchers: int = NUM_FETCHERS, num_parsers: int = NUM_PARSERS,
+                 queue_size: int = PIPELINE_QUEUE_SIZE, start_page: int = 1):
+        self.fetch_page = fetch_page
+        self.parse_page = parse_page
+        self.num_fetchers = num_fetchers
+        self.num_parsers = num_parsers
+        self.start_page = start_page
+
+        self._pages = itertools.count(start_page)
+        self._lock = threading.Lock()
+        self._stop_page: Optional[int] = None
+        self._error: Optional[BaseException] = None
+        self._cancel = threading.Event()
+        self._fetched = queue.Queue(maxsize=queue_size)
+        self._parsed = queue.Queue(maxsize=queue_size)
+
+    def _next_page(self) -> int:
+        with self._lock:
+            return next(self._pages)
+
+    def _past_stop(self, page: int) -> bool:
+        with self._lock:
+            return self._stop_page is not None and page >= self._stop_page
+
+    def _mark_stop(self, page: int) -> None:
+        with self._lock:
+            if self._stop_page is None or page < self._stop_page:
+                self._stop_page = page
+
+    def _fail(self, error: BaseException) -> None:
+        with self._lock:
+            if self._error is None:
+                self._error = error
+        self._cancel.set()
+
+    def _put(self, q: queue.Queue, item) -> bool:
+        """Blocking put that gives up once the pipeline is cancelled."""
+        while not self._cancel.is_set():
+            try:
+                q.put(item, timeout=POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, q: queue.Queue):
+        """Blocking get that returns None once the pipeline is cancelled."""
+        while not self._cancel.is_set():
+            try:
+                return q.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return None
+
+    def _fetcher(self) -> None:
+        while not self._cancel.is_set():
+            page = self._next_page()
+            if self._past_stop(page):
+                return
+            try:
+                html_content = self.fetch_page(page)
+            except Exception as e:
+                logger.error(f"Fetcher failed on page {page}: {str(e)}")
+                self._fail(e)
+                return
+            if not self._put(self._fetched, (page, html_content)):
+                return
+
+    def _parser(self) -> None:
+        while True:
+            item = self._get(self._fetched)
+            if item is None:
+                return
+            page, html_content = item
+            if self._past_stop(page):
+                continue
+            try:
+                games_df = self.parse_page(page, html_content)
+            except ValueError:
+                games_df = None
+            except Exception as e:
+                logger.error(f"Parser failed on page {page}: {str(e)}")
+                self._fail(e)
+                return
+
+            if games_df is not UNCHANGED_PAGE and (games_df is None or games_df.empty):
+                logger.info(f"No more data found on page {page}. Ending extraction.")
+                self._mark_stop(page)
+                games_df = None
+            if not self._put(self._parsed, (page, games_df)):
+                return
+
+    def run(self, write_page: Callable[[int, Any], None]) -> int:
+        """
+        Run the crawl, calling `write_page(page, games_df)` for every non-empty page in order.
+        Pages the parser reported as UNCHANGED_PAGE are passed through as such.
+
+        :return: number of pages written
+        """
+        workers = [threading.Thread(target=self._fetcher, name=f"vrdb-fetch-{i}", daemon=True)
+                   for i in range(self.num_fetchers)]
+        workers += [threading.Thread(target=self._parser, name=f"vrdb-parse-{i}", daemon=True)
+                    for i in range(self.num_parsers)]
+        for worker in workers:
+            worker.start()
+
+        started_at = time.perf_counter()
+        pending = {}
+        next_page = self.start_page
+        games_written = 0
+        try:
+            while not self._past_stop(next_page):
+                item = self._get(self._parsed)
+                if item is None:
+                    break
+                page, games_df = item
+                pending[page] = games_df
+
+                while next_page in pending and not self._past_stop(next_page):
+                    games_df = pending.pop(next_page)
+                    write_page(next_page, games_df)
+                    if games_df is UNCHANGED_PAGE:
+                        logger.info(f"Page : {next_page} unchanged since the last crawl")
+                    else:
+                        games_written += len(games_df)
+                        logger.info(f"Page : {next_page} Number of data extracted - {len(games_df)}")
+                    next_page += 1
+        except BaseException as e:
+            self._fail(e)
+            raise
+        finally:
+            self._cancel.set()
+            for worker in workers:
+                worker.join()
+
+        if self._error is not None:
+            raise self._error
+
+        pages_written = next_page - self.start_page
+        elapsed = time.perf_counter() - started_at
+        logger.info(f"Crawled {pages_written} pages ({games_written} games parsed) in {elapsed:.2f}s "
+                    f"- {pages_written / elapsed if elapsed else 0:.2f} pages/s")
+        return pages_written
@@ -0,0 +1,122 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Pages committed between two saves of the crawl state; a crash re-fetches at most this many pages
+CRAWL_STATE_SAVE_INTERVAL = 50
+
+
+def content_hash(html_content: str) -> str:
+    """Stable hash of a fetched page body."""
+    return hashlib.sha256(html_content.encode('utf-8')).hexdigest()
+
+
+class CrawlState:
+    """
+    Persistent state of the VRDB catalog crawl.
+
+    For every page already written to the spool it keeps the content hash and the ETag /
+    Last-Modified validators, so re-runs can send conditional GETs and skip parsing pages that
+    did not change. `last_completed_page` and `finished` let a crashed crawl resume after the
+    last page it wrote. Validators seen while fetching are only staged and become part of the
+    state once the page is committed, so an unwritten page is never treated as unchanged.
+
+    Committed pages are saved every `save_interval` pages and by `finish`, `save` saves the rest
+    when a crawl is interrupted. Pages committed after the last save are fetched again on resume,
+    which the spool allows since the last copy of a page wins.
+    """
+
+    def __init__(self, path: str, save_interval: int = CRAWL_STATE_SAVE_INTERVAL):
+        self.path = path
+        self.save_interval = save_interval
+        self._unsaved = 0
+        self.pages: Dict[int, Dict[str, Optional[str]]] = {}
+        self.last_completed_page = 0
+        self.finished = True
+        self._staged: Dict[int, Dict[str, Optional[str]]] = {}
+        self._lock = threading.Lock()
+
+    def load(self) -> 'CrawlState':
+        if os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            self.pages = {int(page): entry for page, entry in state.get('pages', {}).items()}
+            self.last_completed_page = state.get('last_completed_page', 0)
+            self.finished = state.get('finished', True)
+        return self
+
+    def save(self) -> None:
+        """Write the state atomically."""
+        self._unsaved = 0
+        state = {
+            'last_completed_page': self.last_completed_page,
+            'finished': self.finished,
+            'pages': {str(page): entry for page, entry in sorted(self.pages.items())},
+        }
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.pages = {}
+            self._staged = {}
+            self.last_completed_page = 0
+            self.finished = True
+        self.save()
+
+    def resume_page(self) -> int:
+        """First page to fetch: after the last completed page of an unfinished crawl, else page 1."""
+        return 1 if self.finished else self.last_completed_page + 1
+
+    def start(self) -> None:
+        with self._lock:
+            if self.finished:
+                self.last_completed_page = 0
+            self.finished = False
+        self.save()
+
+    def conditional_headers(self, page: int) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for a page that is already in the spool."""
+        with self._lock:
+            entry = self.pages.get(page, {})
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def stage(self, page: int, **fields: Optional[str]) -> None:
+        """Remember validators or the content hash of a fetched page until it is committed."""
+        with self._lock:
+            self._staged.setdefault(page, {}).update(fields)
+
+    def is_unchanged(self, page: int, page_hash: str) -> bool:
+        with self._lock:
+            return self.pages.get(page, {}).get('hash') == page_hash
+
+    def commit(self, page: int) -> None:
+        """Record a page as written, saving the state every `save_interval` pages."""
+        with self._lock:
+            entry = self.pages.setdefault(page, {})
+            entry.update(self._staged.pop(page, {}))
+            self.last_completed_page = page
+            self._unsaved += 1
+            due = self._unsaved >= self.save_interval
+        if due:
+            self.save()
+
+    def finish(self, stop_page: int) -> None:
+        """Mark the crawl complete, forgetting pages at or past the first empty page."""
+        with self._lock:
+            self.pages = {page: entry for page, entry in self.pages.items() if page < stop_page}
+            self._staged = {}
+            self.finished = True
+        self.save()
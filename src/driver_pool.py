@@ -0,0 +1,198 @@
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+# Pages a browser serves before it is replaced by a fresh one
+DRIVER_MAX_USES = 25
+
+# Browser memory (chromedriver, Chrome and its renderers) above which it is replaced (MiB)
+DRIVER_MAX_MEMORY_MB = 1500
+
+# Seconds `acquire` waits for a released browser before giving up; a wait this long means a leaked one
+DRIVER_ACQUIRE_TIMEOUT = 600.0
+
+# Per-site data cleared between uses. The HTTP cache is kept so static bundles are reused.
+CLEARED_STORAGE_TYPES = 'cookies,local_storage,indexeddb,websql,service_workers,cache_storage,file_systems'
+
+
+def driver_memory_mb(driver: webdriver.Chrome) -> Optional[float]:
+    """Resident memory of the chromedriver process tree, or None without psutil."""
+    if psutil is None:
+        return None
+    try:
+        process = psutil.Process(driver.service.process.pid)
+        processes = [process] + process.children(recursive=True)
+        return sum(p.memory_info().rss for p in processes) / 1024 / 1024
+    except (psutil.Error, AttributeError):
+        return None
+
+
+class DriverPool:
+    """
+    Pool of headless Chrome sessions reused across pages.
+
+    `acquire` hands out an idle session after a health check, or starts a new one (configured by
+    `on_start`) while fewer than `size` exist, otherwise it waits up to `acquire_timeout` seconds for a
+    release and raises TimeoutError, so a session that is never released fails loudly. `release` clears
+    cookies, storage and extra windows so the next page starts clean, and quits the browser
+    instead once it has served `max_uses` pages or grown past `max_memory_mb` (checked only
+    when psutil is installed).
+    """
+
+    def __init__(self, make_options: Callable[[], Options], size: int = 1, max_uses: int = DRIVER_MAX_USES,
+                 max_memory_mb: float = DRIVER_MAX_MEMORY_MB,
+                 on_start: Optional[Callable[[webdriver.Chrome], None]] = None,
+                 acquire_timeout: float = DRIVER_ACQUIRE_TIMEOUT):
+        self.make_options = make_options
+        self.on_start = on_start
+        self.size = size
+        self.acquire_timeout = acquire_timeout
+        self.max_uses = max_uses
+        self.max_memory_mb = max_memory_mb
+        self.stats = {'started': 0, 'reused': 0, 'recycled': 0, 'unhealthy': 0}
+
+        self._idle = queue.LifoQueue()
+        self._uses: Dict[int, int] = {}
+        self._live = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _start(self) -> webdriver.Chrome:
+        try:
+            driver = webdriver.Chrome(options=self.make_options())
+        except BaseException:
+            with self._lock:
+                self._live -= 1
+            raise
+        if self.on_start:
+            try:
+                self.on_start(driver)
+            except BaseException:
+                self._discard(driver)
+                raise
+        with self._lock:
+            self._uses[id(driver)] = 0
+            self.stats['started'] += 1
+        return driver
+
+    def _discard(self, driver: webdriver.Chrome) -> None:
+        with self._lock:
+            self._uses.pop(id(driver), None)
+            self._live -= 1
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error quitting browser: {str(e)}")
+
+    @staticmethod
+    def is_healthy(driver: webdriver.Chrome) -> bool:
+        try:
+            return driver.execute_script('return 1') == 1
+        except Exception:
+            return False
+
+    def acquire(self, timeout: Optional[float] = None) -> webdriver.Chrome:
+        timeout = self.acquire_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    if self._closed:
+                        raise RuntimeError("Driver pool is closed")
+                    can_start = self._live < self.size
+                    if can_start:
+                        self._live += 1
+                if can_start:
+                    return self._start()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"No browser released within {timeout:.0f}s, all {self.size} in use "
+                                       f"(a session that is never released?)")
+                try:
+                    # Time out now and then: a discarded session frees a slot without a release
+                    driver = self._idle.get(timeout=min(1.0, remaining))
+                except queue.Empty:
+                    continue
+
+            if self.is_healthy(driver):
+                with self._lock:
+                    self.stats['reused'] += 1
+                return driver
+            logger.warning("Discarding unresponsive browser session")
+            with self._lock:
+                self.stats['unhealthy'] += 1
+            self._discard(driver)
+
+    def _clear_state(self, driver: webdriver.Chrome) -> None:
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        driver.get('about:blank')
+        driver.delete_all_cookies()
+        driver.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': '*', 'storageTypes': CLEARED_STORAGE_TYPES})
+
+    def release(self, driver: webdriver.Chrome) -> None:
+        with self._lock:
+            uses = self._uses.get(id(driver), 0) + 1
+            self._uses[id(driver)] = uses
+            closed = self._closed
+
+        memory_mb = driver_memory_mb(driver)
+        if closed or uses >= self.max_uses or (memory_mb is not None and memory_mb >= self.max_memory_mb):
+            if not closed:
+                logger.info(f"Recycling browser after {uses} pages"
+                            + (f" ({memory_mb:.0f} MiB)" if memory_mb is not None else ""))
+                with self._lock:
+                    self.stats['recycled'] += 1
+            self._discard(driver)
+            return
+
+        try:
+            self._clear_state(driver)
+        except Exception as e:
+            logger.warning(f"Discarding browser that failed to reset: {str(e)}")
+            with self._lock:
+                self.stats['unhealthy'] += 1
+            self._discard(driver)
+            return
+        self._idle.put(driver)
+
+    @contextmanager
+    def driver(self):
+        driver = self.acquire()
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self) -> None:
+        """Quit every idle browser; sessions still in use are quit when released."""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+    def log_stats(self) -> None:
+        stats = self.stats
+        logger.info(f"Driver pool: {stats['started']} browsers started, {stats['reused']} reuses, "
+                    f"{stats['recycled']} recycled, {stats['unhealthy']} unhealthy")
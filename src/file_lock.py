@@ -0,0 +1,27 @@
+import os
+from contextlib import contextmanager
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+    import fcntl
+
+
+@contextmanager
+def file_lock(lock_file_path: str):
+    """Hold an exclusive inter-process lock on `lock_file_path` (msvcrt on Windows, fcntl elsewhere)."""
+    os.makedirs(os.path.dirname(os.path.abspath(lock_file_path)), exist_ok=True)
+    with open(lock_file_path, 'w') as lock_file:
+        if msvcrt:
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            # Release the lock
+            if msvcrt:
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,164 @@
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple, Union
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+logger = logging.getLogger(__name__)
+
+# Seconds a file must go unmodified before it counts as fully written
+WATCH_DEBOUNCE = 2.0
+
+# Seconds between folder scans when watchdog is not installed
+WATCH_POLL_INTERVAL = 5.0
+
+
+class _EventHandler(FileSystemEventHandler):
+    def __init__(self, watcher: 'FolderWatcher'):
+        super().__init__()
+        self.watcher = watcher
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self.watcher.touched(event.src_path)
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self.watcher.touched(event.src_path)
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self.watcher.touched(event.dest_path)
+
+
+class FolderWatcher:
+    """
+    Reports the files with a given suffix (or one of several) that appear in (or change in) a folder.
+
+    File system events come from watchdog (inotify on Linux) when it is installed; otherwise the
+    folder is scanned every `poll_interval` seconds and compared with the previous scan. Either
+    way a file is only handed out by `wait_ready` once it has gone `debounce` seconds without
+    changing size or modification time, so half-written files are not picked up. Temporary files
+    of atomic writes (`*.tmp.<ext>`) are ignored.
+    """
+
+    def __init__(self, folder: str, suffix: Union[str, Tuple[str, ...]] = '.xlsx', debounce: float = WATCH_DEBOUNCE,
+                 poll_interval: float = WATCH_POLL_INTERVAL, use_events: bool = True):
+        self.folder = folder
+        self.suffixes = (suffix,) if isinstance(suffix, str) else tuple(suffix)
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.use_events = use_events and Observer is not None
+
+        self._pending: Dict[str, Optional[Tuple[int, float]]] = {}  # name -> last seen (size, mtime)
+        self._snapshot: Dict[str, Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+        self._changed = threading.Event()
+        self._observer = None
+
+    def __enter__(self) -> 'FolderWatcher':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        self._snapshot = self._scan()
+        if self.use_events:
+            self._observer = Observer()
+            self._observer.schedule(_EventHandler(self), self.folder, recursive=False)
+            self._observer.start()
+            logger.info(f"Watching {self.folder} for file system events")
+        else:
+            logger.info(f"watchdog is not installed, scanning {self.folder} every {self.poll_interval:.0f}s")
+
+    def stop(self) -> None:
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+    def _watched(self, name: str) -> bool:
+        return (name.endswith(self.suffixes)
+                and not name.endswith(tuple('.tmp' + suffix for suffix in self.suffixes)))
+
+    def _scan(self) -> Dict[str, Tuple[int, float]]:
+        snapshot = {}
+        with os.scandir(self.folder) as entries:
+            for entry in entries:
+                if self._watched(entry.name) and entry.is_file():
+                    stat = entry.stat()
+                    snapshot[entry.name] = (stat.st_size, stat.st_mtime)
+        return snapshot
+
+    def touched(self, path: str) -> None:
+        """Note that `path` was created or modified (called from the watchdog thread)."""
+        name = os.path.basename(path)
+        if self._watched(name):
+            with self._lock:
+                self._pending[name] = None
+            self._changed.set()
+
+    def _poll(self) -> None:
+        snapshot = self._scan()
+        with self._lock:
+            for name, signature in snapshot.items():
+                if self._snapshot.get(name) != signature:
+                    self._pending.setdefault(name, None)
+        self._snapshot = snapshot
+
+    def _settled(self) -> List[str]:
+        """Pending files that stopped changing, removed from the pending set."""
+        ready = []
+        now = time.time()
+        with self._lock:
+            for name, last_seen in list(self._pending.items()):
+                try:
+                    stat = os.stat(os.path.join(self.folder, name))
+                except FileNotFoundError:
+                    del self._pending[name]
+                    continue
+                signature = (stat.st_size, stat.st_mtime)
+                if signature == last_seen and now - stat.st_mtime >= self.debounce:
+                    del self._pending[name]
+                    ready.append(name)
+                else:
+                    self._pending[name] = signature
+        return sorted(ready)
+
+    def wait_ready(self, timeout: Optional[float] = None) -> List[str]:
+        """
+        Block until some changed files have settled and return their names.
+
+        Returns an empty list once `timeout` seconds pass without any.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if not self.use_events:
+                self._poll()
+            ready = self._settled()
+            if ready:
+                return ready
+
+            with self._lock:
+                pending = bool(self._pending)
+            # Re-check pending files at the debounce pace, otherwise sleep until the next event or scan
+            wait = min(self.debounce / 2, self.poll_interval) if pending else self.poll_interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return []
+                wait = min(wait, remaining)
+            if self.use_events:
+                self._changed.wait(wait)
+                self._changed.clear()
+            else:
+                time.sleep(wait)
@@ -0,0 +1,246 @@
+import argparse
+import json
+import logging
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Union
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Folder holding the review scraper outputs
+GAMES_REVIEWS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "Games Reviews"))
+
+# Default location of the game details store
+GAME_STORE_PATH = os.path.join(GAMES_REVIEWS_DIR, 'games.db')
+
+# Rows committed per transaction, and the longest a submitted row waits for its commit (seconds)
+STORE_BATCH_SIZE = 20
+STORE_FLUSH_INTERVAL = 5.0
+
+# Columns left out of the Excel export, as the per-game Excel writes always did
+EXCEL_DROPPED_COLUMNS = ['genres', 'developer', 'publisher']
+
+
+def connect_sqlite(db_path: str) -> sqlite3.Connection:
+    """Open a SQLite database in WAL mode, shared safely by several processes."""
+    os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+    connection = sqlite3.connect(db_path, timeout=60, check_same_thread=False)
+    connection.execute('PRAGMA journal_mode=WAL')
+    connection.execute('PRAGMA synchronous=NORMAL')
+    connection.execute('PRAGMA busy_timeout=60000')
+    return connection
+
+
+def to_camel_case(s: str) -> str:
+    """Convert string to camelCase"""
+    parts = re.split(r'[_\s]+', s)
+    return parts[0].lower() + ''.join(word.capitalize() for word in parts[1:])
+
+
+# Upsert of one game details row: a game keeps one row (and its position), rewritten only when its data changed
+_UPSERT_SQL = (
+    'INSERT INTO game_details (store_link, data, saved_at) VALUES (?, ?, ?) '
+    'ON CONFLICT (store_link) DO UPDATE SET data = excluded.data, saved_at = excluded.saved_at '
+    'WHERE data != excluded.data'
+)
+
+
+class GameDetailsStore:
+    """
+    Store of scraped game details backed by SQLite in WAL mode, one row per store link.
+
+    `submit` only enqueues the rows; one writer thread per process commits them in batches,
+    so scraping never waits on shared files. Every process may open the same database, as
+    SQLite serializes their commits. A game submitted again replaces its row. Excel and JSON
+    views are produced on demand by `export`; the ones an earlier run exported (`games.json`,
+    else `games.xlsx`, next to the database) are imported when a new database is first opened,
+    so exporting never drops the details of earlier runs.
+    """
+
+    def __init__(self, db_path: str = GAME_STORE_PATH, batch_size: int = STORE_BATCH_SIZE,
+                 flush_interval: float = STORE_FLUSH_INTERVAL, json_path: str = None, excel_path: str = None):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        folder = os.path.dirname(os.path.abspath(db_path))
+        self.json_path = json_path or os.path.join(folder, 'games.json')
+        self.excel_path = excel_path or os.path.join(folder, 'games.xlsx')
+
+        self._connection = connect_sqlite(db_path)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS game_details ('
+            'seq INTEGER PRIMARY KEY AUTOINCREMENT, store_link TEXT UNIQUE, data TEXT NOT NULL, '
+            'saved_at REAL NOT NULL)'
+        )
+        self._connection.execute('CREATE TABLE IF NOT EXISTS store_meta (key TEXT PRIMARY KEY, value TEXT)')
+        self._connection.commit()
+        self._import_existing_exports()
+
+        self._queue = queue.Queue()
+        self._writer = None
+        self._closed = False
+        self._lock = threading.Lock()
+        # The connection is shared by the writer thread and readers in the submitting thread
+        self._db_lock = threading.Lock()
+
+    def _read_exports(self) -> List[Dict[str, Any]]:
+        """Rows of the JSON view an earlier run exported, else of its Excel view (camelCase headers)."""
+        if os.path.exists(self.json_path):
+            with open(self.json_path, 'r') as f:
+                return json.load(f)
+        if os.path.exists(self.excel_path):
+            df = pd.read_excel(self.excel_path).rename(columns={'storeLink': 'store_link'})
+            return json.loads(df.to_json(orient='records', double_precision=15))
+        return []
+
+    def _import_existing_exports(self) -> None:
+        self._connection.execute('BEGIN IMMEDIATE')
+        try:
+            imported = self._connection.execute("SELECT value FROM store_meta WHERE key = 'imported'").fetchone()
+            if imported is None:
+                records = self._read_exports()
+                self._connection.executemany(_UPSERT_SQL, self._rows(records))
+                self._connection.execute("INSERT INTO store_meta (key, value) VALUES ('imported', ?)",
+                                         (str(time.time()),))
+                if records:
+                    logger.info(f"Imported {len(records)} game detail rows exported by earlier runs")
+            self._connection.commit()
+        except BaseException:
+            self._connection.rollback()
+            raise
+
+    @staticmethod
+    def _rows(records: List[Dict[str, Any]]) -> List[tuple]:
+        return [(record.get('store_link'), json.dumps(record), time.time()) for record in records]
+
+    @staticmethod
+    def to_records(data: Union[pd.DataFrame, Dict[str, Any], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Game detail rows as the store saves (and `get` returns) them."""
+        if isinstance(data, pd.DataFrame):
+            return json.loads(data.to_json(orient='records', double_precision=15))
+        if isinstance(data, dict):
+            return [data]
+        return list(data)
+
+    def submit(self, data: Union[pd.DataFrame, Dict[str, Any], List[Dict[str, Any]]]) -> None:
+        """Queue game detail rows for the writer thread."""
+        records = self.to_records(data)
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"Game details store {self.db_path} is closed")
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name='game-store-writer', daemon=True)
+                self._writer.start()
+        for record in records:
+            self._queue.put(record)
+
+    def _write_loop(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while batch[-1] is not None and len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+
+            stop = batch[-1] is None
+            rows = self._rows([record for record in batch if record is not None])
+            if rows:
+                try:
+                    with self._db_lock, self._connection:
+                        self._connection.executemany(_UPSERT_SQL, rows)
+                except sqlite3.Error as e:
+                    logger.error(f"Error committing {len(rows)} game detail rows: {str(e)}")
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                return
+
+    def flush(self) -> None:
+        """Block until every submitted row is committed."""
+        self._queue.join()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            writer = self._writer
+        if writer is not None:
+            self._queue.put(None)
+            writer.join()
+        with self._db_lock:
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Every stored row, in submission order."""
+        with self._db_lock:
+            rows = self._connection.execute('SELECT data FROM game_details ORDER BY seq').fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def get(self, store_link: str) -> Optional[Dict[str, Any]]:
+        """The stored details row of a game, or None."""
+        with self._db_lock:
+            row = self._connection.execute('SELECT data FROM game_details WHERE store_link = ?',
+                                           (store_link,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def import_json(self, json_path: str) -> int:
+        """Load rows from a games.json written by the old read-modify-write path, replacing stored games."""
+        with open(json_path, 'r') as f:
+            records = json.load(f)
+        with self._db_lock, self._connection:
+            self._connection.executemany(_UPSERT_SQL, self._rows(records))
+        return len(records)
+
+    def export(self, excel_path: str = None, json_path: str = None) -> pd.DataFrame:
+        """
+        Write the Excel and/or JSON views of the store.
+
+        JSON holds the rows as submitted; Excel drops EXCEL_DROPPED_COLUMNS and camelCases the
+        headers, matching the files the scraper used to rewrite after every game.
+        """
+        records = self.records()
+        if json_path:
+            tmp_path = json_path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(records, f, indent=2)
+            os.replace(tmp_path, json_path)
+
+        df = pd.DataFrame(records)
+        df = df.drop(columns=[col for col in EXCEL_DROPPED_COLUMNS if col in df.columns])
+        df.columns = [to_camel_case(col) for col in df.columns]
+        if excel_path:
+            with pd.ExcelWriter(excel_path, mode='w', engine='openpyxl') as writer:
+                df.to_excel(writer, index=False, header=True, sheet_name='Data')
+        return df
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Manage the scraped game details store.")
+    parser.add_argument('command', choices=['export', 'import'])
+    parser.add_argument('--db', default=GAME_STORE_PATH)
+    parser.add_argument('--excel', default=os.path.join(GAMES_REVIEWS_DIR, 'games.xlsx'))
+    parser.add_argument('--json', default=os.path.join(GAMES_REVIEWS_DIR, 'games.json'))
+    args = parser.parse_args()
+
+    with GameDetailsStore(args.db) as store:
+        if args.command == 'import':
+            print(f"Imported {store.import_json(args.json)} rows from {args.json}")
+        else:
+            exported = store.export(args.excel, args.json)
+            print(f"Exported {len(exported)} rows to {args.excel} and {args.json}")
@@ -1,32 +1,122 @@
 import json
-from typing import Dict, Any, List
+import os
+from typing import Dict, Any, List, Optional, Tuple, Union
 
 import requests
 import pandas as pd
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 import re
 import logging
 
+from src.catalog_sink import CatalogSink
+from src.crawl_pipeline import CrawlPipeline, NUM_FETCHERS, NUM_PARSERS, PIPELINE_QUEUE_SIZE, UNCHANGED_PAGE
+from src.crawl_state import CrawlState, content_hash
+from src.http_cache import CacheMissError, ResponseCache
+from src.metrics import metrics
+from src.output_formats import DEFAULT_CATALOG_FORMATS, EXCEL, JSON, catalog_paths, write_catalog
+from src.vrdb_tokenizer import FLAT_ARRAY_PATTERN, MANDATORY_FIELDS, scan_games, string_value
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Marker of the SvelteKit script that carries the games payload
+SCRIPT_MARKER = 'resolve({id:1'
+
 
 class VRDBExtractor:
-    def __init__(self):
-        self.base_url = "https://vrdb.app/games"
+    def __init__(self, base_url: str = "https://vrdb.app/games", pool_size: int = NUM_FETCHERS,
+                 cache: Optional[ResponseCache] = None, output_formats: Tuple[str, ...] = DEFAULT_CATALOG_FORMATS):
+        self.base_url = base_url
+        self.cache = cache
+        self.output_formats = output_formats
+
+        # One keep-alive session shared by every fetcher
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Set by incremental runs to send conditional requests and skip unchanged pages
+        self.crawl_state: Optional[CrawlState] = None
+
+    @metrics.timer('vrdb_stage_seconds', stage='fetch')
+    def fetch_data(self, page: int) -> Optional[str]:
+        """
+        Fetch data from a specific page of the VRDB website.
+
+        Fresh responses come from the response cache when one is configured. During incremental
+        runs the request is conditional, and None is returned when the server answers
+        304 Not Modified for a page that is already in the spool.
+        """
+        url = f"{self.base_url}?page={page}"
+        cached = self.cache.get(url) if self.cache else None
+        if cached and (cached.fresh or self.cache.offline):
+            metrics.inc('vrdb_cache_hits_total')
+            return cached.body
+        if self.cache and self.cache.offline:
+            raise CacheMissError(f"Page {page} is not in the response cache ({url})")
 
-    def fetch_data(self, page: int) -> str:
-        """Fetch data from a specific page of the VRDB website."""
+        headers = self.crawl_state.conditional_headers(page) if self.crawl_state else {}
+        revalidating = not headers and cached is not None
+        if revalidating:
+            headers = cached.validators()
         try:
-            response = requests.get(f"{self.base_url}?page={page}", timeout=30)
+            response = self.session.get(url, headers=headers, timeout=30)
+            if response.status_code == 304:
+                if self.cache and cached:
+                    self.cache.touch(url)
+                return cached.body if revalidating else None
             response.raise_for_status()
+            etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+            if self.crawl_state:
+                self.crawl_state.stage(page, etag=etag, last_modified=last_modified)
+            if self.cache:
+                self.cache.put(url, response.text, etag, last_modified)
             return response.text
         except requests.RequestException as e:
             logger.error(f"Error fetching data from VRDB on page {page}: {str(e)}")
             raise
 
-    def extract_script_content(self, html_content: str) -> str:
-        """Extract the relevant script content from HTML"""
+    def extract_script_content(self, html_content: Union[str, bytes]) -> str:
+        """Extract the relevant script content from HTML, scanning the raw text before falling back to a DOM."""
+        script_content = self.scan_script_content(html_content)
+        if script_content is not None:
+            return script_content
+        return self.extract_script_content_soup(html_content)
+
+    def scan_script_content(self, html_content: Union[str, bytes]) -> Optional[str]:
+        """
+        Find the script holding SCRIPT_MARKER by scanning the raw HTML (str or UTF-8 bytes).
+
+        Returns None when the page does not have the expected `<script ...>...</script>` shape
+        around the marker, so the caller can fall back to BeautifulSoup.
+        """
+        if isinstance(html_content, bytes):
+            marker, open_tag, close_tag, tag_end = SCRIPT_MARKER.encode(), b'<script', b'</script', b'>'
+        else:
+            marker, open_tag, close_tag, tag_end = SCRIPT_MARKER, '<script', '</script', '>'
+
+        marker_at = html_content.find(marker)
+        if marker_at == -1:
+            return None
+
+        # The marker must sit inside a script element that is still open
+        script_start = html_content.rfind(open_tag, 0, marker_at)
+        if script_start == -1 or html_content.find(close_tag, script_start, marker_at) != -1:
+            return None
+        body_start = html_content.find(tag_end, script_start, marker_at)
+        body_end = html_content.find(close_tag, marker_at)
+        if body_start == -1 or body_end == -1:
+            return None
+
+        script_content = html_content[body_start + 1:body_end]
+        if isinstance(script_content, bytes):
+            return script_content.decode('utf-8', errors='replace')
+        return script_content
+
+    def extract_script_content_soup(self, html_content: Union[str, bytes]) -> str:
+        """Extract the relevant script content from HTML by building a BeautifulSoup tree"""
         try:
             soup = BeautifulSoup(html_content, 'html.parser')
             scripts = soup.find_all('script')
@@ -44,31 +134,46 @@ class VRDBExtractor:
         """
         Parse game data text into a pandas DataFrame with mandatory and optional fields.
         """
-        # Mandatory fields pattern
-        mandatory_pattern = re.compile(
-            r'{\s*'
-            r'id:\s*"(?P<id>\d+)".*?'
-            r'name:\s*"(?P<name>[^"]+)".*?'
-            r'genres:\s*(?P<genres>\[.*?\])'
-            r'.*?store_link:\s*"(?P<store_link>[^"]*)"'
-            r'.*?}',
-            re.DOTALL
-        )
+        return self._games_to_df(scan_games(text))
+
+    def parse_game_data_regex(self, text: str) -> pd.DataFrame:
+        """
+        Regex-cascade version of `parse_game_data`, kept as the reference for cross-checking the scanner.
+
+        Every flat object literal is matched, then each field is looked up in it on its own, so the
+        keys may come in any order; string values are unescaped like the scanner does. Unlike the
+        scanner, it does not see games holding a nested object.
+        """
+        # Object literals holding no nested objects, string literals skipped whole
+        object_pattern = re.compile(r'\{(?:[^{}"]++|"(?:[^"\\]|\\.)*+")*+\}')
+        string_literal = r'"(?:[^"\\]|\\.)*"'
+
+        def field_pattern(field: str, value: str) -> re.Pattern:
+            # The key, bare or quoted, starts the object or follows a comma
+            return re.compile(r'[{,]\s*(["\'`]?)' + field + r'\1:\s*(?P<' + field + '>' + value + ')')
+
+        # Mandatory fields patterns
+        mandatory_patterns = {
+            'id': field_pattern('id', r'"\d+"'),
+            'name': field_pattern('name', r'"(?:[^"\\]|\\.)+"'),
+            'genres': field_pattern('genres', FLAT_ARRAY_PATTERN),
+            'store_link': field_pattern('store_link', string_literal),
+        }
 
         # Optional fields patterns
         optional_patterns = {
-            'developer': r'developer:\s*"(?P<developer>[^"]*)"',
-            'publisher': r'publisher:\s*"(?P<publisher>[^"]*)"',
-            'platforms': r'platforms:\s*(?P<platforms>\[.*?\])',
-            'release_date': r'release_date:\s*"(?P<release_date>[^"]*)"',
-            'rating_score': r'rating_score:\s*(?P<rating_score>\d+(?:\.\d+)?)',
-            'rating_count': r'rating_count:\s*(?P<rating_count>\d+)',
-            'game_mode': r'game_mode:\s*"(?P<game_mode>[^"]*)"',
-            'languages': r'languages:\s*(?P<languages>\[.*?\])',
-            'age_rating': r'age_rating:\s*"(?P<age_rating>[^"]*)"',
-            'space_required': r'space_required:\s*"(?P<space_required>[^"]*)"',
-            'price_USD_amount': r'price_USD_amount:\s*(?P<price_USD_amount>\d+)',
-            'price_USD_formatted': r'price_USD_formatted:\s*"(?P<price_USD_formatted>[^"]*)"'
+            'developer': field_pattern('developer', string_literal),
+            'publisher': field_pattern('publisher', string_literal),
+            'platforms': field_pattern('platforms', FLAT_ARRAY_PATTERN),
+            'release_date': field_pattern('release_date', string_literal),
+            'rating_score': field_pattern('rating_score', r'\d+(?:\.\d+)?'),
+            'rating_count': field_pattern('rating_count', r'\d+'),
+            'game_mode': field_pattern('game_mode', string_literal),
+            'languages': field_pattern('languages', FLAT_ARRAY_PATTERN),
+            'age_rating': field_pattern('age_rating', string_literal),
+            'space_required': field_pattern('space_required', string_literal),
+            'price_USD_amount': field_pattern('price_USD_amount', r'\d+'),
+            'price_USD_formatted': field_pattern('price_USD_formatted', string_literal),
         }
 
         def parse_array_field(field_value: str) -> List[str]:
@@ -83,7 +188,7 @@ class VRDBExtractor:
             optional_fields = {}
 
             for field, pattern in optional_patterns.items():
-                match = re.search(pattern, game_text)
+                match = pattern.search(game_text)
                 if match:
                     value = match.group(field)
                     # Handle array fields
@@ -96,71 +201,162 @@ class VRDBExtractor:
                         except ValueError:
                             continue
                     else:
-                        optional_fields[field] = value
+                        optional_fields[field] = string_value(value)
 
             return optional_fields
 
         games = []
-        for match in mandatory_pattern.finditer(text):
-            try:
-                game_data = {
-                    "id": match.group("id"),
-                    "name": match.group("name"),
-                    "genres": parse_array_field(match.group("genres")),
-                    "store_link": match.group("store_link")
-                }
-
-                game_text = match.group(0)
-                optional_fields = extract_optional_fields(game_text)
-
-                game_data.update(optional_fields)
-
-                games.append(game_data)
-
-            except (AttributeError, json.JSONDecodeError) as e:
-                print(f"Error parsing game data: {e}")
+        for match in object_pattern.finditer(text, max(text.find('resolve('), 0)):
+            game_text = match.group(0)
+            fields = {field: pattern.search(game_text) for field, pattern in mandatory_patterns.items()}
+            if not all(fields.values()):
                 continue
+            game_data = {
+                "id": fields['id'].group('id')[1:-1],
+                "name": string_value(fields['name'].group('name')),
+                "genres": parse_array_field(fields['genres'].group('genres')),
+                "store_link": string_value(fields['store_link'].group('store_link')),
+            }
+            game_data.update(extract_optional_fields(game_text))
+            games.append(game_data)
+        return self._games_to_df(games)
+
+    def _games_to_df(self, games: List[Dict[str, Any]]) -> pd.DataFrame:
+        """Build the page DataFrame, checking that the mandatory columns are present."""
         df = pd.DataFrame(games)
 
-        mandatory_fields = {'id', 'name', 'genres', 'store_link'}
-        missing_fields = mandatory_fields - set(df.columns)
+        missing_fields = set(MANDATORY_FIELDS) - set(df.columns)
         if missing_fields:
             raise ValueError(f"Missing mandatory fields: {missing_fields}")
 
         return df
 
-    def save_to_files(self, df: pd.DataFrame, excel_output: str, json_output: str) -> None:
-        """Save DataFrame to Excel and JSON files."""
-        try:
-            with pd.ExcelWriter(excel_output, mode='w', engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, header=True, sheet_name='VR_Games')
+    def parse_page(self, html_content: str) -> pd.DataFrame:
+        """Extract and parse the games listed on one fetched page."""
+        script_content = self.extract_script_content(html_content)
+        return self.parse_game_data(script_content)
+
+    @metrics.timer('vrdb_stage_seconds', stage='parse')
+    def process_page(self, page: int, html_content: Optional[str]) -> Any:
+        """Parse a fetched page, or return UNCHANGED_PAGE when it is the same as in the last crawl."""
+        if html_content is None:
+            return UNCHANGED_PAGE
+        if self.crawl_state:
+            page_hash = content_hash(html_content)
+            if self.crawl_state.is_unchanged(page, page_hash):
+                return UNCHANGED_PAGE
+            self.crawl_state.stage(page, hash=page_hash)
+        return self.parse_page(html_content)
 
-            df.to_json(json_output, orient='records', indent=2)
+    def output_paths(self, excel_output: str, json_output: str) -> List[str]:
+        """Files `save_to_files` writes, one per format of `output_formats`."""
+        paths = dict(catalog_paths(excel_output), **{EXCEL: excel_output, JSON: json_output})
+        return [paths[output_format] for output_format in self.output_formats]
 
+    @metrics.timer('vrdb_stage_seconds', stage='save')
+    def save_to_files(self, df: pd.DataFrame, excel_output: str, json_output: str) -> List[str]:
+        """
+        Save DataFrame in each of `output_formats`, returning the paths written.
+
+        Parquet keeps `genres`, `platforms` and `languages` as list columns and is written next to
+        `excel_output`; Excel is only written when asked for.
+        """
+        paths = dict(catalog_paths(excel_output), **{EXCEL: excel_output, JSON: json_output})
+        try:
+            write_catalog(df, paths, self.output_formats)
         except Exception as e:
-            logger.error(f"Error saving data to Excel and JSON: {str(e)}")
+            logger.error(f"Error saving data to {', '.join(self.output_formats)}: {str(e)}")
             raise
+        return self.output_paths(excel_output, json_output)
+
+    def spool_path(self, output_file: str) -> str:
+        """Path of the NDJSON page spool kept next to `output_file`."""
+        return os.path.splitext(output_file)[0] + '.ndjson'
+
+    def state_path(self, output_file: str) -> str:
+        """Path of the persistent crawl state kept next to `output_file`."""
+        return os.path.splitext(output_file)[0] + '.state.json'
+
+    def export(self, output_file: str = "VR_Games_Data.xlsx",
+               output_file_json: str = "VR_Games_Data.json") -> List[str]:
+        """Build the catalog outputs from the page spool in one bulk pass, returning the paths written."""
+        sink = CatalogSink(self.spool_path(output_file))
+        return self.save_to_files(sink.to_dataframe(), output_file, output_file_json)
+
+    def _start_crawl(self, output_file: str, incremental: bool) -> Tuple[CatalogSink, int]:
+        """Prepare the spool and crawl state, returning the sink and the first page to fetch."""
+        sink = CatalogSink(self.spool_path(output_file))
+        self.crawl_state = None
+        if not incremental:
+            # A later incremental run must not resume from, or trust validators of, the old spool
+            sink.reset()
+            CrawlState(self.state_path(output_file)).reset()
+            return sink, 1
+
+        state = CrawlState(self.state_path(output_file)).load()
+        if not os.path.exists(sink.path):
+            # The state only describes pages that are in the spool
+            sink.reset()
+            state.reset()
+        start_page = state.resume_page()
+        if start_page > 1:
+            logger.info(f"Resuming interrupted crawl from page {start_page}")
+        state.start()
+        self.crawl_state = state
+        return sink, start_page
 
-    def run(self) -> str:
-        """Main method to run the entire extraction process with pagination and Excel file handling."""
-        page = 1
-        original_df = pd.DataFrame()
-        output_file = "VR_Games_Data.xlsx"
-        output_file_json = "VR_Games_Data.json"
-        first_write = True
+    @metrics.timer('vrdb_stage_seconds', stage='write')
+    def _write_page(self, sink: CatalogSink, page: int, games_df: Any) -> None:
+        """Writer stage: spool changed pages and commit the page to the crawl state."""
+        if games_df is UNCHANGED_PAGE:
+            metrics.inc('vrdb_pages_total', result='unchanged')
+        else:
+            sink.write_page(page, games_df)
+            metrics.inc('vrdb_pages_total', result='changed')
+            metrics.inc('vrdb_games_total', len(games_df))
+        if self.crawl_state:
+            self.crawl_state.commit(page)
+
+    def _interrupt_crawl(self) -> None:
+        """Save the pages committed since the last save of the crawl state, so the next run resumes after them."""
+        if self.crawl_state:
+            self.crawl_state.save()
+            self.crawl_state = None
+
+    def _finish_crawl(self, sink: CatalogSink, stop_page: int, output_file: str,
+                      output_file_json: str) -> List[str]:
+        if self.cache:
+            self.cache.log_stats()
+        if self.crawl_state:
+            sink.compact(stop_page)
+            self.crawl_state.finish(stop_page)
+            self.crawl_state = None
+        return self.export(output_file, output_file_json)
+
+    def run(self, output_file: str = "VR_Games_Data.xlsx", output_file_json: str = "VR_Games_Data.json",
+            incremental: bool = False) -> List[str]:
+        """
+        Main method to run the entire extraction process with pagination; returns the catalog files written.
+
+        With `incremental`, pages are fetched with conditional requests against the last crawl's
+        state, unchanged pages are not re-parsed and an interrupted crawl resumes where it stopped.
+        """
+        sink, page = self._start_crawl(output_file, incremental)
         while True:
             try:
-
-                logger.info(f"Page : {page} Data {'written' if first_write else 'appended'} to {output_file} ")
                 html_content = self.fetch_data(page)
-                script_content = self.extract_script_content(html_content)
-                games_df = self.parse_game_data(script_content)
+                games_df = self.process_page(page, html_content)
+                if games_df is UNCHANGED_PAGE:
+                    logger.info(f"Page : {page} unchanged since the last crawl")
+                    self._write_page(sink, page, games_df)
+                    page += 1
+                    continue
                 logger.info(f"Page : {page} Number of data extracted - {len(games_df)}")
                 if games_df.empty:
                     logger.info(f"No more data found on page {page}. Ending extraction.")
                     break
-                original_df = pd.concat([original_df, games_df], ignore_index=True)
-                first_write = False
+                self._write_page(sink, page, games_df)
+                logger.info(f"Page : {page} Data written to {sink.path}")
                 page += 1
             except ValueError:
                 # Stop if there are no more relevant pages
@@ -168,7 +364,26 @@ class VRDBExtractor:
                 break
             except Exception as e:
                 logger.error(f"Error in extraction process on page {page}: {str(e)}")
+                self._interrupt_crawl()
                 raise
+            except BaseException:
+                self._interrupt_crawl()
+                raise
+
+        return self._finish_crawl(sink, page, output_file, output_file_json)
+
+    def run_pipelined(self, output_file: str = "VR_Games_Data.xlsx", output_file_json: str = "VR_Games_Data.json",
+                      num_fetchers: int = NUM_FETCHERS, num_parsers: int = NUM_PARSERS,
+                      queue_size: int = PIPELINE_QUEUE_SIZE, incremental: bool = False) -> List[str]:
+        """Run the extraction with concurrent fetchers, parallel parsing and an in-order writer stage."""
+        sink, start_page = self._start_crawl(output_file, incremental)
+
+        pipeline = CrawlPipeline(self.fetch_data, self.process_page, num_fetchers=num_fetchers,
+                                 num_parsers=num_parsers, queue_size=queue_size, start_page=start_page)
+        try:
+            pages_written = pipeline.run(lambda page, games_df: self._write_page(sink, page, games_df))
+        except BaseException:
+            self._interrupt_crawl()
+            raise
 
-        self.save_to_files(original_df, output_file, output_file_json)
-        return output_file
+        return self._finish_crawl(sink, start_page + pages_written, output_file, output_file_json)
@@ -0,0 +1,156 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Default time-to-live of cached responses (seconds)
+CACHE_TTL = 6 * 60 * 60
+
+# Default size cap of the cache directory (bytes)
+CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+
+class CacheMissError(LookupError):
+    """Raised in cache-only mode when a URL has never been cached."""
+
+
+class CachedResponse:
+    def __init__(self, body: str, etag: Optional[str], last_modified: Optional[str], fetched_at: float, fresh: bool):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = fetched_at
+        self.fresh = fresh
+
+    def validators(self) -> Dict[str, str]:
+        """Headers that revalidate this response with the server."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    On-disk cache of HTTP response bodies keyed by URL.
+
+    Each entry is a gzip-compressed body next to a small JSON metadata file holding the
+    validators and fetch time. Entries older than `ttl` are stale: they are revalidated instead
+    of served, except in `offline` mode where any cached body is served and a miss raises
+    CacheMissError. Once the directory grows past `max_bytes` the least recently used entries
+    are evicted (reads bump the body file's mtime).
+    """
+
+    def __init__(self, cache_dir: str, ttl: float = CACHE_TTL, max_bytes: int = CACHE_MAX_BYTES,
+                 offline: bool = False):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.stats = {'hits': 0, 'stale_hits': 0, 'revalidated': 0, 'misses': 0, 'bytes_read': 0,
+                      'bytes_written': 0, 'evictions': 0}
+        self._lock = threading.Lock()
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self._size = sum(os.path.getsize(os.path.join(cache_dir, name)) for name in os.listdir(cache_dir))
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return base + '.gz', base + '.json'
+
+    def _count(self, stat: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[stat] += amount
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Return the cached response for `url` (fresh or stale), or None."""
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                compressed = f.read()
+            os.utime(body_path)
+        except (OSError, ValueError):
+            self._count('misses')
+            return None
+
+        fresh = time.time() - meta['fetched_at'] < self.ttl
+        self._count('hits' if fresh else 'stale_hits')
+        self._count('bytes_read', len(compressed))
+        return CachedResponse(gzip.decompress(compressed).decode('utf-8'), meta.get('etag'),
+                              meta.get('last_modified'), meta['fetched_at'], fresh)
+
+    def put(self, url: str, body: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        body_path, meta_path = self._paths(url)
+        compressed = gzip.compress(body.encode('utf-8'))
+        meta = json.dumps({'url': url, 'etag': etag, 'last_modified': last_modified, 'fetched_at': time.time()})
+
+        old_size = sum(os.path.getsize(path) for path in (body_path, meta_path) if os.path.exists(path))
+        for path, data in ((body_path, compressed), (meta_path, meta.encode('utf-8'))):
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+        with self._lock:
+            self.stats['bytes_written'] += len(compressed)
+            self._size += len(compressed) + len(meta) - old_size
+            over_cap = self._size > self.max_bytes
+        if over_cap:
+            self._evict()
+
+    def touch(self, url: str) -> None:
+        """Mark a stale entry fresh again after the server confirmed it is unchanged."""
+        _, meta_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            meta['fetched_at'] = time.time()
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+        except (OSError, ValueError):
+            return
+        self._count('revalidated')
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the cache is back under 90% of its cap."""
+        with self._lock:
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                if name.endswith('.gz'):
+                    body_path = os.path.join(self.cache_dir, name)
+                    meta_path = body_path[:-len('.gz')] + '.json'
+                    try:
+                        size = os.path.getsize(body_path) + os.path.getsize(meta_path)
+                        entries.append((os.path.getmtime(body_path), size, body_path, meta_path))
+                    except OSError:
+                        continue
+
+            for _, size, body_path, meta_path in sorted(entries):
+                if self._size <= self.max_bytes * 0.9:
+                    break
+                for path in (body_path, meta_path):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                self._size -= size
+                self.stats['evictions'] += 1
+
+    def log_stats(self) -> None:
+        stats = self.stats
+        lookups = stats['hits'] + stats['stale_hits'] + stats['misses']
+        logger.info(f"Response cache: {stats['hits']} hits, {stats['stale_hits']} stale "
+                    f"({stats['revalidated']} revalidated), {stats['misses']} misses of {lookups} lookups, "
+                    f"{stats['bytes_read'] / 1024:.0f} KiB read, {stats['bytes_written'] / 1024:.0f} KiB written, "
+                    f"{stats['evictions']} evicted, {self._size / 1024 / 1024:.1f} MiB on disk")
@@ -0,0 +1,221 @@
+import bisect
+import contextlib
+import cProfile
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the stage duration histogram buckets
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+# Metrics file formats: Prometheus text exposition, or a JSON snapshot
+METRICS_FORMATS = ['prom', 'json']
+METRICS_FORMAT = 'prom'
+
+# Seconds between two writes of a metrics file by MetricsWriter
+METRICS_WRITE_INTERVAL = 30.0
+
+# Allocation sites listed in a tracemalloc dump
+TRACEMALLOC_TOP = 25
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels: Labels, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+    pairs = labels + extra
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in pairs) + '}'
+
+
+class Metrics:
+    """
+    Counters and histograms of one process, each series identified by a metric name and its labels.
+
+    Labels set with `set_labels` (the worker id, say) are added to every series recorded afterwards.
+    Per-item figures (one game's timings) are kept apart with `record`, as a label per game would make
+    a new series for every game. `write` saves a snapshot as a Prometheus text file (for node_exporter's
+    textfile collector) or, for a `.json` path, as JSON with the records; either way the file is
+    replaced atomically.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.default_labels: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, List[Any]]] = {}  # labels -> [bucket counts, sum, count]
+        self._records: Dict[str, Dict[str, Any]] = {}
+
+    def set_labels(self, **labels) -> None:
+        self.default_labels.update({key: str(value) for key, value in labels.items()})
+
+    def _labels(self, labels: Dict[str, Any]) -> Labels:
+        merged = dict(self.default_labels, **{key: str(value) for key, value in labels.items()})
+        return tuple(sorted(merged.items()))
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        key = self._labels(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        key = self._labels(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = [[0] * len(self.buckets), 0.0, 0]
+            index = bisect.bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                histogram[0][index] += 1
+            histogram[1] += value
+            histogram[2] += 1
+
+    def record(self, key: str, **values) -> None:
+        """Keep `values` under `key` for the JSON snapshot, replacing an earlier record of the same key."""
+        with self._lock:
+            self._records[key] = values
+
+    @contextlib.contextmanager
+    def timer(self, name: str, **labels) -> Iterator[None]:
+        """Observe the seconds the block took into histogram `name`, whether or not it raised."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = [{'name': name, 'labels': dict(labels), 'value': value}
+                        for name, series in sorted(self._counters.items())
+                        for labels, value in sorted(series.items())]
+            histograms = [{'name': name, 'labels': dict(labels), 'buckets': dict(zip(self.buckets, counts)),
+                           'sum': total, 'count': count}
+                          for name, series in sorted(self._histograms.items())
+                          for labels, (counts, total, count) in sorted(series.items())]
+            records = dict(self._records)
+        return {'timestamp': time.time(), 'counters': counters, 'histograms': histograms, 'records': records}
+
+    def prometheus(self) -> str:
+        """The metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                lines.append(f"# TYPE {name} counter")
+                for labels, value in sorted(series.items()):
+                    lines.append(f"{name}{_format_labels(labels)} {value:g}")
+            for name, series in sorted(self._histograms.items()):
+                lines.append(f"# TYPE {name} histogram")
+                for labels, (counts, total, count) in sorted(series.items()):
+                    cumulative = 0
+                    for bound, bucket_count in zip(self.buckets, counts):
+                        cumulative += bucket_count
+                        lines.append(f"{name}_bucket{_format_labels(labels, (('le', f'{bound:g}'),))} {cumulative}")
+                    lines.append(f"{name}_bucket{_format_labels(labels, (('le', '+Inf'),))} {count}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {total:.6f}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {count}")
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path: str) -> None:
+        """Save the metrics to `path`: JSON for a `.json` file, the Prometheus text format otherwise."""
+        content = (json.dumps(self.snapshot(), indent=2) if path.endswith('.json') else self.prometheus())
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self._records.clear()
+
+
+# Metrics of this process
+metrics = Metrics()
+
+
+class MetricsWriter:
+    """
+    Writes `registry` to `path` every `interval` seconds from a background thread, and once more on `close`.
+
+    Each write costs as much as the whole snapshot, so long runs write on a clock rather than after
+    every unit of work.
+    """
+
+    def __init__(self, path: str, interval: float = METRICS_WRITE_INTERVAL, registry: Metrics = metrics):
+        self.path = path
+        self.interval = interval
+        self.registry = registry
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='metrics-writer', daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.write()
+
+    def write(self) -> None:
+        try:
+            self.registry.write(self.path)
+        except OSError as e:
+            logger.warning(f"Could not write metrics to {self.path}: {str(e)}")
+
+    def close(self) -> None:
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        self._thread.join()
+        self.write()
+
+
+@contextlib.contextmanager
+def profiled(profile_dir: Optional[str], name: str) -> Iterator[None]:
+    """
+    Run the block under cProfile and tracemalloc, then dump `<name>.prof` (load it with pstats or
+    snakeviz) and `<name>.tracemalloc.txt` (peak memory and top allocation sites) into `profile_dir`.
+
+    A no-op without `profile_dir`. cProfile only sees the calling thread.
+    """
+    if not profile_dir:
+        yield
+        return
+
+    os.makedirs(profile_dir, exist_ok=True)
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        if started_tracing:
+            tracemalloc.stop()
+
+        path = os.path.join(profile_dir, name)
+        profiler.dump_stats(path + '.prof')
+        with open(path + '.tracemalloc.txt', 'w', encoding='utf-8') as f:
+            f.write(f"current {current / 1024 / 1024:.1f} MiB, peak {peak / 1024 / 1024:.1f} MiB\n")
+            for stat in snapshot.statistics('lineno')[:TRACEMALLOC_TOP]:
+                f.write(f"{stat}\n")
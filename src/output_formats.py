@@ -0,0 +1,266 @@
+import ast
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from src.game_store import GAMES_REVIEWS_DIR
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = ds = pq = None
+
+# Output formats understood by the catalog and review writers
+PARQUET = 'parquet'
+EXCEL = 'excel'
+JSON = 'json'
+CSV = 'csv'
+
+# Parquet is the primary store when pyarrow is installed; Excel is then an opt-in export
+DEFAULT_CATALOG_FORMATS = (PARQUET, JSON) if pa is not None else (EXCEL, JSON)
+DEFAULT_REVIEW_FORMATS = (PARQUET, CSV) if pa is not None else (EXCEL, CSV)
+
+# Arrow type of each catalog column; other columns are inferred
+CATALOG_COLUMN_TYPES = {
+    'id': 'string',
+    'name': 'string',
+    'genres': 'list',
+    'store_link': 'string',
+    'developer': 'string',
+    'publisher': 'string',
+    'platforms': 'list',
+    'release_date': 'string',
+    'rating_score': 'float64',
+    'rating_count': 'int64',
+    'game_mode': 'string',
+    'languages': 'list',
+    'age_rating': 'string',
+    'space_required': 'string',
+    'price_USD_amount': 'int64',
+    'price_USD_formatted': 'string',
+}
+
+# Arrow type of each review column
+REVIEW_COLUMN_TYPES = {
+    'title': 'string',
+    'rating': 'int8',
+    'time': 'string',
+    'content': 'string',
+    'author': 'string',
+    'helpful_votes': 'string',
+    'scraped_at': 'float64',
+}
+
+# Hive-partitioned Parquet dataset holding every game's reviews, one game_id=<id> folder per game
+REVIEWS_DATASET_DIR = os.path.join(GAMES_REVIEWS_DIR, 'reviews_dataset')
+
+# Reviews buffered per Parquet row group
+REVIEW_ROW_GROUP_SIZE = 10000
+
+
+def require_pyarrow() -> None:
+    if pa is None:
+        raise RuntimeError("Parquet output needs pyarrow (pip install pyarrow)")
+
+
+def _arrow_type(name: str):
+    return pa.list_(pa.string()) if name == 'list' else getattr(pa, name)()
+
+
+def arrow_schema(column_types: Dict[str, str], columns: Iterable[str]):
+    """Schema of `columns`, typed from `column_types` (unknown columns as strings)."""
+    return pa.schema([(column, _arrow_type(column_types.get(column, 'string'))) for column in columns])
+
+
+def _as_list(value: Any) -> Optional[List[str]]:
+    # Lists come as Python lists from the parser and as their repr once read back from Excel
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return None
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            try:
+                value = ast.literal_eval(value)
+            except (ValueError, SyntaxError):
+                return [value]
+    return [str(item) for item in value]
+
+
+def _as_scalar(value: Any, arrow_type: str) -> Any:
+    if value is None or (not isinstance(value, (list, tuple)) and pd.isna(value)):
+        return None
+    if arrow_type == 'string':
+        return str(value)
+    if arrow_type.startswith('int'):
+        return int(value)
+    if arrow_type.startswith(('float', 'double')):
+        return float(value)
+    return value
+
+
+def catalog_table(df: pd.DataFrame):
+    """The catalog as an Arrow table with typed list columns (`genres`, `platforms`, `languages`)."""
+    require_pyarrow()
+    arrays, fields = [], []
+    for column in df.columns:
+        arrow_type = CATALOG_COLUMN_TYPES.get(column)
+        values = df[column].tolist()
+        if arrow_type == 'list':
+            array = pa.array([_as_list(value) for value in values], type=_arrow_type('list'))
+        elif arrow_type is not None:
+            array = pa.array([_as_scalar(value, arrow_type) for value in values], type=_arrow_type(arrow_type))
+        else:
+            array = pa.array(values, from_pandas=True)
+        arrays.append(array)
+        fields.append(pa.field(column, array.type))
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+
+def _replace_atomically(write, path: str) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    root, ext = os.path.splitext(path)
+    tmp_path = f"{root}.tmp{ext}"
+    try:
+        write(tmp_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+
+
+def catalog_paths(output_file: str) -> Dict[str, str]:
+    """Output path of each catalog format, all named after `output_file`."""
+    base = os.path.splitext(output_file)[0]
+    return {PARQUET: base + '.parquet', EXCEL: base + '.xlsx', JSON: base + '.json', CSV: base + '.csv'}
+
+
+def write_catalog(df: pd.DataFrame, paths: Dict[str, str], formats: Iterable[str] = DEFAULT_CATALOG_FORMATS) -> None:
+    """Write the catalog in each of `formats`, to the matching entry of `paths`."""
+    for output_format in formats:
+        path = paths[output_format]
+        if output_format == PARQUET:
+            table = catalog_table(df)
+            _replace_atomically(lambda tmp_path: pq.write_table(table, tmp_path), path)
+        elif output_format == EXCEL:
+            def write_excel(tmp_path):
+                with pd.ExcelWriter(tmp_path, mode='w', engine='openpyxl') as writer:
+                    df.to_excel(writer, index=False, header=True, sheet_name='VR_Games')
+            _replace_atomically(write_excel, path)
+        elif output_format == JSON:
+            _replace_atomically(lambda tmp_path: df.to_json(tmp_path, orient='records', indent=2), path)
+        elif output_format == CSV:
+            _replace_atomically(lambda tmp_path: df.to_csv(tmp_path, index=False), path)
+        else:
+            raise ValueError(f"Unsupported output format: {output_format}")
+
+
+def read_catalog(output_file: str) -> pd.DataFrame:
+    """Load the catalog written for `output_file`, from Parquet when available, else Excel or JSON."""
+    paths = catalog_paths(output_file)
+    if pa is not None and os.path.exists(paths[PARQUET]):
+        return pq.read_table(paths[PARQUET]).to_pandas()
+    if os.path.exists(paths[EXCEL]):
+        return pd.read_excel(paths[EXCEL])
+    if os.path.exists(paths[JSON]):
+        return pd.read_json(paths[JSON], orient='records', dtype={'id': str})
+    raise FileNotFoundError(f"No catalog found for {output_file}")
+
+
+def catalog_exists(output_file: str) -> bool:
+    paths = catalog_paths(output_file)
+    return any(os.path.exists(paths[output_format]) for output_format in (PARQUET, EXCEL, JSON)
+               if output_format != PARQUET or pa is not None)
+
+
+def read_review_file(path: str) -> List[Dict[str, Any]]:
+    """Reviews saved in a Parquet, CSV or Excel file, with text such as 'N/A' kept as written."""
+    if path.endswith('.parquet'):
+        require_pyarrow()
+        return pq.read_table(path).to_pylist()
+    if path.endswith('.csv'):
+        df = pd.read_csv(path, keep_default_na=False)
+    else:
+        df = pd.read_excel(path, keep_default_na=False)
+    return df.to_dict(orient='records')
+
+
+class ParquetRowWriter:
+    """Writes dict rows to a Parquet file, one row group per `row_group_size` rows."""
+
+    def __init__(self, path: str, schema, row_group_size: int = REVIEW_ROW_GROUP_SIZE):
+        require_pyarrow()
+        self.schema = schema
+        self.row_group_size = row_group_size
+        self._columns = schema.names
+        self._types = [str(field.type) for field in schema]
+        self._rows: List[Dict[str, Any]] = []
+        self._writer = pq.ParquetWriter(path, schema)
+
+    def append(self, row: Dict[str, Any]) -> None:
+        self._rows.append(row)
+        if len(self._rows) >= self.row_group_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._rows:
+            return
+        columns = [[_as_scalar(row.get(column), arrow_type) for row in self._rows]
+                   for column, arrow_type in zip(self._columns, self._types)]
+        self._writer.write_table(pa.Table.from_arrays([pa.array(values, type=field.type) for values, field
+                                                       in zip(columns, self.schema)], schema=self.schema))
+        self._rows = []
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+    def abort(self) -> None:
+        self._rows = []
+        try:
+            self._writer.close()
+        except Exception:
+            pass
+
+
+class ReviewDataset:
+    """
+    Every game's reviews as one Parquet dataset, partitioned by game id.
+
+    A game's reviews live in `<root>/game_id=<id>/part-0.parquet`, rewritten whole (and atomically)
+    whenever the game is saved. `read` loads any set of games in one call, with `game_id` as a column.
+    """
+
+    def __init__(self, root: str = REVIEWS_DATASET_DIR):
+        self.root = root
+
+    def partition_path(self, game_id: str) -> str:
+        return os.path.join(self.root, f"game_id={game_id}", 'part-0.parquet')
+
+    def games(self) -> List[str]:
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(name.split('=', 1)[1] for name in os.listdir(self.root)
+                      if name.startswith('game_id=') and os.path.exists(self.partition_path(name.split('=', 1)[1])))
+
+    def count(self, game_id: str) -> Optional[int]:
+        """Number of reviews saved for `game_id`, from the Parquet footer, or None if there are none."""
+        path = self.partition_path(game_id)
+        if pa is None or not os.path.exists(path):
+            return None
+        return pq.ParquetFile(path).metadata.num_rows
+
+    def read(self, game_ids: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        require_pyarrow()
+        partitioning = ds.partitioning(pa.schema([('game_id', pa.string())]), flavor='hive')
+        dataset = ds.dataset(self.root, format='parquet', partitioning=partitioning)
+        # Partitions saved before a column existed (`scraped_at`) read it as null instead of dropping it
+        schema = pa.unify_schemas([dataset.schema, arrow_schema(REVIEW_COLUMN_TYPES, REVIEW_COLUMN_TYPES)])
+        dataset = ds.dataset(self.root, format='parquet', partitioning=partitioning, schema=schema)
+        row_filter = ds.field('game_id').isin(list(game_ids)) if game_ids is not None else None
+        return dataset.to_table(filter=row_filter).to_pandas()
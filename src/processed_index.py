@@ -0,0 +1,142 @@
+import glob
+import logging
+import os
+import re
+import threading
+import time
+from typing import Optional
+
+import pandas as pd
+
+from src.game_store import GAMES_REVIEWS_DIR, connect_sqlite
+from src.output_formats import REVIEWS_DATASET_DIR, ReviewDataset
+from src.review_manifest import REVIEW_MANIFEST_PATH, ReviewManifest
+
+logger = logging.getLogger(__name__)
+
+# Default location of the processed games index
+PROCESSED_INDEX_PATH = os.path.join(GAMES_REVIEWS_DIR, 'processed_games.db')
+
+PROCESSED = 'processed'
+SKIPPED = 'skipped'
+
+_SKIPPED_LINE = re.compile(r'Skipping game: (\S+)(?: \(Reviews: (\d+)\))?')
+
+
+def game_name_from_link(store_link: str) -> str:
+    """Meta store id used to name a game's output files"""
+    return store_link.split('/')[-1].split('?')[0]
+
+
+class ProcessedGamesIndex:
+    """
+    Index of processed and skipped games shared by every scraper process.
+
+    Backed by a SQLite table keyed on the game name, so lookups and updates are single
+    primary-key operations that are committed immediately and survive crashes. The first
+    process to open an empty index builds it from the existing outputs (VR_Games_data.xlsx,
+    skipped_games.txt, the review manifest and the per-game review files); the others wait for it
+    and reuse it.
+    """
+
+    def __init__(self, db_path: str = PROCESSED_INDEX_PATH, games_folder: str = GAMES_REVIEWS_DIR):
+        self.db_path = db_path
+        self.games_folder = games_folder
+        self._lock = threading.Lock()
+        self._connection = connect_sqlite(db_path)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS processed_games ('
+            'game_name TEXT PRIMARY KEY, store_link TEXT, status TEXT NOT NULL, review_count INTEGER, '
+            'updated_at REAL NOT NULL)'
+        )
+        self._connection.execute('CREATE TABLE IF NOT EXISTS index_meta (key TEXT PRIMARY KEY, value TEXT)')
+        self._connection.commit()
+        self.build()
+
+    def build(self, force: bool = False) -> int:
+        """Load the existing outputs into the index once; returns the number of games added."""
+        with self._lock:
+            # BEGIN IMMEDIATE makes concurrent processes wait for the one building the index
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                built = self._connection.execute("SELECT value FROM index_meta WHERE key = 'built'").fetchone()
+                if built and not force:
+                    self._connection.rollback()
+                    return 0
+
+                rows = self._existing_outputs()
+                self._connection.executemany(
+                    'INSERT OR IGNORE INTO processed_games (game_name, store_link, status, review_count, updated_at) '
+                    'VALUES (?, ?, ?, ?, ?)', rows)
+                self._connection.execute("INSERT OR REPLACE INTO index_meta (key, value) VALUES ('built', ?)",
+                                         (str(time.time()),))
+                self._connection.commit()
+            except BaseException:
+                self._connection.rollback()
+                raise
+        logger.info(f"Built processed games index {self.db_path} from {len(rows)} existing outputs")
+        return len(rows)
+
+    def _existing_outputs(self):
+        now = time.time()
+        rows = []
+
+        vr_games_data_path = os.path.join(self.games_folder, 'VR_Games_data.xlsx')
+        if os.path.exists(vr_games_data_path):
+            df = pd.read_excel(vr_games_data_path)
+            if 'store_link' in df.columns:
+                for store_link in df['store_link'].dropna():
+                    rows.append((game_name_from_link(store_link), store_link, PROCESSED, None, now))
+
+        for path in glob.glob(os.path.join(self.games_folder, 'xlsx_games_reviews', '*.xlsx')):
+            rows.append((os.path.splitext(os.path.basename(path))[0], None, PROCESSED, None, now))
+
+        manifest_path = os.path.join(self.games_folder, os.path.basename(REVIEW_MANIFEST_PATH))
+        if os.path.exists(manifest_path):
+            manifest = ReviewManifest(manifest_path)
+            try:
+                for game_name, review_count in manifest.review_counts().items():
+                    rows.append((game_name, None, PROCESSED, review_count, now))
+            finally:
+                manifest.close()
+
+        dataset = ReviewDataset(os.path.join(self.games_folder, os.path.basename(REVIEWS_DATASET_DIR)))
+        for game_name in dataset.games():
+            rows.append((game_name, None, PROCESSED, dataset.count(game_name), now))
+
+        skipped_games_path = os.path.join(self.games_folder, 'skipped_games.txt')
+        if os.path.exists(skipped_games_path):
+            with open(skipped_games_path, 'r') as f:
+                for line in f:
+                    match = _SKIPPED_LINE.search(line)
+                    if match:
+                        review_count = int(match.group(2)) if match.group(2) else None
+                        rows.append((match.group(1), None, SKIPPED, review_count, now))
+        return rows
+
+    def status(self, store_link: str) -> Optional[str]:
+        """PROCESSED, SKIPPED or None for a game not seen yet."""
+        with self._lock:
+            row = self._connection.execute('SELECT status FROM processed_games WHERE game_name = ?',
+                                           (game_name_from_link(store_link),)).fetchone()
+        return row[0] if row else None
+
+    def is_processed(self, store_link: str) -> bool:
+        return self.status(store_link) is not None
+
+    def _mark(self, store_link: str, status: str, review_count: Optional[int]) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO processed_games (game_name, store_link, status, review_count, updated_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (game_name_from_link(store_link), store_link, status, review_count, time.time()))
+
+    def mark_processed(self, store_link: str, review_count: Optional[int] = None) -> None:
+        self._mark(store_link, PROCESSED, review_count)
+
+    def mark_skipped(self, store_link: str, review_count: Optional[int] = None) -> None:
+        self._mark(store_link, SKIPPED, review_count)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,261 @@
+import argparse
+import glob
+import logging
+import os
+import re
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.game_store import GAMES_REVIEWS_DIR
+from src.output_formats import REVIEWS_DATASET_DIR, ReviewDataset, pa, read_review_file
+from src.review_manifest import REVIEW_MANIFEST_PATH, ReviewManifest
+
+logger = logging.getLogger(__name__)
+
+# Seconds per unit of a relative review time; months and years are their Gregorian averages
+TIME_UNIT_SECONDS = {
+    'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400, 'week': 7 * 86400,
+    'month': 30.436875 * 86400, 'year': 365.2425 * 86400,
+}
+
+# Relative review times written as words, in seconds before the scrape
+RELATIVE_TIME_WORDS = {
+    'just now': 0, 'now': 0, 'today': 0, 'yesterday': 86400,
+    'last week': TIME_UNIT_SECONDS['week'], 'last month': TIME_UNIT_SECONDS['month'],
+    'last year': TIME_UNIT_SECONDS['year'],
+}
+
+_RELATIVE_TIME = re.compile(r'^(?P<count>\d+|an?|one)\s+(?P<unit>second|minute|hour|day|week|month|year)s?\s+ago$')
+# "12 people found this helpful", "1 person ...", "1.2K people ...", or a bare count from the review API
+_HELPFUL_VOTES = re.compile(r'^(?P<number>\d[\d,]*(?:\.\d+)?)\s*(?P<suffix>[km])?'
+                            r'(?:\s+(?:people|person)\s+found\s+this\s+helpful)?$', re.IGNORECASE)
+
+# Window (days before the scrape) of the recent review velocity
+VELOCITY_WINDOW_DAYS = 30
+
+
+def _factorize(values: pd.Series) -> Tuple[np.ndarray, pd.Series]:
+    """Codes of `values` into its distinct values (-1 for missing), and the distinct values as text."""
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    return codes, pd.Series(uniques, dtype=object).astype(str).str.strip().str.lower()
+
+
+def _expand(codes: np.ndarray, parsed: np.ndarray, missing) -> np.ndarray:
+    """Per-row values from the values parsed once per distinct value."""
+    return np.append(parsed, missing)[codes]  # Code -1 picks the trailing `missing`
+
+
+def _relative_seconds(uniques: pd.Series) -> np.ndarray:
+    parts = uniques.str.extract(_RELATIVE_TIME)
+    counts = pd.to_numeric(parts['count'].replace({'a': '1', 'an': '1', 'one': '1'}), errors='coerce')
+    seconds = counts * parts['unit'].map(TIME_UNIT_SECONDS)
+    return seconds.fillna(uniques.map(RELATIVE_TIME_WORDS)).to_numpy(dtype=float)
+
+
+def relative_time_offsets(times: pd.Series) -> np.ndarray:
+    """Seconds before the scrape that each review time ("3 months ago", "yesterday") stands for, NaN if absolute."""
+    codes, uniques = _factorize(times)
+    return _expand(codes, _relative_seconds(uniques), np.nan)
+
+
+def parse_review_times(times: pd.Series, scraped_at) -> pd.Series:
+    """
+    Absolute UTC timestamps of the review times, relative ones anchored at `scraped_at`.
+
+    `scraped_at` is a timestamp or a datetime Series aligned with `times`. Absolute times (such as
+    the ISO dates of the review API) are parsed as they are; anything unparseable becomes NaT. Each
+    distinct text is parsed once, so the cost follows the number of distinct values rather than rows.
+    """
+    codes, uniques = _factorize(pd.Series(times).reset_index(drop=True))
+    unique_offsets = _relative_seconds(uniques)
+    unique_absolute = pd.to_datetime(uniques.where(np.isnan(unique_offsets)), errors='coerce', utc=True,
+                                     format='mixed')
+    offsets = _expand(codes, unique_offsets, np.nan)
+    absolute = _expand(codes, unique_absolute.dt.tz_localize(None).to_numpy(dtype='datetime64[ns]'),
+                       np.datetime64('NaT', 'ns'))
+
+    if isinstance(scraped_at, pd.Series):
+        anchors = pd.to_datetime(scraped_at.reset_index(drop=True), utc=True)
+    else:
+        anchors = pd.Timestamp(scraped_at)
+        anchors = anchors.tz_localize('UTC') if anchors.tzinfo is None else anchors.tz_convert('UTC')
+    relative = pd.Series(anchors - pd.to_timedelta(offsets, unit='s'))
+    return pd.Series(absolute).dt.tz_localize('UTC').where(np.isnan(offsets), relative)
+
+
+def parse_helpful_votes(votes: pd.Series) -> np.ndarray:
+    """
+    Helpful vote counts as integers: 12 for "12 people found this helpful", 1200 for "1.2K people found
+    this helpful", 0 for any other text ('N/A', empty, or a number in some other sentence). Numbers from
+    the review API pass through.
+    """
+    codes, uniques = _factorize(votes)
+    parts = uniques.str.extract(_HELPFUL_VOTES)
+    numbers = pd.to_numeric(parts['number'].str.replace(',', '', regex=False), errors='coerce')
+    multipliers = parts['suffix'].str.lower().map({'k': 1000, 'm': 1000000}).fillna(1)
+    counts = (numbers * multipliers).fillna(0).round().to_numpy(dtype=np.int64)
+    return _expand(codes, counts, 0)
+
+
+def _read_fallback_files(games_folder: str, loaded: set) -> pd.DataFrame:
+    """Reviews of games missing from the Parquet dataset, from their CSV (else Excel) files."""
+    paths: Dict[str, str] = {}
+    for path in glob.glob(os.path.join(games_folder, 'xlsx_games_reviews', '*.xlsx')):
+        paths[os.path.splitext(os.path.basename(path))[0]] = path
+    for path in glob.glob(os.path.join(games_folder, 'csv_games_reviews', '*.csv')):
+        # CSV files are named <game>_<review count>.csv
+        paths[os.path.splitext(os.path.basename(path))[0].rsplit('_', 1)[0]] = path
+
+    frames = []
+    for game_id, path in sorted(paths.items()):
+        if game_id in loaded:
+            continue
+        try:
+            frame = pd.DataFrame(read_review_file(path))
+        except Exception as e:
+            logger.warning(f"Could not read reviews of {game_id} from {path}: {str(e)}")
+            continue
+        frame['game_id'] = game_id
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def _scrape_times(games_folder: str, game_ids: np.ndarray) -> pd.Series:
+    """When each game was last scraped: from the review manifest, else the mtime of its saved files, else now."""
+    manifest_path = os.path.join(games_folder, os.path.basename(REVIEW_MANIFEST_PATH))
+    times: Dict[str, float] = {}
+    if os.path.exists(manifest_path):
+        manifest = ReviewManifest(manifest_path)
+        try:
+            times = manifest.scrape_times()
+        finally:
+            manifest.close()
+
+    dataset = ReviewDataset(os.path.join(games_folder, os.path.basename(REVIEWS_DATASET_DIR)))
+    now = pd.Timestamp.now(tz='UTC').timestamp()
+    for game_id in game_ids:
+        if game_id not in times:
+            candidates = [dataset.partition_path(game_id),
+                          os.path.join(games_folder, 'xlsx_games_reviews', f"{game_id}.xlsx")]
+            times[game_id] = next((os.path.getmtime(path) for path in candidates if os.path.exists(path)), now)
+    return pd.to_datetime(pd.Series({game_id: times[game_id] for game_id in game_ids}, dtype=float), unit='s',
+                          utc=True)
+
+
+def load_reviews(games_folder: str = GAMES_REVIEWS_DIR) -> pd.DataFrame:
+    """
+    Every scraped review in one DataFrame, with `reviewed_at` (UTC), `helpful_count` and `scraped_at` added.
+
+    Games are read in bulk from the Parquet reviews dataset; games saved only as CSV or Excel are
+    read from those files. Relative review times are anchored at each review's own `scraped_at`;
+    reviews saved without one use their game's last scrape time.
+    """
+    dataset = ReviewDataset(os.path.join(games_folder, os.path.basename(REVIEWS_DATASET_DIR)))
+    frames = []
+    if pa is not None and dataset.games():
+        frames.append(dataset.read())
+    loaded = set(frames[0]['game_id'].unique()) if frames else set()
+    fallback = _read_fallback_files(games_folder, loaded)
+    if not fallback.empty:
+        frames.append(fallback)
+    if not frames:
+        return pd.DataFrame(columns=['game_id', 'title', 'rating', 'time', 'content', 'author', 'helpful_votes',
+                                     'reviewed_at', 'helpful_count', 'scraped_at'])
+
+    reviews = pd.concat(frames, ignore_index=True)
+    reviews['game_id'] = reviews['game_id'].astype(str).astype('category')
+    reviews['rating'] = pd.to_numeric(reviews['rating'], errors='coerce').fillna(0).astype(np.int8)
+
+    game_ids = reviews['game_id'].cat.categories.to_numpy()
+    scrape_times = _scrape_times(games_folder, game_ids)
+    game_scraped_at = pd.Series(scrape_times.to_numpy()[reviews['game_id'].cat.codes.to_numpy()])
+    if 'scraped_at' in reviews.columns:
+        row_scraped_at = pd.to_datetime(pd.to_numeric(reviews['scraped_at'], errors='coerce'), unit='s', utc=True)
+        reviews['scraped_at'] = row_scraped_at.fillna(game_scraped_at)
+    else:
+        reviews['scraped_at'] = pd.to_datetime(game_scraped_at, utc=True)
+    reviews['reviewed_at'] = parse_review_times(reviews['time'], reviews['scraped_at'])
+    reviews['helpful_count'] = parse_helpful_votes(reviews['helpful_votes'])
+    return reviews
+
+
+def game_aggregates(reviews: pd.DataFrame, window_days: int = VELOCITY_WINDOW_DAYS) -> pd.DataFrame:
+    """
+    Per-game review statistics, one row per game:
+
+    - `review_count`, `mean_rating` and `rating_1` .. `rating_5` (the rating histogram)
+    - `helpful_weighted_rating`: mean rating with each review weighted by 1 + its helpful votes
+    - `first_review`, `last_review` and `reviews_per_day` over that span
+    - `recent_reviews`: reviews in the `window_days` before the game's last scrape
+    """
+    game_codes = reviews['game_id'].astype('category').cat.codes.to_numpy()
+    games = reviews['game_id'].astype('category').cat.categories
+    num_games = len(games)
+    ratings = reviews['rating'].to_numpy(dtype=np.int64)
+    weights = 1 + reviews['helpful_count'].to_numpy(dtype=np.int64)
+
+    review_count = np.bincount(game_codes, minlength=num_games)
+    rated = (ratings >= 1) & (ratings <= 5)
+    histogram = np.bincount(game_codes[rated] * 5 + ratings[rated] - 1, minlength=num_games * 5).reshape(num_games, 5)
+    rated_count = histogram.sum(axis=1)
+    rating_sum = np.bincount(game_codes[rated], weights=ratings[rated], minlength=num_games)
+    weighted_sum = np.bincount(game_codes[rated], weights=ratings[rated] * weights[rated], minlength=num_games)
+    weight_sum = np.bincount(game_codes[rated], weights=weights[rated], minlength=num_games)
+
+    reviewed_at = reviews['reviewed_at']
+    window = pd.Timedelta(days=window_days)
+    last_scraped_at = reviews['scraped_at'].groupby(game_codes).transform('max')
+    recent = (reviewed_at >= last_scraped_at - window).to_numpy()
+    recent_reviews = np.bincount(game_codes[recent], minlength=num_games)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        stats = pd.DataFrame({
+            'review_count': review_count,
+            'mean_rating': np.where(rated_count > 0, rating_sum / rated_count, np.nan),
+            'helpful_weighted_rating': np.where(weight_sum > 0, weighted_sum / weight_sum, np.nan),
+        }, index=pd.Index(games, name='game_id'))
+    for stars in range(1, 6):
+        stats[f"rating_{stars}"] = histogram[:, stars - 1]
+
+    spans = reviewed_at.groupby(game_codes).agg(['min', 'max'])
+    stats['first_review'] = spans['min'].reindex(range(num_games)).to_numpy()
+    stats['last_review'] = spans['max'].reindex(range(num_games)).to_numpy()
+    span_days = ((stats['last_review'] - stats['first_review']).dt.total_seconds() / 86400).clip(lower=1)
+    stats['reviews_per_day'] = stats['review_count'] / span_days
+    stats['recent_reviews'] = recent_reviews
+    return stats
+
+
+def write_aggregates(stats: pd.DataFrame, output_path: str) -> None:
+    """Save the per-game statistics as Parquet, Excel or CSV (by extension), replacing the file atomically."""
+    root, ext = os.path.splitext(output_path)
+    tmp_path = f"{root}.tmp{ext}"
+    if ext == '.parquet':
+        stats.to_parquet(tmp_path)
+    elif ext == '.xlsx':
+        # Excel has no time zones
+        stats.assign(first_review=stats['first_review'].dt.tz_localize(None),
+                     last_review=stats['last_review'].dt.tz_localize(None)).to_excel(tmp_path)
+    else:
+        stats.to_csv(tmp_path)
+    os.replace(tmp_path, output_path)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Per-game statistics over every scraped review.")
+    parser.add_argument('--games-folder', default=GAMES_REVIEWS_DIR, help="Folder holding the scraped reviews")
+    parser.add_argument('--output', default=os.path.join(GAMES_REVIEWS_DIR, 'review_stats.csv'),
+                        help="Statistics file (.parquet, .xlsx or .csv)")
+    parser.add_argument('--window-days', type=int, default=VELOCITY_WINDOW_DAYS,
+                        help="Days before the scrape counted as recent reviews")
+    args = parser.parse_args()
+
+    all_reviews = load_reviews(args.games_folder)
+    if all_reviews.empty:
+        print(f"No reviews found in {args.games_folder}")
+        raise SystemExit(1)
+    game_stats = game_aggregates(all_reviews, args.window_days)
+    write_aggregates(game_stats, args.output)
+    print(f"{len(all_reviews)} reviews of {len(game_stats)} games, statistics written to {args.output}")
@@ -0,0 +1,201 @@
+import datetime
+import json
+import logging
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Chrome capability that records DevTools network events, read back with driver.get_log('performance')
+PERFORMANCE_LOGGING = ('goog:loggingPrefs', {'performance': 'ALL'})
+
+# Variables a paginated GraphQL query may take its cursor from
+CURSOR_VARIABLES = ['after', 'cursor', 'end_cursor']
+
+# Review node keys tried in order for each review column; dotted keys reach into nested objects
+REVIEW_NODE_FIELDS = {
+    'title': ['review_title', 'title', 'headline'],
+    'rating': ['score', 'rating', 'star_rating', 'stars'],
+    'time': ['date', 'created_time', 'creation_time', 'timestamp'],
+    'content': ['review_description', 'description', 'body', 'text', 'content'],
+    'author': ['author.alias', 'author.display_name', 'author.name', 'alias', 'reviewer_name'],
+    'helpful_votes': ['helpful_count', 'helpfulness', 'upvote_count'],
+}
+
+# Request headers that are connection specific and must not be replayed
+_SKIPPED_HEADERS = {'content-length', 'host', 'connection', 'accept-encoding', 'cookie'}
+
+
+class ReviewApiError(RuntimeError):
+    """Raised when the captured review request cannot be replayed."""
+
+
+class CapturedReviewRequest:
+    """The XHR/GraphQL request a "Show more reviews" click sent, ready to be replayed with other cursors."""
+
+    def __init__(self, url: str, headers: Dict[str, str], post_data: str):
+        self.url = url
+        self.headers = {name: value for name, value in headers.items()
+                        if not name.startswith(':') and name.lower() not in _SKIPPED_HEADERS}
+        self.is_json = post_data.lstrip().startswith('{')
+        self.fields = json.loads(post_data) if self.is_json else dict(parse_qsl(post_data, keep_blank_values=True))
+
+        variables = self.fields.get('variables', {})
+        self.variables = json.loads(variables) if isinstance(variables, str) else dict(variables)
+        self.cursor_key = next((key for key in CURSOR_VARIABLES if key in self.variables), CURSOR_VARIABLES[0])
+
+    def body(self, cursor: Optional[str]) -> str:
+        variables = dict(self.variables, **{self.cursor_key: cursor})
+        fields = dict(self.fields)
+        if self.is_json:
+            fields['variables'] = variables
+            return json.dumps(fields)
+        fields['variables'] = json.dumps(variables, separators=(',', ':'))
+        return urlencode(fields)
+
+
+def capture_review_request(driver, log_entries: Optional[List[Dict[str, Any]]] = None
+                           ) -> Optional[CapturedReviewRequest]:
+    """
+    Find the last review request in the browser's performance log.
+
+    The driver must have been started with the PERFORMANCE_LOGGING capability. Reading the log
+    drains it, so call this right after the click whose request is wanted, or pass the entries
+    already read.
+    """
+    captured = None
+    for entry in driver.get_log('performance') if log_entries is None else log_entries:
+        message = json.loads(entry['message'])['message']
+        if message.get('method') != 'Network.requestWillBeSent':
+            continue
+        params = message['params']
+        request = params['request']
+        if request.get('method') != 'POST' or 'graphql' not in request['url']:
+            continue
+
+        post_data = request.get('postData')
+        if post_data is None and request.get('hasPostData'):
+            try:
+                post_data = driver.execute_cdp_cmd('Network.getRequestPostData',
+                                                   {'requestId': params['requestId']})['postData']
+            except Exception:
+                continue
+        if post_data and 'review' in post_data.lower():
+            captured = (request['url'], request.get('headers', {}), post_data)
+
+    return CapturedReviewRequest(*captured) if captured else None
+
+
+def _lookup(node: Dict[str, Any], dotted_key: str) -> Any:
+    value = node
+    for key in dotted_key.split('.'):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def review_from_node(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a review node of the API response to the scraper's review columns."""
+    review = {}
+    for field, keys in REVIEW_NODE_FIELDS.items():
+        value = next((value for value in (_lookup(node, key) for key in keys) if value is not None), None)
+        if field == 'time' and isinstance(value, (int, float)):
+            value = datetime.datetime.fromtimestamp(value, tz=datetime.timezone.utc).strftime('%Y-%m-%d')
+        review[field] = value if value is not None else (0 if field == 'rating' else 'N/A')
+    return review
+
+
+def find_review_connection(payload: Any) -> Optional[Tuple[List[Dict[str, Any]], Optional[str], bool]]:
+    """
+    Locate the paginated review list in a GraphQL response.
+
+    Returns the review nodes, the cursor of the next page and whether there is one, taken from
+    the first object holding `edges` (or `nodes`) next to `page_info` (or `pageInfo`).
+    """
+    if isinstance(payload, dict):
+        page_info = payload.get('page_info') or payload.get('pageInfo')
+        edges = payload.get('edges') if 'edges' in payload else payload.get('nodes')
+        if isinstance(page_info, dict) and isinstance(edges, list):
+            nodes = [edge.get('node', edge) for edge in edges if isinstance(edge, dict)]
+            cursor = page_info.get('end_cursor') or page_info.get('endCursor')
+            has_next = bool(page_info.get('has_next_page', page_info.get('hasNextPage')))
+            return nodes, cursor, has_next and cursor is not None
+        children = payload.values()
+    elif isinstance(payload, list):
+        children = payload
+    else:
+        return None
+
+    for child in children:
+        connection = find_review_connection(child)
+        if connection is not None:
+            return connection
+    return None
+
+
+class ReviewApiClient:
+    """
+    Pages through reviews by replaying a captured review request over plain HTTP.
+
+    The browser's cookies are copied into a pooled keep-alive session, and the request is sent
+    again with each page's end cursor until the API reports no next page.
+    """
+
+    def __init__(self, request: CapturedReviewRequest, cookies: List[Dict[str, Any]] = (), pool_size: int = 1,
+                 timeout: float = 30):
+        self.request = request
+        self.timeout = timeout
+        self.requests_sent = 0
+        self.bytes_received = 0
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        for cookie in cookies:
+            self.session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'),
+                                     path=cookie.get('path', '/'))
+
+    def fetch_page(self, cursor: Optional[str]) -> Tuple[List[Dict[str, Any]], Optional[str], bool]:
+        try:
+            response = self.session.post(self.request.url, data=self.request.body(cursor),
+                                         headers=self.request.headers, timeout=self.timeout)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            raise ReviewApiError(f"Review request failed: {str(e)}") from e
+        self.requests_sent += 1
+        self.bytes_received += len(response.content)
+
+        # Some GraphQL endpoints prefix their JSON with a guard such as "for (;;);"
+        text = response.text
+        try:
+            payload = json.loads(text[text.index('{'):]) if '{' in text else None
+        except ValueError as e:
+            raise ReviewApiError(f"Review response is not JSON: {str(e)}") from e
+        connection = find_review_connection(payload)
+        if connection is None:
+            raise ReviewApiError("No paginated review list in the response")
+        return connection
+
+    def pages(self, cursor: Optional[str] = None, max_pages: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Yield the reviews page by page, starting at `cursor` (None for the first page)."""
+        pages = 0
+        while max_pages is None or pages < max_pages:
+            nodes, cursor, has_next = self.fetch_page(cursor)
+            pages += 1
+            yield [review_from_node(node) for node in nodes]
+            if not has_next:
+                break
+
+    def fetch_all(self, max_pages: Optional[int] = None) -> List[Dict[str, Any]]:
+        reviews = []
+        for page in self.pages(max_pages=max_pages):
+            reviews.extend(page)
+        return reviews
+
+    def close(self) -> None:
+        self.session.close()
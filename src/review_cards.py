@@ -0,0 +1,122 @@
+# Review cards on a Meta store page
+REVIEW_CARD_XPATH = (
+    "//div[contains(@class, 'xeuugli') and contains(@class, 'x2lwn1j') and contains(@class, 'x78zum5') and "
+    "contains(@class, 'xdt5ytf') and contains(@class, 'xgpatz3') and contains(@class, 'x40hh3e')]"
+)
+
+# "Show more reviews" button below the loaded reviews
+SHOW_MORE_XPATH = "//div[contains(@class, 'x78zum5') and contains(@class, 'xl56j7k')]/span[text()='Show more reviews']"
+
+# Attribute set on review cards once they have been extracted
+HARVESTED_ATTRIBUTE = 'data-harvested'
+
+# Star rating container and the filled stars inside it
+STARS_CLASS = 'x3nfvp2'
+STAR_CLASS = 'xjbqb8w'
+
+# Fields of a review card, relative to the card
+TITLE_XPATH = (
+    ".//div[@class='x16g9bbj x17gzxuv xv6bue1 xm5vtmc xsp84uj x1j402mz x1wsgf3v x14imz66 x1k03ns3 "
+    "xcxolhg xjbavb x1npfmwo x16b4c32 xrm2kyc x1i6xp69 xvyeec0 x12429cg x6tc29j xbq7h4v x6jdkww "
+    "xq9mrsl']"
+)
+
+TIME_XPATH = (
+    ".//span[contains(@class, 'x16g9bbj') and contains(@class, 'x17gzxuv') and contains(@class, "
+    "'x3a6nna') and contains(@class, 'xm5vtmc') and contains(@class, 'x1t2x7uc') and contains(@class, "
+    "'x1o1n6r0') and contains(@class, 'x1wsgf3v') and contains(@class, 'x1c773n9') and contains("
+    "@class, 'x1k03ns3') and contains(@class, 'xpbi8i2') and contains(@class, 'x9820fh') and "
+    "contains(@class, 'x1npfmwo') and contains(@class, 'xhj0du5') and contains(@class, 'xrm2kyc') and "
+    "contains(@class, 'xjprkx4') and contains(@class, 'xlu1awn') and contains(@class, 'x12429cg') and "
+    "contains(@class, 'x6tc29j') and contains(@class, 'xbq7h4v') and contains(@class, 'x6jdkww') and "
+    "contains(@class, 'xq9mrsl')]"
+)
+
+CONTENT_XPATH = (
+    ".//div[@class='x17gzxuv x3a6nna xm5vtmc x1t2x7uc x1o1n6r0 x1wsgf3v x1c773n9 x1k03ns3 xpbi8i2 "
+    "x9820fh x1npfmwo xhj0du5 xrm2kyc xjprkx4 xlu1awn']"
+)
+
+AUTHOR_XPATH = (
+    ".//span[contains(@class, 'x16g9bbj') and contains(@class, 'x17gzxuv') and contains(@class, "
+    "'x1rujz1s') and contains(@class, 'xm5vtmc') and contains(@class, 'x3voqp2') and contains(@class, "
+    "'x658qfi') and contains(@class, 'x1wsgf3v') and contains(@class, 'xn1wy4v') and contains(@class, "
+    "'x1k03ns3') and contains(@class, 'xpbi8i2') and contains(@class, 'xh2n1af') and contains(@class, "
+    "'x1npfmwo') and contains(@class, 'xg94uf4') and contains(@class, 'xrm2kyc') and contains(@class, "
+    "'xjprkx4') and contains(@class, 'xawl3gl') and contains(@class, 'x12429cg') and contains(@class, "
+    "'x6tc29j') and contains(@class, 'xbq7h4v') and contains(@class, 'x6jdkww') and contains(@class, "
+    "'xq9mrsl')]"
+)
+
+HELPFULNESS_XPATH = (
+    ".//span[contains(@class, 'x1heor9g') and contains(@class, 'x17gzxuv') and contains(@class, "
+    "'x1rujz1s') and contains(@class, 'xex5isp') and contains(@class, 'xsp84uj') and contains(@class, "
+    "'x658qfi') and contains(@class, 'x1wsgf3v') and contains(@class, 'xn1wy4v') and contains(@class, "
+    "'xby3lk6') and contains(@class, 'xcxolhg') and contains(@class, 'xh2n1af') and contains(@class, "
+    "'x1npfmwo') and contains(@class, 'xg94uf4') and contains(@class, 'x1yyhlu9') and contains(@class, "
+    "'x1i6xp69') and contains(@class, 'xawl3gl') and contains(@class, 'x12429cg') and contains(@class, "
+    "'x6tc29j') and contains(@class, 'xbq7h4v') and contains(@class, 'x6jdkww') and contains(@class, "
+    "'xq9mrsl')]"
+)
+
+# Line of the card text used when a field's element is missing, as WebElement.text.split('\n')
+FIELD_XPATHS = {
+    'title': (TITLE_XPATH, 0),
+    'time': (TIME_XPATH, 1),
+    'content': (CONTENT_XPATH, 2),
+    'author': (AUTHOR_XPATH, 3),
+    'helpful_votes': (HELPFULNESS_XPATH, 3),
+}
+
+# Columns of an extracted review, in output order
+REVIEW_FIELDS = ['title', 'rating', 'time', 'content', 'author', 'helpful_votes']
+
+# Extraction modes: one WebDriver lookup per field, or every card serialized by one script call
+EXTRACT_WITH_WEBDRIVER = 'webdriver'
+EXTRACT_WITH_SCRIPT = 'script'
+
+# arguments: card XPath, FIELD_XPATHS, STARS_CLASS, STAR_CLASS, attribute to tag the cards with (or null).
+# Element text follows WebElement.text: rendered text, non-breaking spaces as spaces, trimmed.
+SERIALIZE_REVIEWS_JS = """
+const [cardXPath, fields, starsClass, starClass, marker] = arguments;
+const textOf = (element) => element.innerText.replace(/\\u00a0/g, ' ').trim();
+const first = (xpath, node) =>
+    document.evaluate(xpath, node, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+const cards = document.evaluate(cardXPath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const reviews = [];
+for (let i = 0; i < cards.snapshotLength; i++) {
+    const card = cards.snapshotItem(i);
+    const lines = textOf(card).split('\\n');
+    const review = {};
+    for (const [field, [xpath, line]] of Object.entries(fields)) {
+        const element = first(xpath, card);
+        review[field] = element ? textOf(element) : (lines[line] ?? 'N/A');
+    }
+    const stars = card.querySelector('.' + starsClass);
+    review.rating = stars ? stars.querySelectorAll('.' + starClass).length : 0;
+    reviews.push(review);
+    if (marker) {
+        card.setAttribute(marker, '');
+    }
+}
+return reviews;
+"""
+
+# Review cards a page has loaded so far, counting the ones pruned from the DOM. arguments: card XPath.
+LOADED_REVIEWS_JS = """
+const cards = document.evaluate('count(' + arguments[0] + ')', document, null, XPathResult.NUMBER_TYPE, null);
+return cards.numberValue + (window.__prunedReviews || 0);
+"""
+
+# Removes all but the last `keep` cards matching the XPath and returns how many went.
+# arguments: card XPath, keep.
+PRUNE_REVIEWS_JS = """
+const [cardXPath, keep] = arguments;
+const cards = document.evaluate(cardXPath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const pruned = Math.max(cards.snapshotLength - keep, 0);
+for (let i = 0; i < pruned; i++) {
+    cards.snapshotItem(i).remove();
+}
+window.__prunedReviews = (window.__prunedReviews || 0) + pruned;
+return pruned;
+"""
@@ -0,0 +1,93 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from src.game_store import GAMES_REVIEWS_DIR, connect_sqlite
+
+# Default location of the review manifest
+REVIEW_MANIFEST_PATH = os.path.join(GAMES_REVIEWS_DIR, 'review_manifest.db')
+
+
+class ReviewManifest:
+    """
+    One record per game whose reviews were saved: review count, output files, content hash,
+    scrape start/finish times and "Show more reviews" clicks.
+
+    Maintained by `save_game_reviews`, so anything that needs a game's review count or wants to
+    know whether its reviews changed answers with one primary-key lookup instead of opening the
+    review files. Shared by every process through SQLite (WAL).
+    """
+
+    def __init__(self, db_path: str = REVIEW_MANIFEST_PATH):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._connection = connect_sqlite(db_path)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS review_manifest ('
+            'game_name TEXT PRIMARY KEY, review_count INTEGER NOT NULL, paths TEXT NOT NULL, '
+            'content_hash TEXT NOT NULL, scrape_started REAL, scrape_finished REAL, click_count INTEGER, '
+            'saved_at REAL NOT NULL)'
+        )
+        self._connection.execute(
+            'CREATE INDEX IF NOT EXISTS review_manifest_saved_at ON review_manifest (saved_at)')
+        self._connection.commit()
+
+    def record(self, game_name: str, review_count: int, paths: Dict[str, str], content_hash: str,
+               scrape_started: Optional[float] = None, scrape_finished: Optional[float] = None,
+               click_count: Optional[int] = None) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO review_manifest (game_name, review_count, paths, content_hash, '
+                'scrape_started, scrape_finished, click_count, saved_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (game_name, review_count, json.dumps(paths), content_hash, scrape_started, scrape_finished,
+                 click_count, time.time()))
+
+    def get(self, game_name: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT game_name, review_count, paths, content_hash, scrape_started, scrape_finished, click_count, '
+                'saved_at FROM review_manifest WHERE game_name = ?', (game_name,)).fetchone()
+        if row is None:
+            return None
+        keys = ['game_name', 'review_count', 'paths', 'content_hash', 'scrape_started', 'scrape_finished',
+                'click_count', 'saved_at']
+        entry = dict(zip(keys, row))
+        entry['paths'] = json.loads(entry['paths'])
+        return entry
+
+    def review_count(self, game_name: str) -> Optional[int]:
+        with self._lock:
+            row = self._connection.execute('SELECT review_count FROM review_manifest WHERE game_name = ?',
+                                           (game_name,)).fetchone()
+        return row[0] if row else None
+
+    def review_counts(self) -> Dict[str, int]:
+        """Review count of every game in the manifest."""
+        with self._lock:
+            return dict(self._connection.execute('SELECT game_name, review_count FROM review_manifest').fetchall())
+
+    def scrape_times(self) -> Dict[str, float]:
+        """When each game's reviews were scraped (its save time when the scrape times are unknown)."""
+        with self._lock:
+            return dict(self._connection.execute(
+                'SELECT game_name, COALESCE(scrape_finished, saved_at) FROM review_manifest').fetchall())
+
+    def saved_since(self, saved_at: float) -> Dict[str, Tuple[str, float]]:
+        """Content hash and save time of every game saved after `saved_at`."""
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT game_name, content_hash, saved_at FROM review_manifest WHERE saved_at > ?',
+                (saved_at,)).fetchall()
+        return {game_name: (content_hash, saved) for game_name, content_hash, saved in rows}
+
+    def is_unchanged(self, game_name: str, content_hash: str) -> bool:
+        """Whether `game_name` was saved with the same reviews and its files are all still there."""
+        entry = self.get(game_name)
+        return (entry is not None and entry['content_hash'] == content_hash
+                and all(os.path.exists(path) for path in entry['paths'].values()))
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
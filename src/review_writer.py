@@ -0,0 +1,213 @@
+import csv
+import hashlib
+import itertools
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from openpyxl import Workbook
+
+from src.game_store import GAMES_REVIEWS_DIR
+from src.output_formats import REVIEW_COLUMN_TYPES, ParquetRowWriter, arrow_schema
+from src.review_cards import REVIEW_FIELDS
+
+logger = logging.getLogger(__name__)
+
+# Review column holding when the review was scraped (Unix time); relative review times count back from it
+SCRAPED_AT = 'scraped_at'
+
+# Folder of the per-game review spools of games still being scraped
+REVIEW_SPOOL_DIR = os.path.join(GAMES_REVIEWS_DIR, 'review_spool')
+
+
+def _tmp_path(path: str) -> str:
+    # Keep the extension, openpyxl and spreadsheet tools go by it
+    root, ext = os.path.splitext(path)
+    return f"{root}.tmp{ext}"
+
+
+def review_fingerprint(review: Dict[str, Any]) -> str:
+    """Identity of a review across scrapes: its author and title plus a hash of its content."""
+    content_hash = hashlib.sha1(str(review.get('content')).encode('utf-8')).hexdigest()
+    return f"{review.get('author')}\x1f{review.get('title')}\x1f{content_hash}"
+
+
+def stamp_reviews(reviews: List[Dict[str, Any]], scraped_at: Optional[float] = None) -> List[Dict[str, Any]]:
+    """Set the scrape time (now unless given) of each review that has none; returns `reviews`."""
+    scraped_at = time.time() if scraped_at is None else scraped_at
+    for review in reviews:
+        if review.get(SCRAPED_AT) in (None, ''):
+            review[SCRAPED_AT] = scraped_at
+    return reviews
+
+
+def reviews_digest(reviews: Iterable[Dict[str, Any]], digest=None):
+    """
+    Feed `reviews` into a sha256 digest (a new one unless given), one canonical JSON line each.
+
+    The scrape time is left out, so scraping the same reviews again gives the same digest.
+    """
+    digest = digest if digest is not None else hashlib.sha256()
+    for review in reviews:
+        content = {key: value for key, value in review.items() if key != SCRAPED_AT}
+        digest.update(json.dumps(content, sort_keys=True, ensure_ascii=False).encode('utf-8') + b'\n')
+    return digest
+
+
+def write_reviews(reviews: Iterable[Dict[str, Any]], xlsx_path: Optional[str] = None,
+                  csv_path: Optional[str] = None, parquet_path: Optional[str] = None,
+                  columns: Optional[List[str]] = None) -> int:
+    """
+    Stream reviews into Excel, CSV and/or Parquet files in one pass, without building a DataFrame.
+
+    Each file is written next to its final path and moved into place once complete, so a crash
+    never leaves a truncated file behind. Returns the number of rows written.
+    """
+    reviews = iter(reviews)
+    first = next(reviews, None)
+    if columns is None:
+        columns = list(first) if first is not None else list(REVIEW_FIELDS)
+    rows = itertools.chain([first], reviews) if first is not None else reviews
+
+    paths = [path for path in (xlsx_path, csv_path, parquet_path) if path]
+    for path in paths:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    workbook = sheet = csv_file = writer = parquet_writer = None
+    count = 0
+    try:
+        if xlsx_path:
+            workbook = Workbook(write_only=True)
+            sheet = workbook.create_sheet('Sheet1')
+            sheet.append(columns)
+        if csv_path:
+            csv_file = open(_tmp_path(csv_path), 'w', newline='', encoding='utf-8')
+            writer = csv.writer(csv_file)
+            writer.writerow(columns)
+        if parquet_path:
+            parquet_writer = ParquetRowWriter(_tmp_path(parquet_path), arrow_schema(REVIEW_COLUMN_TYPES, columns))
+
+        for review in rows:
+            row = [review.get(column) for column in columns]
+            if sheet is not None:
+                sheet.append(row)
+            if writer is not None:
+                writer.writerow(row)
+            if parquet_writer is not None:
+                parquet_writer.append(review)
+            count += 1
+
+        if csv_file is not None:
+            csv_file.flush()
+            os.fsync(csv_file.fileno())
+            csv_file.close()
+        if workbook is not None:
+            workbook.save(_tmp_path(xlsx_path))
+        if parquet_writer is not None:
+            parquet_writer.close()
+    except BaseException:
+        if csv_file is not None:
+            csv_file.close()
+        if parquet_writer is not None:
+            parquet_writer.abort()
+        for path in paths:
+            if os.path.exists(_tmp_path(path)):
+                os.remove(_tmp_path(path))
+        raise
+
+    for path in paths:
+        os.replace(_tmp_path(path), path)
+    return count
+
+
+class ReviewSpool:
+    """
+    Append-only NDJSON spool of one game's reviews, written batch by batch as they are harvested.
+
+    Each batch is one line `{"batch": n, "reviews": [...]}`, fsync'ed before `extend` returns,
+    so a scrape that dies part way keeps every harvested batch. The spool behaves like the review
+    list it replaces (`extend`, `len`) but keeps nothing in memory besides a running `content_hash`.
+
+    Opening a spool a previous run left behind resumes it: the first `resumed` reviews the new
+    run harvests are the ones already on disk (the store lists reviews in a fixed order and has to
+    be paged through from the start) and are dropped instead of written again. `finalize` writes
+    the output files from the spool and removes it.
+    """
+
+    def __init__(self, game_name: str, directory: str = REVIEW_SPOOL_DIR):
+        self.path = os.path.join(directory, f"{game_name}.ndjson")
+        os.makedirs(directory, exist_ok=True)
+        self._batches = 0
+        self._count = 0
+        self._digest = hashlib.sha256()
+        self._recover()
+        self.resumed = self._count
+        self._replay = self._count
+
+    def _recover(self) -> None:
+        """Count what is on disk and cut off a batch torn by a crash mid-write."""
+        if not os.path.exists(self.path):
+            return
+        valid_size = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    logger.warning(f"Dropping unreadable batch {self._batches + 1} in {self.path}")
+                    break
+                if not line.endswith(b'\n'):
+                    break
+                valid_size += len(line)
+                self._batches += 1
+                self._count += len(record['reviews'])
+                reviews_digest(record['reviews'], self._digest)
+        if valid_size < os.path.getsize(self.path):
+            with open(self.path, 'r+b') as f:
+                f.truncate(valid_size)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def content_hash(self) -> str:
+        """sha256 of the spooled reviews, equal to `reviews_digest` of the same list."""
+        return self._digest.hexdigest()
+
+    def extend(self, reviews: List[Dict[str, Any]]) -> None:
+        """Append one harvested batch and flush it to disk."""
+        if self._replay:
+            replayed = min(self._replay, len(reviews))
+            self._replay -= replayed
+            reviews = reviews[replayed:]
+        if not reviews:
+            return
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'batch': self._batches, 'reviews': reviews}, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self._batches += 1
+        self._count += len(reviews)
+        reviews_digest(reviews, self._digest)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                yield from json.loads(line)['reviews']
+
+    def finalize(self, xlsx_path: Optional[str] = None, csv_path: Optional[str] = None,
+                 parquet_path: Optional[str] = None) -> int:
+        """Write the spooled reviews to their final files atomically, then remove the spool."""
+        count = write_reviews(self, xlsx_path, csv_path, parquet_path)
+        self.discard()
+        return count
+
+    def discard(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self._batches = self._count = self._replay = 0
+        self._digest = hashlib.sha256()
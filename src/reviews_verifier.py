@@ -1,44 +1,61 @@
+import argparse
+import glob
 import os
 import re
 import time
-import pandas as pd
-from selenium import webdriver
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from selenium.common import NoSuchElementException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 import traceback
 
+from src.folder_watcher import WATCH_POLL_INTERVAL, FolderWatcher
+from src.output_formats import EXCEL, read_review_file
+from src.review_manifest import REVIEW_MANIFEST_PATH, ReviewManifest
+from src.review_writer import reviews_digest
 from src.selenium_reviews_extractor import MetaReviewsExtractor
+from src.verification_log import VerificationLog
+from src.waits import Waiter
+
+# Ratings and reviews summary of a Meta store page
+RATINGS_REVIEWS_XPATH = (
+    "//span[contains(@class, 'x16g9bbj') and contains(text(), 'ratings') and contains(text(), 'reviews')]"
+)
+
+# Games verified at once, each in its own pooled browser
+VERIFIER_WORKERS = 4
+
+# Seconds of manifest saves read again on each check, as the scrapers' saves may commit out of clock order
+MANIFEST_RESCAN_OVERLAP = 60.0
 
 
 class MetaReviewScraper:
-    def __init__(self, games_folder, output_log_path):
+    def __init__(self, games_folder, output_log_path, workers=VERIFIER_WORKERS, manifest=None):
         """
         Initialize the scraper with folder paths and logging
 
         Args:
-            games_folder (str): Path to folder containing Excel files
+            games_folder (str): Path to folder holding the scraped reviews and their manifest
             output_log_path (str): Path to log Excel file
+            workers (int): Games verified at once, each with its own pooled browser
+            manifest (ReviewManifest): Saved games and review counts, read instead of the review files
         """
         self.games_folder = games_folder
         self.output_log_path = output_log_path
+        self.workers = workers
+        self.manifest = manifest if manifest is not None else ReviewManifest(
+            os.path.join(games_folder, os.path.basename(REVIEW_MANIFEST_PATH)))
 
-        # Setup Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")  # Run in background
+        # Browsers are pooled by the extractor and shared by the verifying threads
+        self.meta_extractor = MetaReviewsExtractor(pool_size=workers)
 
-        # Setup WebDriver
-        self.driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
-            options=chrome_options
-        )
-
-        # Create output log if not exists
-        if not os.path.exists(output_log_path):
-            pd.DataFrame(columns=['filename', 'url', 'ratings', 'reviews', 'file_reviews', 'processed_at']).to_excel(
-                output_log_path, index=False)
+        # Results are committed to the log store in batches; the Excel log is exported from it
+        self.log = VerificationLog(os.path.splitext(output_log_path)[0] + '.db', output_log_path)
+        # Loaded once; every verified game is added as it is logged. Older logs name the game's Excel file
+        self.verified_hashes = {os.path.splitext(filename)[0]: content_hash
+                                for filename, content_hash in self.log.verified_hashes().items()}
+        self.pending_games = {}  # Game -> content hash of the saved reviews still to verify
+        self.manifest_checked_at = 0.0  # Latest manifest save already compared with the log
 
     def extract_reviews(self, meta_url):
         """
@@ -51,106 +68,187 @@ class MetaReviewScraper:
             tuple: (ratings, reviews) or (None, None) if extraction fails
         """
         try:
-            meta_extractor = MetaReviewsExtractor()
-            meta_extractor.start_driver()
-            meta_extractor.driver.get(meta_url)
-            print("Sleeping ...")
-            time.sleep(20)  # Wait for the page to load
+            with self.meta_extractor.driver_pool.driver() as driver:
+                driver.get(meta_url)
+                waiter = Waiter(driver, meta_url)
+                waiter.present('ratings', (By.XPATH, RATINGS_REVIEWS_XPATH))  # Wait for the page to load
 
-            try:
-                # Try to find the ratings and reviews span using multiple strategies
                 try:
-                    # Strategy 1: Direct class match
-                    ratings_reviews_span = meta_extractor.driver.find_element(
-                        By.XPATH,
-                        "//span[contains(@class, 'x16g9bbj') and contains(text(), 'ratings') and contains(text(), "
-                        "'reviews')]"
-                    )
-                except:
-                    print("Can't Find Number of Reviews.")
+                    # Try to find the ratings and reviews span using multiple strategies
+                    try:
+                        # Strategy 1: Direct class match
+                        ratings_reviews_span = driver.find_element(By.XPATH, RATINGS_REVIEWS_XPATH)
+                    except:
+                        print(f"Can't Find Number of Reviews. ({meta_url}, {waiter.stats.summary()})")
+                        return None, None
+
+                    # Extract text and parse ratings and reviews
+                    ratings_reviews_text = ratings_reviews_span.text
+                    match = re.search(r'(\d+)\s*ratings,\s*(\d+)\s*reviews', ratings_reviews_text)
+                    if match:
+                        ratings, reviews = match.groups()
+                        print(f"Ratings: {ratings}, Reviews: {reviews} ({waiter.stats.summary()})")
+                        return ratings, reviews
+                except NoSuchElementException:
+                    print("No more 'Show more reviews' buttons found.")
                     return None, None
 
-                # Extract text and parse ratings and reviews
-                ratings_reviews_text = ratings_reviews_span.text
-                match = re.search(r'(\d+)\s*ratings,\s*(\d+)\s*reviews', ratings_reviews_text)
-                if match:
-                    ratings, reviews = match.groups()
-                    print(f"Ratings: {ratings}, Reviews: {reviews}")
-                    return ratings, reviews
-            except NoSuchElementException:
-                print("No more 'Show more reviews' buttons found.")
-                return None, None
-
         except Exception as e:
             print(f"Error extracting reviews: {e}")
             traceback.print_exc()
 
         return None, None
 
-    def process_files(self):
-        """
-        Process new Excel files in the games folder
-        """
-        # Read existing log
-        log_df = pd.read_excel(self.output_log_path)
-        processed_files = set(log_df['filename'])
-
-        # Find new files
-        for filename in os.listdir(self.games_folder):
-            if filename.endswith('.xlsx') and filename not in processed_files:
-                file_path = os.path.join(self.games_folder, filename)
-
-                try:
-                    # Extract ID from filename
-                    meta_id = os.path.splitext(filename)[0]
-                    meta_url = f"https://www.meta.com/experiences/{meta_id}"
-
-                    # Read Excel file to count reviews
-                    df = pd.read_excel(file_path)
-                    file_review_count = len(df)
+    def needs_verification(self, game, content_hash):
+        """Whether `game` was never verified, or was verified with other reviews than the saved ones"""
+        if game not in self.verified_hashes:
+            return True
+        verified_hash = self.verified_hashes[game]
+        # Results logged before hashes were kept count as verified
+        return verified_hash is not None and verified_hash != content_hash
 
-                    # Extract online reviews
-                    ratings, reviews = self.extract_reviews(meta_url)
+    def new_games(self):
+        """
+        Games saved since they were last verified, or never verified.
 
-                    # Log results
-                    new_entry = pd.DataFrame({
-                        'filename': [filename],
-                        'url': [meta_url],
-                        'ratings': [ratings],
-                        'reviews': [reviews],
-                        'file_reviews': [file_review_count],
-                        'processed_at': [pd.Timestamp.now()]
-                    })
+        Every save records the game in the review manifest, whatever the review formats, so the
+        games are listed from it rather than from the review files. Only the manifest rows saved
+        since the last check are read, and a game is listed again only when its content hash changed.
+        """
+        saved = self.manifest.saved_since(self.manifest_checked_at - MANIFEST_RESCAN_OVERLAP)
+        for game, (content_hash, saved_at) in saved.items():
+            self.manifest_checked_at = max(self.manifest_checked_at, saved_at)
+            if self.needs_verification(game, content_hash):
+                self.pending_games[game] = content_hash
+            else:
+                self.pending_games.pop(game, None)
+        return sorted(self.pending_games)
+
+    def migrate_excel_reviews(self):
+        """
+        Record the per-game Excel review files saved before the review manifest existed.
 
-                    log_df = pd.concat([log_df, new_entry], ignore_index=True)
-                    log_df.to_excel(self.output_log_path, index=False)
+        A one-time migration, run with --migrate-excel: only `xlsx_games_reviews/<game>.xlsx` files of
+        games missing from the manifest are read. Verification itself never opens a review file.
 
-                    print(f"Processed {filename}: {reviews} online reviews, {file_review_count} file reviews")
+        Returns:
+            int: Number of games added to the manifest
+        """
+        known = self.manifest.review_counts()
+        migrated = 0
+        for path in sorted(glob.glob(os.path.join(self.games_folder, 'xlsx_games_reviews', '*.xlsx'))):
+            game = os.path.splitext(os.path.basename(path))[0]
+            if game in known or game.endswith('.tmp'):
+                continue
+            try:
+                reviews = read_review_file(path)
+            except Exception as e:
+                print(f"Could not read {path}: {e}")
+                continue
+            saved_at = os.path.getmtime(path)
+            self.manifest.record(game, len(reviews), {EXCEL: path}, reviews_digest(reviews).hexdigest(),
+                                 scrape_finished=saved_at)
+            migrated += 1
+        print(f"Added {migrated} games saved as Excel to the review manifest")
+        return migrated
+
+    def verify_file(self, meta_id):
+        """Compare the saved review count of one game with the count on its store page"""
+        meta_url = f"https://www.meta.com/experiences/{meta_id}"
+        entry = self.manifest.get(meta_id) or {}
+        file_review_count = entry.get('review_count')
+
+        # Extract online reviews
+        ratings, reviews = self.extract_reviews(meta_url)
+
+        print(f"Processed {meta_id}: {reviews} online reviews, {file_review_count} file reviews")
+        return {
+            'filename': meta_id,
+            'url': meta_url,
+            'ratings': ratings,
+            'reviews': reviews,
+            'file_reviews': file_review_count,
+            'content_hash': entry.get('content_hash'),
+            'processed_at': time.time(),
+        }
+
+    def process_files(self, games=None):
+        """
+        Verify the newly saved games, `workers` at a time
 
+        Returns:
+            int: Number of games verified
+        """
+        games = self.new_games() if games is None else games
+        if not games:
+            return 0
+
+        started = time.monotonic()
+        verified = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {executor.submit(self.verify_file, game): game for game in games}
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                    self.log.add(result)
+                    self.verified_hashes[futures[future]] = result['content_hash']
+                    if self.pending_games.get(futures[future]) == result['content_hash']:
+                        del self.pending_games[futures[future]]
+                    verified += 1
                 except Exception as e:
-                    print(f"Error processing {filename}: {e}")
+                    print(f"Error processing {futures[future]}: {e}")
 
-    def continuous_monitoring(self, interval=60):
+        self.log.export()
+        elapsed = time.monotonic() - started
+        rate = f"{verified / (elapsed / 60):.1f} games/min" if elapsed else "instantly"
+        print(f"Verified {verified} games in {elapsed:.1f}s ({rate}) with {self.workers} browsers")
+        return verified
+
+    def continuous_monitoring(self, interval=WATCH_POLL_INTERVAL):
         """
-        Continuously monitor folder for new files
+        Continuously monitor the review manifest for newly saved or re-saved games
+
+        Games already saved are verified first, then the manifest rows saved since are checked
+        whenever its database changes, from file system events (or folder scans without watchdog).
 
         Args:
-            interval (int): Seconds between checks, default 60
+            interval (float): Seconds between folder scans when watchdog is not installed
         """
-        while True:
+        manifest_name = os.path.basename(self.manifest.db_path)
+        with FolderWatcher(os.path.dirname(os.path.abspath(self.manifest.db_path)),
+                           (manifest_name, manifest_name + '-wal'), poll_interval=interval) as watcher:
             self.process_files()
-            time.sleep(interval)
+            while True:
+                if watcher.wait_ready():
+                    self.process_files()
 
     def __del__(self):
-        """Close browser on object deletion"""
-        if hasattr(self, 'driver'):
-            self.driver.quit()
+        """Close browsers and the log store on object deletion"""
+        if hasattr(self, 'meta_extractor'):
+            self.meta_extractor.close_driver_pool()
+        if hasattr(self, 'log'):
+            self.log.close()
+        if hasattr(self, 'manifest'):
+            self.manifest.close()
 
 
 # Example Usage
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check scraped review counts against the Meta store pages.")
+    parser.add_argument('--workers', type=int, default=VERIFIER_WORKERS, help="Browsers verifying games at once")
+    parser.add_argument('--once', action='store_true', help="Verify the new games once instead of monitoring")
+    parser.add_argument('--migrate-excel', action='store_true',
+                        help="First add the Excel review files saved before the review manifest to it")
+    args = parser.parse_args()
+
     scraper = MetaReviewScraper(
         games_folder=os.path.join(os.path.dirname(__file__), "..", "Games Reviews"),
-        output_log_path=os.path.join(os.path.dirname(__file__), "..", "Reviews_Verification.xlsx")
+        output_log_path=os.path.join(os.path.dirname(__file__), "..", "Reviews_Verification.xlsx"),
+        workers=args.workers
     )
-    scraper.continuous_monitoring()
+    if args.migrate_excel:
+        scraper.migrate_excel_reviews()
+    if args.once:
+        scraper.process_files()
+    else:
+        scraper.continuous_monitoring()
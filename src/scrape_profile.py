@@ -0,0 +1,112 @@
+import json
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from selenium.webdriver.chrome.options import Options
+
+from src.review_api import PERFORMANCE_LOGGING
+
+# URL patterns (Network.setBlockedURLs wildcards) of the resource types a scrape never reads
+RESOURCE_TYPE_PATTERNS = {
+    'image': ['*.jpg', '*.jpg?*', '*.jpeg', '*.jpeg?*', '*.png', '*.png?*', '*.gif', '*.gif?*', '*.webp',
+              '*.webp?*', '*.svg', '*.svg?*', '*.ico', '*.avif', '*.avif?*'],
+    'media': ['*.mp4', '*.mp4?*', '*.webm', '*.webm?*', '*.m3u8', '*.m3u8?*', '*.mpd', '*.mp3', '*.ogg'],
+    'font': ['*.woff', '*.woff?*', '*.woff2', '*.woff2?*', '*.ttf', '*.ttf?*', '*.otf', '*.eot'],
+}
+
+# Resource types blocked by the default profile
+BLOCKED_RESOURCE_TYPES = ('image', 'media', 'font')
+
+# Analytics and ad hosts blocked by the default profile
+BLOCKED_URL_PATTERNS = (
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*connect.facebook.net*',
+    '*/ajax/bz*', '*/falco/*',
+)
+
+
+class ScrapeProfile:
+    """
+    Browser settings for scraping: what Chrome downloads, how long `get` waits, what it runs.
+
+    Resource types are blocked by URL pattern through CDP (images are also switched off with a
+    content setting, since CDN image URLs often carry no extension). The eager page-load strategy
+    returns from `get` at DOMContentLoaded. With `measure`, the DevTools network events are
+    recorded so `network_bytes` can report what each game downloaded.
+    """
+
+    def __init__(self, blocked_resource_types: Iterable[str] = BLOCKED_RESOURCE_TYPES,
+                 blocked_url_patterns: Iterable[str] = BLOCKED_URL_PATTERNS, page_load_strategy: str = 'eager',
+                 disable_gpu: bool = True, disable_extensions: bool = True, measure: bool = True):
+        self.blocked_resource_types = tuple(blocked_resource_types)
+        self.blocked_url_patterns = tuple(blocked_url_patterns)
+        self.page_load_strategy = page_load_strategy
+        self.disable_gpu = disable_gpu
+        self.disable_extensions = disable_extensions
+        self.measure = measure
+
+    @property
+    def blocked_urls(self) -> List[str]:
+        urls = list(self.blocked_url_patterns)
+        for resource_type in self.blocked_resource_types:
+            urls.extend(RESOURCE_TYPE_PATTERNS[resource_type])
+        return urls
+
+    @property
+    def ready_states(self) -> Tuple[str, ...]:
+        """document.readyState values at which a page counts as loaded."""
+        return ('interactive', 'complete') if self.page_load_strategy == 'eager' else ('complete',)
+
+    def chrome_options(self) -> Options:
+        chrome_options = Options()
+        chrome_options.add_argument('--headless')
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.page_load_strategy = self.page_load_strategy
+        if self.disable_gpu:
+            chrome_options.add_argument('--disable-gpu')
+        if self.disable_extensions:
+            chrome_options.add_argument('--disable-extensions')
+            chrome_options.add_argument('--disable-component-extensions-with-background-pages')
+        if 'image' in self.blocked_resource_types:
+            chrome_options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+        if 'media' in self.blocked_resource_types:
+            chrome_options.add_argument('--autoplay-policy=user-gesture-required')
+        if self.measure:
+            chrome_options.set_capability(*PERFORMANCE_LOGGING)
+        return chrome_options
+
+    def apply(self, driver) -> None:
+        """Install the URL blocklist in a freshly started browser."""
+        blocked_urls = self.blocked_urls
+        if blocked_urls:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_urls})
+
+
+# Named profiles selectable from the command line
+SCRAPE_PROFILES = {
+    'lean': ScrapeProfile(),
+    'full': ScrapeProfile(blocked_resource_types=(), blocked_url_patterns=(), page_load_strategy='normal',
+                          disable_gpu=False, disable_extensions=False),
+}
+
+
+def network_bytes(log_entries: List[Dict]) -> Tuple[int, int]:
+    """Bytes received over the network and number of finished responses in performance log entries."""
+    received = responses = 0
+    for entry in log_entries:
+        message = json.loads(entry['message'])['message']
+        if message.get('method') == 'Network.loadingFinished':
+            received += int(message['params'].get('encodedDataLength', 0))
+            responses += 1
+    return received, responses
+
+
+def js_heap_mb(driver) -> Optional[float]:
+    """Used JS heap of the page's renderer, from the DevTools performance metrics."""
+    try:
+        driver.execute_cdp_cmd('Performance.enable', {})
+        metrics = driver.execute_cdp_cmd('Performance.getMetrics', {})['metrics']
+    except Exception:
+        return None
+    values = {metric['name']: metric['value'] for metric in metrics}
+    return values['JSHeapUsedSize'] / 1024 / 1024 if 'JSHeapUsedSize' in values else None
@@ -1,168 +1,360 @@
-import json
+import argparse
+import contextlib
 import logging
-import msvcrt
 import os
-import re
+import threading
 import time
-from functools import partial
-from multiprocessing import Pool
-from typing import List, Dict, Any
-from selenium.webdriver.support import expected_conditions as EC
+from functools import lru_cache, partial
+from typing import List, Tuple
 
-import numpy as np
 import pandas as pd
-from selenium import webdriver
 from selenium.common import NoSuchElementException
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.wait import WebDriverWait
+
+from src.driver_pool import DriverPool, driver_memory_mb
+from src.file_lock import file_lock
+from src.game_store import GAMES_REVIEWS_DIR, GameDetailsStore
+from src.metrics import METRICS_FORMAT, METRICS_FORMATS, MetricsWriter, metrics, profiled
+from src.processed_index import ProcessedGamesIndex, SKIPPED
+from src.review_manifest import ReviewManifest
+from src.review_api import PERFORMANCE_LOGGING, ReviewApiClient, ReviewApiError, capture_review_request
+from src.review_cards import (AUTHOR_XPATH, CONTENT_XPATH, EXTRACT_WITH_SCRIPT, FIELD_XPATHS, HARVESTED_ATTRIBUTE,
+                              HELPFULNESS_XPATH, LOADED_REVIEWS_JS, PRUNE_REVIEWS_JS, REVIEW_CARD_XPATH,
+                              REVIEW_FIELDS, SERIALIZE_REVIEWS_JS, SHOW_MORE_XPATH, STAR_CLASS, STARS_CLASS,
+                              TIME_XPATH, TITLE_XPATH)
+from src.output_formats import (CSV, DEFAULT_REVIEW_FORMATS, EXCEL, PARQUET, REVIEWS_DATASET_DIR, ReviewDataset,
+                                catalog_exists, read_catalog, read_review_file)
+from src.review_writer import ReviewSpool, review_fingerprint, reviews_digest, stamp_reviews, write_reviews
+from src.scrape_profile import SCRAPE_PROFILES, ScrapeProfile, js_heap_mb, network_bytes
+from src.waits import Waiter, WaitStats
+from src.work_scheduler import WorkScheduler
 
 # Maximum number of "Show more reviews" clicks
 MAX_SMR_CLICKS = 2000
 
-# Sleep Time post "Show more reviews" clicks to let content load
-SMR_SLEEP_TIME = 15
-
 # Determine number of processes
 NUM_PROCESSES = max(os.cpu_count() - 9, 1)
 
+# "Show more reviews" clicks between two harvests of the newly loaded reviews
+HARVEST_INTERVAL = 100
+
+# Harvest interval when harvested cards are pruned from the DOM, so the page holds few unharvested ones
+PRUNED_HARVEST_INTERVAL = 10
+
+# Harvest interval of incremental scrapes, which stop at the first batch holding a stored review
+INCREMENTAL_HARVEST_INTERVAL = 1
+
+# Harvested review cards left in the DOM when pruning, so the list keeps an anchor for new cards
+PRUNE_WINDOW = 50
+
+# Review backends: click through the reviews in Chrome, or replay the review request over HTTP
+REVIEW_BACKEND_BROWSER = 'browser'
+REVIEW_BACKEND_API = 'api'
+
+# Game details panel of a Meta store page
+GAME_DETAILS_XPATH = (
+    ".//div[contains(@class, 'x78zum5') and contains(@class, 'x1l7klhg') and contains(@class, 'x1iyjqo2') "
+    "and contains(@class, 'x2lah0s') and contains(@class, 'x1a02dak') and contains(@class, 'xd2bs7b') and "
+    "contains(@class, 'x5bj0eh') and contains(@class, 'x1sje56t') and contains(@class, 'x2b88hg') and "
+    "contains(@class, 'x17tu2g0') and contains(@class, 'xnjo89n') and contains(@class, 'xo2o5nc') and "
+    "contains(@class, 'xv9pgs7') and contains(@class, 'xjfzuef')]"
+)
+
+
+# Logger of the per-game scrape messages, configured once per process by `game_logger`
+_game_logger = logging.getLogger('game_scraper')
+_game_logger_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4096)
+def game_logger(game_id: str) -> logging.LoggerAdapter:
+    """Adapter adding `game_id` to the messages of the shared per-game logger"""
+    with _game_logger_lock:
+        if not _game_logger.handlers:
+            handler = logging.StreamHandler()
+            handler.setLevel(logging.INFO)
+            handler.setFormatter(logging.Formatter('[%(asctime)s] [%(game_id)s] - %(message)s'))
+            _game_logger.addHandler(handler)
+            _game_logger.setLevel(logging.INFO)
+            _game_logger.propagate = False  # Already formatted with the game id, not again by the root handler
+    return logging.LoggerAdapter(_game_logger, {'game_id': game_id})
+
 
 class MetaReviewsExtractor:
-    def __init__(self):
-        self.chrome_options = Options()
-        self.chrome_options.add_argument('--headless')
-        self.chrome_options.add_argument('--no-sandbox')
-        self.chrome_options.add_argument('--disable-ev-shm-usage')
+    def __init__(self, game_store: GameDetailsStore = None, processed_index: ProcessedGamesIndex = None,
+                 driver_pool: DriverPool = None, extraction_mode: str = EXTRACT_WITH_SCRIPT,
+                 review_backend: str = REVIEW_BACKEND_BROWSER, profile: ScrapeProfile = None,
+                 review_formats: Tuple[str, ...] = DEFAULT_REVIEW_FORMATS, pool_size: int = 1,
+                 review_manifest: ReviewManifest = None, output_dir: str = GAMES_REVIEWS_DIR):
+        self.review_formats = review_formats
+        self.output_dir = output_dir  # Folder holding the per-game review files and the reviews dataset
+        self.pool_size = pool_size
+        self.profile = profile or SCRAPE_PROFILES['lean']
+        self.chrome_options = self.profile.chrome_options()
         self.driver = None
+        self.extraction_mode = extraction_mode
+        self.review_backend = review_backend
+        if review_backend == REVIEW_BACKEND_API:
+            # The review request is captured from the DevTools network events
+            self.chrome_options.set_capability(*PERFORMANCE_LOGGING)
+        self.performance_logging = self.profile.measure or review_backend == REVIEW_BACKEND_API
+        self.wait_stats = WaitStats()  # Waits of the last scraped game
+        self.network_stats = {'bytes': 0, 'responses': 0}  # Downloads of the last scraped game
+        self.scrape_stats = {'started_at': None, 'finished_at': None, 'clicks': 0}  # Last scraped game
+        self.stage_seconds = {}  # Seconds spent in each stage of the last scraped game
+        self._driver_pool = driver_pool
+        self._review_manifest = review_manifest
+        self._game_store = game_store
+        self._processed_index = processed_index
+
+    @property
+    def game_store(self) -> GameDetailsStore:
+        """Store the scraped game details are submitted to, opened on first use"""
+        if self._game_store is None:
+            self._game_store = GameDetailsStore()
+        return self._game_store
+
+    def close_game_store(self):
+        """Commit the pending game details and close the store"""
+        if self._game_store is not None:
+            self._game_store.close()
+            self._game_store = None
+
+    @property
+    def processed_index(self) -> ProcessedGamesIndex:
+        """Index of processed and skipped games, opened (and built if needed) on first use"""
+        if self._processed_index is None:
+            self._processed_index = ProcessedGamesIndex()
+        return self._processed_index
+
+    def close_processed_index(self):
+        if self._processed_index is not None:
+            self._processed_index.close()
+            self._processed_index = None
+
+    @property
+    def review_manifest(self) -> ReviewManifest:
+        """Per-game record of the saved reviews, opened on first use"""
+        if self._review_manifest is None:
+            self._review_manifest = ReviewManifest()
+        return self._review_manifest
+
+    def close_review_manifest(self):
+        if self._review_manifest is not None:
+            self._review_manifest.close()
+            self._review_manifest = None
+
+    @property
+    def driver_pool(self) -> DriverPool:
+        """Browsers reused across games, started on first use"""
+        if self._driver_pool is None:
+            self._driver_pool = DriverPool(lambda: self.chrome_options, size=self.pool_size,
+                                           on_start=self.profile.apply)
+        return self._driver_pool
 
     def start_driver(self):
-        """Initializes the Driver"""
-        self.driver = webdriver.Chrome(options=self.chrome_options)
+        """Takes a clean Driver from the pool"""
+        self.driver = self.driver_pool.acquire()
 
     def close_driver(self):
-        """Close the Webdriver"""
+        """Return the Webdriver to the pool"""
         if self.driver:
-            self.driver.quit()
+            self.driver_pool.release(self.driver)
+            self.driver = None
+
+    def read_network_log(self):
+        """Drain the performance log, adding what it shows was downloaded to `network_stats`"""
+        if not self.performance_logging or not self.driver:
+            return []
+        entries = self.driver.get_log('performance')
+        received, responses = network_bytes(entries)
+        self.network_stats['bytes'] += received
+        self.network_stats['responses'] += responses
+        return entries
+
+    def resource_summary(self):
+        """Downloads and browser memory of the game being scraped"""
+        self.read_network_log()
+        summary = (f"Downloaded {self.network_stats['bytes'] / 1024 / 1024:.1f} MiB in "
+                   f"{self.network_stats['responses']} responses")
+        heap_mb = js_heap_mb(self.driver)
+        if heap_mb is not None:
+            summary += f" | JS heap {heap_mb:.0f} MiB"
+        browser_mb = driver_memory_mb(self.driver)
+        if browser_mb is not None:
+            summary += f" | browser {browser_mb:.0f} MiB"
+        return summary
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Time a stage of the current game into `stage_seconds` and the `review_stage_seconds` histogram"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            metrics.observe('review_stage_seconds', seconds, stage=name)
+            self.stage_seconds[name] = self.stage_seconds.get(name, 0.0) + seconds
+
+    def close_driver_pool(self):
+        """Return the Webdriver and quit every pooled browser"""
+        self.close_driver()
+        if self._driver_pool is not None:
+            self._driver_pool.log_stats()
+            self._driver_pool.close()
+            self._driver_pool = None
 
     def extract_reviews(self, url):
         game_id = url.split('/')[-1].split('?')[0]
         logger = self.setup_logger(game_id)
         logger.info("Trying to extract reviews.")
+        if self.extraction_mode == EXTRACT_WITH_SCRIPT:
+            try:
+                return self.serialize_reviews(REVIEW_CARD_XPATH)
+            except Exception as e:
+                logger.warning(f"Script extraction failed, falling back to WebDriver lookups - {e}")
         # Locate all review containers with the specified classes
-        review_divs = self.driver.find_elements(
-            By.XPATH,
-            "//div[contains(@class, 'xeuugli') and contains(@class, 'x2lwn1j') and contains(@class, 'x78zum5') and "
-            "contains(@class, 'xdt5ytf') and contains(@class, 'xgpatz3') and contains(@class, 'x40hh3e')]"
+        review_divs = self.driver.find_elements(By.XPATH, REVIEW_CARD_XPATH)
+        return [self.extract_review(review_div) for review_div in review_divs]
+
+    def serialize_reviews(self, card_xpath, marker=None):
+        """Fields of every card matching `card_xpath`, read by one script in the browser"""
+        reviews = self.driver.execute_script(
+            SERIALIZE_REVIEWS_JS, card_xpath, FIELD_XPATHS, STARS_CLASS, STAR_CLASS, marker
         )
+        return [{field: review[field] for field in REVIEW_FIELDS} for review in reviews]
 
-        reviews = []
-        for review_div in review_divs:
-            # Extract title
-            try:
-                title_element = review_div.find_element(
-                    By.XPATH,
-                    ".//div[@class='x16g9bbj x17gzxuv xv6bue1 xm5vtmc xsp84uj x1j402mz x1wsgf3v x14imz66 x1k03ns3 "
-                    "xcxolhg xjbavb x1npfmwo x16b4c32 xrm2kyc x1i6xp69 xvyeec0 x12429cg x6tc29j xbq7h4v x6jdkww "
-                    "xq9mrsl']"
-                )
-                title = title_element.text
-            except:
+    def harvest_new_reviews(self, url):
+        """
+        Extract only the reviews loaded since the previous harvest.
+
+        Harvested cards are tagged with HARVESTED_ATTRIBUTE, so each card is read once and the
+        total cost grows linearly with the number of reviews instead of re-reading the page.
+        """
+        game_id = url.split('/')[-1].split('?')[0]
+        logger = self.setup_logger(game_id)
+        with self.stage('extraction'):
+            new_cards_xpath = f"{REVIEW_CARD_XPATH}[not(@{HARVESTED_ATTRIBUTE})]"
+            if self.extraction_mode == EXTRACT_WITH_SCRIPT:
                 try:
-                    title = review_div.text.split('\n')[0]
-                except:
-                    title = 'N/A'
+                    reviews = stamp_reviews(self.serialize_reviews(new_cards_xpath, HARVESTED_ATTRIBUTE))
+                    logger.info(f"Harvested {len(reviews)} new reviews.")
+                    return reviews
+                except Exception as e:
+                    logger.warning(f"Script extraction failed, falling back to WebDriver lookups - {e}")
 
-            # Extract rating (stars)
+            review_divs = self.driver.find_elements(By.XPATH, new_cards_xpath)
+            reviews = stamp_reviews([self.extract_review(review_div) for review_div in review_divs])
+            self.driver.execute_script(
+                f"for (const card of arguments[0]) card.setAttribute('{HARVESTED_ATTRIBUTE}', '');", review_divs
+            )
+            logger.info(f"Harvested {len(reviews)} new reviews.")
+            return reviews
+
+    def stored_reviews(self, game_name):
+        """
+        Reviews saved by the last scrape of `game_name`, from the first readable file the manifest lists.
+
+        Each keeps the time it was scraped; reviews saved before the scrape time was recorded per review
+        get the time of the scrape that saved them.
+        """
+        entry = self.review_manifest.get(game_name)
+        paths = [entry['paths'][output_format] for output_format in (PARQUET, CSV, EXCEL)
+                 if entry and output_format in entry['paths']]
+        directory_path = self.output_dir
+        paths.append(os.path.join(directory_path, 'xlsx_games_reviews', game_name + '.xlsx'))
+        for path in paths:
+            if os.path.exists(path):
+                try:
+                    reviews = read_review_file(path)
+                except Exception as e:
+                    self.setup_logger(game_name).warning(f"Could not read stored reviews {path}: {str(e)}")
+                    continue
+                saved_at = (entry['scrape_finished'] or entry['saved_at']) if entry else os.path.getmtime(path)
+                return stamp_reviews(reviews, saved_at)
+        return []
+
+    @staticmethod
+    def unknown_reviews(batch, known):
+        """Reviews of `batch` whose fingerprint is not in `known`, and whether any of them was"""
+        new = [review for review in batch if review_fingerprint(review) not in known]
+        return new, len(new) < len(batch)
+
+    def loaded_review_count(self):
+        """Review cards loaded so far, including the ones pruned from the DOM"""
+        return int(self.driver.execute_script(LOADED_REVIEWS_JS, REVIEW_CARD_XPATH))
+
+    def prune_harvested_reviews(self, keep=PRUNE_WINDOW):
+        """Remove harvested review cards from the DOM except the last `keep`; returns how many were removed"""
+        return self.driver.execute_script(PRUNE_REVIEWS_JS, f"{REVIEW_CARD_XPATH}[@{HARVESTED_ATTRIBUTE}]", keep)
+
+    def extract_review(self, review_div):
+        """Fields of one review card"""
+        # Extract title
+        try:
+            title_element = review_div.find_element(By.XPATH, TITLE_XPATH)
+            title = title_element.text
+        except:
             try:
-                stars_div = review_div.find_element(By.CLASS_NAME, 'x3nfvp2')
-                rating = len(stars_div.find_elements(By.CLASS_NAME, 'xjbqb8w'))
+                title = review_div.text.split('\n')[0]
             except:
-                rating = 0
+                title = 'N/A'
+
+        # Extract rating (stars)
+        try:
+            stars_div = review_div.find_element(By.CLASS_NAME, STARS_CLASS)
+            rating = len(stars_div.find_elements(By.CLASS_NAME, STAR_CLASS))
+        except:
+            rating = 0
 
-            # Extract time
+        # Extract time
+        try:
+            time_element = review_div.find_element(By.XPATH, TIME_XPATH)
+            review_time = time_element.text
+        except:
             try:
-                time_element = review_div.find_element(
-                    By.XPATH,
-                    ".//span[contains(@class, 'x16g9bbj') and contains(@class, 'x17gzxuv') and contains(@class, "
-                    "'x3a6nna') and contains(@class, 'xm5vtmc') and contains(@class, 'x1t2x7uc') and contains(@class, "
-                    "'x1o1n6r0') and contains(@class, 'x1wsgf3v') and contains(@class, 'x1c773n9') and contains("
-                    "@class, 'x1k03ns3') and contains(@class, 'xpbi8i2') and contains(@class, 'x9820fh') and "
-                    "contains(@class, 'x1npfmwo') and contains(@class, 'xhj0du5') and contains(@class, 'xrm2kyc') and "
-                    "contains(@class, 'xjprkx4') and contains(@class, 'xlu1awn') and contains(@class, 'x12429cg') and "
-                    "contains(@class, 'x6tc29j') and contains(@class, 'xbq7h4v') and contains(@class, 'x6jdkww') and "
-                    "contains(@class, 'xq9mrsl')]"
-                )
-                review_time = time_element.text
+                review_time = review_div.text.split('\n')[1]
             except:
-                try:
-                    review_time = review_div.text.split('\n')[1]
-                except:
-                    review_time = 'N/A'
+                review_time = 'N/A'
 
-            # Extract review comments
+        # Extract review comments
+        try:
+            review_element = review_div.find_element(By.XPATH, CONTENT_XPATH)
+            review_content = review_element.text
+        except:
             try:
-                review_element = review_div.find_element(
-                    By.XPATH,
-                    ".//div[@class='x17gzxuv x3a6nna xm5vtmc x1t2x7uc x1o1n6r0 x1wsgf3v x1c773n9 x1k03ns3 xpbi8i2 "
-                    "x9820fh x1npfmwo xhj0du5 xrm2kyc xjprkx4 xlu1awn']"
-                )
-                review_content = review_element.text
+                review_content = review_div.text.split('\n')[2]
             except:
-                try:
-                    review_content = review_div.text.split('\n')[2]
-                except:
-                    review_content = 'N/A'
+                review_content = 'N/A'
 
-            # Extract author
+        # Extract author
+        try:
+            author_element = review_div.find_element(By.XPATH, AUTHOR_XPATH)
+            author = author_element.text
+        except:
             try:
-                author_element = review_div.find_element(
-                    By.XPATH,
-                    ".//span[contains(@class, 'x16g9bbj') and contains(@class, 'x17gzxuv') and contains(@class, "
-                    "'x1rujz1s') and contains(@class, 'xm5vtmc') and contains(@class, 'x3voqp2') and contains(@class, "
-                    "'x658qfi') and contains(@class, 'x1wsgf3v') and contains(@class, 'xn1wy4v') and contains(@class, "
-                    "'x1k03ns3') and contains(@class, 'xpbi8i2') and contains(@class, 'xh2n1af') and contains(@class, "
-                    "'x1npfmwo') and contains(@class, 'xg94uf4') and contains(@class, 'xrm2kyc') and contains(@class, "
-                    "'xjprkx4') and contains(@class, 'xawl3gl') and contains(@class, 'x12429cg') and contains(@class, "
-                    "'x6tc29j') and contains(@class, 'xbq7h4v') and contains(@class, 'x6jdkww') and contains(@class, "
-                    "'xq9mrsl')]"
-                )
-                author = author_element.text
+                author = review_div.text.split('\n')[3]
             except:
-                try:
-                    author = review_div.text.split('\n')[3]
-                except:
-                    author = 'N/A'
+                author = 'N/A'
 
-            # Extract helpfulness
+        # Extract helpfulness
+        try:
+            helpfulness_element = review_div.find_element(By.XPATH, HELPFULNESS_XPATH)
+            helpfulness = helpfulness_element.text
+        except:
             try:
-                helpfulness_element = review_div.find_element(
-                    By.XPATH,
-                    ".//span[contains(@class, 'x1heor9g') and contains(@class, 'x17gzxuv') and contains(@class, "
-                    "'x1rujz1s') and contains(@class, 'xex5isp') and contains(@class, 'xsp84uj') and contains(@class, "
-                    "'x658qfi') and contains(@class, 'x1wsgf3v') and contains(@class, 'xn1wy4v') and contains(@class, "
-                    "'xby3lk6') and contains(@class, 'xcxolhg') and contains(@class, 'xh2n1af') and contains(@class, "
-                    "'x1npfmwo') and contains(@class, 'xg94uf4') and contains(@class, 'x1yyhlu9') and contains(@class, "
-                    "'x1i6xp69') and contains(@class, 'xawl3gl') and contains(@class, 'x12429cg') and contains(@class, "
-                    "'x6tc29j') and contains(@class, 'xbq7h4v') and contains(@class, 'x6jdkww') and contains(@class, "
-                    "'xq9mrsl')]"
-                )
-                helpfulness = helpfulness_element.text
+                helpfulness = review_div.text.split('\n')[3]
             except:
-                try:
-                    helpfulness = review_div.text.split('\n')[3]
-                except:
-                    helpfulness = 'N/A'
-
-            reviews.append({
-                'title': title,
-                'rating': rating,
-                'time': review_time,
-                'content': review_content,
-                'author': author,
-                'helpful_votes': helpfulness
-            })
+                helpfulness = 'N/A'
 
-        return reviews
+        return {
+            'title': title,
+            'rating': rating,
+            'time': review_time,
+            'content': review_content,
+            'author': author,
+            'helpful_votes': helpfulness
+        }
 
     def extract_ad(self, data):
         # Define the keys we want to extract
@@ -191,14 +383,7 @@ class MetaReviewsExtractor:
         game_id = url.split('/')[-1].split('?')[0]
         logger = self.setup_logger(game_id)
         logger.info("Trying to game details.")
-        target_div = self.driver.find_element(
-            By.XPATH,
-            ".//div[contains(@class, 'x78zum5') and contains(@class, 'x1l7klhg') and contains(@class, 'x1iyjqo2') "
-            "and contains(@class, 'x2lah0s') and contains(@class, 'x1a02dak') and contains(@class, 'xd2bs7b') and "
-            "contains(@class, 'x5bj0eh') and contains(@class, 'x1sje56t') and contains(@class, 'x2b88hg') and "
-            "contains(@class, 'x17tu2g0') and contains(@class, 'xnjo89n') and contains(@class, 'xo2o5nc') and "
-            "contains(@class, 'xv9pgs7') and contains(@class, 'xjfzuef')]"
-        )
+        target_div = self.driver.find_element(By.XPATH, GAME_DETAILS_XPATH)
         data = target_div.text.split('\n')
         result = self.extract_ad(data)
 
@@ -231,356 +416,463 @@ class MetaReviewsExtractor:
             logger.info(f"Target div not found or data extraction failed: {e}")
             return {}
 
-    def setup_logger(self,game_id):
-        """Create a logger with a unique identifier for each game"""
-        logger = logging.getLogger(f'game_scraper_{game_id}')
-        logger.setLevel(logging.INFO)
-
-        # Create console handler
-        ch = logging.StreamHandler()
-        ch.setLevel(logging.INFO)
-        formatter = logging.Formatter(f'[%(asctime)s] [{game_id}] - %(message)s')
-        ch.setFormatter(formatter)
+    def setup_logger(self, game_id):
+        """Logger tagging each message with `game_id`"""
+        return game_logger(game_id)
 
-        # Clear any existing handlers to prevent duplicate logs
-        logger.handlers.clear()
-        logger.addHandler(ch)
-
-        return logger
+    def scrape_reviews(self, url, row, MAX_SMR_CLICKS=500, prune_window=None, spool=None, incremental=False):
+        """
+        Scrape one game's details and reviews.
 
-    def scrape_reviews(self, url, row, MAX_SMR_CLICKS=500):
+        With a ReviewSpool, each harvested batch is persisted as it comes in and the spool is
+        returned in place of the review list. With `incremental`, the game's stored reviews are
+        fingerprinted, pagination stops at the first harvested batch holding one of them (reviews
+        are listed newest first) and the new reviews are merged in front of the stored ones.
+        """
         # Extract game ID for logging
         game_id = url.split('/')[-1].split('?')[0]
         logger = self.setup_logger(game_id)
-        retry_count = 0
 
+        reviews = spool if spool is not None else []
+        if spool is not None and spool.resumed:
+            logger.info(f"Resuming from {spool.resumed} reviews already persisted.")
+        stored = self.stored_reviews(game_id) if incremental else []
+        known = {review_fingerprint(review) for review in stored} if stored else None
+        if incremental:
+            logger.info(f"Incremental scrape against {len(stored)} stored reviews.")
+        directory_path = self.output_dir
+
+        self.network_stats = {'bytes': 0, 'responses': 0}
+        self.scrape_stats = {'started_at': time.time(), 'finished_at': None, 'clicks': 0}
+        self.stage_seconds = {}
+        self.wait_stats = WaitStats()
+        completed = False
+
+        # Everything after acquiring the driver is inside the try, so every exit returns it to the pool
         self.start_driver()
-        self.driver.get(url)
-
-        # Dynamic wait for page load
-        WebDriverWait(self.driver, 30).until(
-            lambda driver: driver.execute_script('return document.readyState') == 'complete'
-        )
-
-        click_counts = 0
-        reviews = []
-        batch_count = 0
-        directory_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "Games Reviews"))
-
         try:
-            time.sleep(5)
-            additional_game_details = self.extract_additional_games_details(url)
-            description_details = self.extract_descriptions(url)
-
-            row_df = pd.DataFrame([row])
-
-            # Add additional game details to the row
-            if additional_game_details:
-                for key, value in additional_game_details.items():
-                    row_df[key] = value
-
-            # Add description if available
-            if description_details and 'description' in description_details:
-                row_df['description'] = description_details['description']
+            self.read_network_log()  # Drop what the previous game left in the log
+            self.network_stats = {'bytes': 0, 'responses': 0}
+            waiter = Waiter(self.driver, url, self.wait_stats)
+            with self.stage('page_load'):
+                self.driver.get(url)
+
+                # Dynamic wait for page load
+                waiter.page_loaded(self.profile.ready_states)
+
+            with self.stage('details'):
+                # Wait for the details panel to render and the page to stop changing
+                waiter.present('details', (By.XPATH, GAME_DETAILS_XPATH))
+                waiter.dom_quiet()
+                additional_game_details = self.extract_additional_games_details(url)
+                description_details = self.extract_descriptions(url)
+
+                row_df = pd.DataFrame([row])
+
+                # Add additional game details to the row
+                if additional_game_details:
+                    for key, value in additional_game_details.items():
+                        row_df[key] = value
+
+                # Add description if available
+                if description_details and 'description' in description_details:
+                    row_df['description'] = description_details['description']
+
+                # A refresh finds the same details most of the time, only changes are resubmitted
+                details = GameDetailsStore.to_records(row_df)[0]
+                if self.game_store.get(details.get('store_link')) != details:
+                    self.game_store.submit(details)
+
+            with self.stage('pagination'):
+                api_reviews = None
+                if self.review_backend == REVIEW_BACKEND_API:
+                    api_reviews = self.fetch_reviews_via_api(url, waiter, logger, MAX_SMR_CLICKS, known)
+                if api_reviews is not None:
+                    reviews.extend(stamp_reviews(api_reviews))
+                else:
+                    self.paginate_reviews(url, reviews, waiter, logger, MAX_SMR_CLICKS, prune_window, known)
+
+            if stored:
+                # The stored reviews keep the scrape times their relative dates count back from
+                logger.info(f"New Reviews - {len(reviews)}")
+                reviews.extend(stored)
 
-            self.save_to_files(row_df, url, {
-                'excel': os.path.join(directory_path, 'games.xlsx'),
-                'json': os.path.join(directory_path, 'games.json'),
-            })
+            logger.info(f"Total Reviews Extracted - {len(reviews)}")
+            completed = True
 
-            # Loop to click "Show more reviews" button
+        finally:
+            self.scrape_stats['finished_at'] = time.time()
+            metrics.inc('review_clicks_total', self.scrape_stats['clicks'])
+            metrics.inc('reviews_scraped_total', len(reviews))
+            logger.info(self.wait_stats.summary())
             try:
-                while click_counts <= MAX_SMR_CLICKS:
-                    try:
-                        show_more_button = WebDriverWait(self.driver, 10).until(
-                            EC.element_to_be_clickable((By.XPATH,
-                                                        "//div[contains(@class, 'x78zum5') and contains(@class, "
-                                                        "'xl56j7k')]/span[text()='Show more reviews']"))
-                        )
-                        show_more_button.click()
-                        logger.info(f"Clicking \"Show more reviews\" Button. Count - {click_counts + 1}")
-
-                        click_counts += 1
-
-                        if click_counts == 100:
-                            batch_reviews = self.extract_reviews(url)
-                            click_counts = 0
-                            batch_count += 1
-                            logger.info(f"Resetting click_counts to 0 | batch_count - {batch_count} | Batch Review - {len(batch_reviews)} ")
-
-                            if len(batch_reviews) > len(reviews):
-                                reviews = batch_reviews
-
-                    except Exception as e:
-                        logger.info(f"No more 'Show more reviews' buttons found.")
-                        logger.info("Retrying.. ") if retry_count < 5 else logger.info("Already retried 5 times")
-                        while retry_count < 5:
-                            try:
-                                time.sleep(15)
-                                show_more_button = WebDriverWait(self.driver, 10).until(
-                                    EC.element_to_be_clickable((By.XPATH,
-                                                                "//div[contains(@class, 'x78zum5') and contains(@class,"
-                                                                "'xl56j7k')]/span[text()='Show more reviews']"))
-                                )
-                                show_more_button.click()
-                                logger.info(f"Clicking \"Show more reviews\" Button. Count - {click_counts + 1} Retry Count - {retry_count}")
-
-                                click_counts += 1
-
-                                if click_counts == 100:
-                                    batch_reviews = self.extract_reviews(url)
-                                    click_counts = 0
-                                    batch_count += 1
-                                    logger.info(
-                                        f"Resetting click_counts to 0 | batch_count - {batch_count} | Batch Review - {len(batch_reviews)} ")
-
-                                    if len(batch_reviews) > len(reviews):
-                                        reviews = batch_reviews
-
-                            except Exception as e:
-                                retry_count += 1
-                        break
+                logger.info(self.resource_summary())
+                metrics.inc('review_download_bytes_total', self.network_stats['bytes'])
             except Exception as e:
-                logger.info(f"No more 'Show more reviews' buttons found. - {e}")
-
-            if len(reviews) == 0:
-                reviews = self.extract_reviews(url)
-
-            logger.info(f"Total Reviews Extracted - {len(reviews)}")
+                logger.info(f"Could not measure downloads and memory - {e}")
+            self.close_driver()
 
-        finally:
-            # Handling low review count
-            if len(reviews) <= 25:
+            # Handling low review count; a scrape that failed is not a game with few reviews
+            if completed and len(reviews) <= 25:
                 lock_file_path = os.path.join(directory_path, 'skipped_games.txt.lock')
                 skipped_games_path = os.path.join(directory_path, 'skipped_games.txt')
                 try:
-                    with open(lock_file_path, 'w') as lock_file:
-                        try:
-                            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
-
-                            with open(skipped_games_path, 'a') as f:
-                                f.write(f"Skipping game: {game_id} (Reviews: {len(reviews)})\n")
+                    with file_lock(lock_file_path):
+                        with open(skipped_games_path, 'a') as f:
+                            f.write(f"Skipping game: {game_id} (Reviews: {len(reviews)})\n")
 
-                            reviews = []
-
-                        finally:
-                            msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+                    self.processed_index.mark_skipped(url, len(reviews))
+                    if spool is not None:
+                        spool.discard()
+                    reviews = []
 
                 except Exception as e:
                     logger.error(f"Error writing to skipped games file: {str(e)}")
 
-            self.close_driver()
-
         return reviews
 
-    def save_to_files(self, data, url, output_files: dict) -> None:
-        """
-        Save data to multiple file types with thread-safe file writing
-
-        :param data: DataFrame or dictionary to be saved
-        :param output_files: Dict with file paths and their types
-                             Example: {
-                                 'excel': '/path/to/output.xlsx',
-                                 'json': '/path/to/output.json',
-                             }
+    def fetch_reviews_via_api(self, url, waiter, logger, MAX_SMR_CLICKS=500, known=None):
         """
+        Page through the reviews over plain HTTP, replaying the request "Show more reviews" sends.
 
+        The button is clicked once so the browser issues the review request, which is captured from
+        the performance log and replayed from the first page. Returns None when any step fails, so
+        the caller can carry on with browser pagination from the current page state. With `known`
+        fingerprints, paging stops at the first page holding a known review and only new ones are kept.
+        """
+        show_more_button = waiter.clickable('show_more', (By.XPATH, SHOW_MORE_XPATH))
+        if show_more_button is None:
+            logger.info("No 'Show more reviews' button to capture the review request from.")
+            return None
+        loaded_reviews = waiter.count(REVIEW_CARD_XPATH)
+        show_more_button.click()
+        self.scrape_stats['clicks'] += 1
+        waiter.count_grows('reviews_loaded', REVIEW_CARD_XPATH, loaded_reviews)
 
-        game_id = url.split('/')[-1].split('?')[0]
-        logger = self.setup_logger(game_id)
         try:
-            for file_path in output_files.values():
-                os.makedirs(os.path.dirname(file_path), exist_ok=True)
-
-            first_file_path = list(output_files.values())[0]
-            lock_file_path = first_file_path + '.lock'
-
-            with open(lock_file_path, 'w') as lock_file:
-                try:
-                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
-
-                    for file_type, file_path in output_files.items():
-                        if file_type == 'excel':
-                            self._save_to_excel(url, data, file_path)
-                        elif file_type == 'json':
-                            self._save_to_json(url, data, file_path)
-                        else:
-                            raise ValueError(f"Unsupported file type: {file_type}")
-
-                finally:
-                    # Release the lock
-                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            request = capture_review_request(self.driver, self.read_network_log())
         except Exception as e:
-            logger.info(f"Error saving data to files: {str(e)}")
-            raise
+            logger.warning(f"Could not read the performance log - {e}")
+            return None
+        if request is None:
+            logger.info("No review request captured, falling back to browser pagination.")
+            return None
 
-    def _save_to_excel(self,url, data, file_path):
-        """Save DataFrame to Excel"""
-        game_id = url.split('/')[-1].split('?')[0]
-        logger = self.setup_logger(game_id)
+        client = ReviewApiClient(request, self.driver.get_cookies())
         try:
-            existing_df = pd.read_excel(file_path) if os.path.exists(file_path) else pd.DataFrame()
-
-            if not existing_df.empty:
-                data = data.reindex(columns=existing_df.columns)
-
-            combined_df = pd.concat([existing_df, data], ignore_index=True)
-
-            columns_to_drop = ['genres', 'developer', 'publisher']
-            combined_df = combined_df.drop(columns=[col for col in columns_to_drop if col in combined_df.columns])
+            if known is None:
+                reviews = client.fetch_all(max_pages=MAX_SMR_CLICKS + 1)
+            else:
+                reviews = []
+                for page in client.pages(max_pages=MAX_SMR_CLICKS + 1):
+                    new, caught_up = self.unknown_reviews(page, known)
+                    reviews.extend(new)
+                    if caught_up:
+                        break
+        except ReviewApiError as e:
+            logger.warning(f"Replaying the review request failed, falling back to browser pagination - {e}")
+            return None
+        finally:
+            client.close()
 
-            combined_df.columns = [self._to_camel_case(col) for col in combined_df.columns]
+        logger.info(f"Fetched {len(reviews)} reviews in {client.requests_sent} requests "
+                    f"({client.bytes_received / 1024:.0f} KiB) without the browser.")
+        if known is not None:
+            return reviews
+        return reviews or None
 
-            with pd.ExcelWriter(file_path, mode='w', engine='openpyxl') as writer:
-                combined_df.to_excel(writer, index=False, header=True, sheet_name='Data')
+    def paginate_reviews(self, url, reviews, waiter, logger, MAX_SMR_CLICKS=500, prune_window=None, known=None):
+        """
+        Click through "Show more reviews" in the browser, appending harvested reviews to `reviews`.
 
-        except Exception as e:
-            logger.info(f"Error saving to Excel: {str(e)}")
-            raise
+        With `prune_window`, harvested cards are removed from the DOM after each harvest except the
+        last `prune_window`, so Chrome holds a rolling window of reviews instead of all of them. If
+        the first click after a prune loads nothing, pruning is turned off for the rest of the game.
 
-    def _save_to_json(self,url, data, file_path):
-        """Save DataFrame to JSON"""
-        game_id = url.split('/')[-1].split('?')[0]
-        logger = self.setup_logger(game_id)
+        With `known` review fingerprints, reviews are harvested after every click and pagination
+        stops as soon as a harvested batch holds a known review; only unknown reviews are appended.
+        """
+        if known is not None:
+            harvest_interval = INCREMENTAL_HARVEST_INTERVAL
+        else:
+            harvest_interval = PRUNED_HARVEST_INTERVAL if prune_window is not None else HARVEST_INTERVAL
+        click_counts = 0  # Clicks since the last harvest
+        total_clicks = 0  # Clicks of this pagination, bounded by MAX_SMR_CLICKS
+        batch_count = 0
+        retry_count = 0
+        pruned = False
+        caught_up = False
+
+        def store_batch(batch):
+            nonlocal caught_up
+            if known is not None:
+                batch, caught_up = self.unknown_reviews(batch, known)
+                if caught_up:
+                    logger.info(f"Reached the stored reviews after {self.scrape_stats['clicks']} clicks.")
+            reviews.extend(batch)
+
+        def click_show_more(wait_name):
+            nonlocal loaded_reviews, click_counts, total_clicks, batch_count, prune_window, pruned
+            show_more_button = waiter.clickable(wait_name, (By.XPATH, SHOW_MORE_XPATH), raise_on_timeout=True)
+            show_more_button.click()
+            self.scrape_stats['clicks'] += 1
+            logger.info(f"Clicking \"Show more reviews\" Button. Count - {click_counts + 1}"
+                        + (f" Retry Count - {retry_count}" if wait_name == 'retry' else ""))
+            grown = waiter.grows('reviews_loaded', self.loaded_review_count, loaded_reviews)
+            if pruned and grown is None:
+                logger.warning("No reviews loaded after pruning the DOM, no longer pruning this game.")
+                prune_window = None
+            pruned = False
+            loaded_reviews = grown or loaded_reviews
+
+            click_counts += 1
+            total_clicks += 1
+
+            if click_counts == harvest_interval:
+                store_batch(self.harvest_new_reviews(url))
+                self.read_network_log()  # Keep the performance log from piling up
+                if prune_window is not None:
+                    logger.info(f"Pruned {self.prune_harvested_reviews(prune_window)} harvested review cards.")
+                    pruned = True
+                click_counts = 0
+                batch_count += 1
+                logger.info(f"Resetting click_counts to 0 | batch_count - {batch_count} | Total Reviews - {len(reviews)} ")
+
+        # The first reviews are on the page before any click
+        if known is not None:
+            store_batch(self.harvest_new_reviews(url))
+
+        # Loop to click "Show more reviews" button
+        loaded_reviews = self.loaded_review_count()
         try:
-            existing_data = []
-            if os.path.exists(file_path):
-                with open(file_path, 'r') as f:
-                    existing_data = json.load(f)
+            while total_clicks <= MAX_SMR_CLICKS and not caught_up:
+                try:
+                    click_show_more('show_more')
 
-            new_data = data.to_dict(orient='records') if isinstance(data, pd.DataFrame) else data
+                except Exception as e:
+                    logger.info(f"No more 'Show more reviews' buttons found.")
+                    logger.info("Retrying.. ") if retry_count < 5 else logger.info("Already retried 5 times")
+                    while retry_count < 5 and total_clicks <= MAX_SMR_CLICKS and not caught_up:
+                        try:
+                            click_show_more('retry')
+                        except Exception as e:
+                            retry_count += 1
+                    break
+        except Exception as e:
+            logger.info(f"No more 'Show more reviews' buttons found. - {e}")
 
-            combined_data = existing_data + new_data
+        # Reviews loaded since the last harvest
+        if not caught_up:
+            store_batch(self.harvest_new_reviews(url))
 
-            with open(file_path, 'w') as f:
-                json.dump(combined_data, f, indent=2)
+    def save_game_reviews(self, reviews, game_name):
+        """
+        Write a game's reviews (a list or a ReviewSpool) in each of `review_formats`, each file atomically.
 
-        except Exception as e:
-            logger.info(f"Error saving to JSON: {str(e)}")
-            raise
+        Parquet goes to the game's partition of the reviews dataset; Excel and CSV to the per-game folders.
+        The game's manifest record is updated, and files are left untouched when the reviews have the
+        same content hash as the last save.
+        """
+        is_spool = isinstance(reviews, ReviewSpool)
+        review_count = len(reviews)
+        content_hash = reviews.content_hash if is_spool else reviews_digest(reviews).hexdigest()
+        stats = self.scrape_stats
+
+        directory_path = self.output_dir
+        dataset = ReviewDataset(os.path.join(directory_path, os.path.basename(REVIEWS_DATASET_DIR)))
+        paths = {
+            EXCEL: os.path.join(directory_path, 'xlsx_games_reviews', game_name + '.xlsx'),
+            CSV: os.path.join(directory_path, 'csv_games_reviews', f"{game_name}_{review_count}.csv"),
+            PARQUET: dataset.partition_path(game_name),
+        }
+        paths = {output_format: path for output_format, path in paths.items() if output_format in self.review_formats}
+        previous = self.review_manifest.get(game_name)
+        unchanged = (previous is not None and previous['paths'] == paths
+                     and self.review_manifest.is_unchanged(game_name, content_hash))
+
+        with self.stage('save'):
+            if unchanged:
+                # Same reviews as the files already on disk: only the scrape times are updated
+                if is_spool:
+                    reviews.discard()
+            else:
+                if is_spool:
+                    reviews.finalize(paths.get(EXCEL), paths.get(CSV), paths.get(PARQUET))
+                else:
+                    write_reviews(reviews, paths.get(EXCEL), paths.get(CSV), paths.get(PARQUET))
+                # The CSV name carries the review count, drop the file of the previous save
+                for old_path in (previous or {}).get('paths', {}).values():
+                    if old_path not in paths.values() and os.path.exists(old_path):
+                        os.remove(old_path)
+
+        self.review_manifest.record(game_name, review_count, paths, content_hash, stats['started_at'],
+                                    stats['finished_at'], stats['clicks'])
+
+
+class ReviewWorker:
+    """Per-process state of a review scraping worker, called once per game."""
+
+    COOLDOWN_INTERVAL = 10  # Process 10 games before cooling
+    COOLDOWN_DURATION = 0  # Cool down for 60 seconds
+
+    def __init__(self, worker_id: int, review_backend: str = REVIEW_BACKEND_BROWSER, scrape_profile: str = 'lean',
+                 prune_window: int = None, review_formats: Tuple[str, ...] = DEFAULT_REVIEW_FORMATS,
+                 refresh: bool = False, metrics_dir: str = None, metrics_format: str = METRICS_FORMAT,
+                 profile_dir: str = None):
+        self.worker_id = worker_id
+        self.prune_window = prune_window
+        self.refresh = refresh  # Re-scrape processed games incrementally instead of skipping them
+        # Each worker process writes its own metrics file, on a timer and when it exits
+        self.metrics_path = (os.path.join(metrics_dir, f"reviews_worker_{worker_id}.{metrics_format}")
+                             if metrics_dir else None)
+        self.metrics_writer = MetricsWriter(self.metrics_path) if self.metrics_path else None
+        self.profile_dir = profile_dir  # cProfile and tracemalloc dumps of every game, when set
+        metrics.set_labels(worker=worker_id)
+        # Creates new Selenium instance
+        self.meta_extractor = MetaReviewsExtractor(review_backend=review_backend,
+                                                   profile=SCRAPE_PROFILES[scrape_profile], review_formats=review_formats)
+        self.games_processed = 0  # Counter for processed games
+        print(f"Process {worker_id} started")
+
+    def __call__(self, row: pd.Series) -> None:
+        worker_id = self.worker_id
+        meta_extractor = self.meta_extractor
+        store_link = row['store_link']
+        game_name = store_link.split('/')[-1].split('?')[0]
+        print(f"Process {worker_id} - Processing Game - {row['name']}")
+        started = time.perf_counter()
+        outcome = review_count = None
 
-    def _save_to_txt(self, data, file_path):
-        """Save data to TXT"""
         try:
-            if isinstance(data, pd.DataFrame):
-                data_str = data.to_csv(index=False)
-            elif isinstance(data, list):
-                data_str = '\n'.join(str(item) for item in data)
+            status = meta_extractor.processed_index.status(store_link)
+
+            if status is None or (status != SKIPPED and self.refresh):
+                incremental = status is not None
+                print(f"{'Refreshing' if incremental else 'Processing'} Game - {game_name}")
+
+                with profiled(self.profile_dir, game_name), metrics.timer('review_game_seconds'):
+                    # Harvested batches go straight to disk; a game interrupted earlier resumes from its spool
+                    spool = ReviewSpool(game_name)
+                    reviews = meta_extractor.scrape_reviews(store_link, row, MAX_SMR_CLICKS, self.prune_window,
+                                                            spool, incremental)
+                    review_count = len(reviews)
+                    if review_count > 0:
+                        meta_extractor.save_game_reviews(reviews, game_name)
+                        meta_extractor.processed_index.mark_processed(store_link, review_count)
+                outcome = 'processed' if review_count > 0 else 'skipped'
+                metrics.inc('review_games_total', status=outcome)
+
+                if review_count > 0:
+                    self.games_processed += 1
+
+                    if self.games_processed % self.COOLDOWN_INTERVAL == 0:
+                        print(
+                            f"Process {worker_id} - Cooling down for {self.COOLDOWN_DURATION} seconds after processing {self.COOLDOWN_INTERVAL} games...")
+                        time.sleep(self.COOLDOWN_DURATION)
+                else:
+                    print(f"Process {worker_id} - No reviews found for: {store_link}")
+            elif status == SKIPPED:
+                print(f"The game '{game_name}' is already skipped.")
             else:
-                data_str = str(data)
-
-            mode = 'a' if os.path.exists(file_path) else 'w'
-            with open(file_path, mode) as f:
-                f.write(data_str + '\n')
+                print(f"Game - {game_name} already processed")
 
         except Exception as e:
-            print(f"Error saving to TXT: {str(e)}")
-            raise
+            outcome = 'failed'
+            metrics.inc('review_games_total', status=outcome)
+            print(f"Process {worker_id} - Error processing {store_link}: {str(e)}")
+        finally:
+            if outcome is not None and self.metrics_writer is not None:
+                self.record_game(game_name, outcome, review_count, time.perf_counter() - started)
 
-    def _to_camel_case(self, s):
-        """Convert string to camelCase"""
-        parts = re.split(r'[_\s]+', s)
-        return parts[0].lower() + ''.join(word.capitalize() for word in parts[1:])
+    def record_game(self, game_name: str, outcome: str, review_count: int, seconds: float) -> None:
+        """Keep the figures of one scraped game in the JSON metrics, the metric series carry no game label"""
+        extractor = self.meta_extractor
+        metrics.record(game_name, status=outcome, seconds=round(seconds, 3), reviews=review_count,
+                       clicks=extractor.scrape_stats['clicks'], download_bytes=extractor.network_stats['bytes'],
+                       stages={stage: round(value, 3) for stage, value in extractor.stage_seconds.items()})
 
-    def save_game_reviews(self, reviews, game_name):
-        df = pd.DataFrame(reviews)
-        directory_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "Games Reviews"))
-        os.makedirs(directory_path, exist_ok=True)
-        xlsx_file_path = os.path.join(directory_path, 'xlsx_games_reviews', game_name + '.xlsx')
-        csv_file_path = os.path.join(directory_path, 'csv_games_reviews', f"{game_name}_{len(reviews)}.csv")
-        df.to_excel(xlsx_file_path, index=False)
-        df.to_csv(csv_file_path, index=False)
+    def close(self) -> None:
+        if self.metrics_writer is not None:
+            self.metrics_writer.close()
+        self.meta_extractor.close_driver_pool()  # Clean up Selenium drivers
+        self.meta_extractor.close_game_store()  # Commit pending game details
+        self.meta_extractor.close_processed_index()
+        self.meta_extractor.close_review_manifest()
 
 
 class ParallelMetaReviewsExtractor:
     @staticmethod
-    def chunk_dataframe(df: pd.DataFrame, chunks: int) -> List[pd.DataFrame]:
-        """Split dataframe into roughly equal chunks."""
-        return np.array_split(df, chunks)
-
-    @staticmethod
-    def process_chunk(chunk: pd.DataFrame, chunk_id: int) -> List[Dict[str, Any]]:
-        """Process a chunk of the dataframe in a separate process."""
-        meta_extractor = MetaReviewsExtractor()  # Creates new Selenium instance
-        results = []
-        games_processed = 0  # Counter for processed games
-        COOLDOWN_INTERVAL = 10  # Process 10 games before cooling
-        COOLDOWN_DURATION = 0  # Cool down for 60 seconds
-
-        try:
-            print(f"Process {chunk_id} started with {len(chunk)} games")
-
-            for index, row in chunk.iterrows():
-                store_link = row['store_link']
-                print(f"Process {chunk_id} - Processing Game - {row['name']}")
-
-                if not isinstance(store_link, str) or not store_link.strip():
-                    print(f"Process {chunk_id} - Invalid store link at row {index}. Skipping...")
-                    continue
-
-                try:
-                    directory_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "Games Reviews"))
-                    vr_games_data_path = os.path.join(directory_path, 'VR_Games_data.xlsx')
-                    skipped_games_path = os.path.join(directory_path, 'skipped_games.txt')
-                    game_name = store_link.split('/')[-1].split('?')[0]
-
-                    def is_game_processed(store_link):
-                        if os.path.exists(vr_games_data_path):
-                            df = pd.read_excel(vr_games_data_path)
-
-                            if 'store_link' in df.columns and store_link in df['store_link'].values:
-                                print(f"The store link '{store_link}' is already processed.")
-                                return True
-
-                        if os.path.exists(skipped_games_path):
-                            with open(skipped_games_path, 'r') as f:
-                                skipped_games = f.readlines()
-
-                            for line in skipped_games:
-                                if f"Skipping game: {game_name}" in line:
-                                    print(f"The game '{game_name}' is already skipped.")
-                                    return True
-
-                        return False
-
-                    if not is_game_processed(store_link):
-                        print(f"Processing Game - {game_name}")
-
-                        reviews = meta_extractor.scrape_reviews(store_link, row, MAX_SMR_CLICKS)
-                        if len(reviews) > 0:
-                            meta_extractor.save_game_reviews(reviews, game_name)
-                            games_processed += 1
-
-                            if games_processed % COOLDOWN_INTERVAL == 0:
-                                print(
-                                    f"Process {chunk_id} - Cooling down for {COOLDOWN_DURATION} seconds after processing {COOLDOWN_INTERVAL} games...")
-                                time.sleep(COOLDOWN_DURATION)
-                        else:
-                            print(f"Process {chunk_id} - No reviews found for: {store_link}")
-                    else:
-                        print(f"Game - {game_name} already processed")
-
-                except Exception as e:
-                    print(f"Process {chunk_id} - Error processing {store_link}: {str(e)}")
+    def order_games(df: pd.DataFrame) -> List[Tuple[str, pd.Series]]:
+        """
+        Games with a valid store link as `(store_link, row)` tasks, longest-first.
 
-        except Exception as e:
-            print(f"Process {chunk_id} encountered an error: {str(e)}")
-        finally:
-            meta_extractor.driver.quit()  # Clean up Selenium driver
+        VRDB's rating_count stands in for the number of reviews to page through.
+        """
+        if 'rating_count' in df.columns:
+            rating_counts = pd.to_numeric(df['rating_count'], errors='coerce').fillna(0).to_numpy()
+        else:
+            rating_counts = [0] * len(df)
+
+        tasks = []
+        for position in sorted(range(len(df)), key=lambda i: rating_counts[i], reverse=True):
+            row = df.iloc[position]
+            store_link = row['store_link']
+            if not isinstance(store_link, str) or not store_link.strip():
+                print(f"Invalid store link at row {row.name}. Skipping...")
+                continue
+            tasks.append((store_link, row))
+        return tasks
 
-        return results
+    @staticmethod
+    def run(df: pd.DataFrame, num_processes: int = NUM_PROCESSES, review_backend: str = REVIEW_BACKEND_BROWSER,
+            scrape_profile: str = 'lean', prune_window: int = None,
+            review_formats: Tuple[str, ...] = DEFAULT_REVIEW_FORMATS, refresh: bool = False,
+            metrics_dir: str = None, metrics_format: str = METRICS_FORMAT, profile_dir: str = None) -> WorkScheduler:
+        """Scrape every game in `df` with `num_processes` workers pulling from one shared queue."""
+        scheduler = WorkScheduler(partial(ReviewWorker, review_backend=review_backend, scrape_profile=scrape_profile,
+                                          prune_window=prune_window, review_formats=review_formats,
+                                          refresh=refresh, metrics_dir=metrics_dir, metrics_format=metrics_format,
+                                          profile_dir=profile_dir),
+                                  num_processes)
+        scheduler.run(ParallelMetaReviewsExtractor.order_games(df))
+        return scheduler
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Scrape Meta store reviews of the games in VR_Games_Data.xlsx.")
+    parser.add_argument('--review-backend', choices=[REVIEW_BACKEND_BROWSER, REVIEW_BACKEND_API],
+                        default=REVIEW_BACKEND_BROWSER,
+                        help="Click through reviews in Chrome, or replay the review request over HTTP "
+                             "(falls back to Chrome per game)")
+    parser.add_argument('--scrape-profile', choices=list(SCRAPE_PROFILES), default='lean',
+                        help="'lean' blocks images, media, fonts and trackers and loads pages eagerly; "
+                             "'full' loads everything")
+    parser.add_argument('--prune-window', type=int, nargs='?', const=PRUNE_WINDOW, default=None, metavar='CARDS',
+                        help="Remove harvested review cards from the page, keeping the last CARDS "
+                             f"(default {PRUNE_WINDOW}) to bound browser memory")
+    parser.add_argument('--formats', nargs='+', choices=[PARQUET, EXCEL, CSV], default=DEFAULT_REVIEW_FORMATS,
+                        help="Review output formats (default: %(default)s); Parquet goes to one dataset "
+                             "partitioned by game id")
+    parser.add_argument('--refresh', action='store_true',
+                        help="Re-scrape processed games incrementally, stopping at the first stored review")
+    parser.add_argument('--metrics-dir',
+                        help="Write each worker's stage timings, counters and per-game figures to this directory "
+                             "every 30 seconds and when the worker exits")
+    parser.add_argument('--metrics-format', choices=METRICS_FORMATS, default=METRICS_FORMAT,
+                        help="'prom' for Prometheus' textfile collector, or 'json' (default: %(default)s)")
+    parser.add_argument('--profile-dir', help="Dump a cProfile and tracemalloc report of every game to this directory")
+    args = parser.parse_args()
+
     try:
-        print("Trying to fetch data from VR_Games_Data.xlsx")
+        print("Trying to fetch data from VR_Games_Data")
         file_path = os.path.join(os.path.dirname(__file__), "..", "VR_Games_Data.xlsx")
 
-        if not os.path.exists(file_path):
+        if not catalog_exists(file_path):
             print(f"File not found: {file_path}")
             exit(1)
 
-        games_list_df = pd.read_excel(file_path)
+        # The Parquet catalog when there is one, else the Excel export
+        games_list_df = read_catalog(file_path)
 
         if games_list_df.empty:
             print("The file is empty or invalid.")
@@ -590,20 +882,18 @@ if __name__ == '__main__':
             print("The required column 'store_link' is missing.")
             exit(1)
 
-        # Split dataframe into chunks
-        chunks = ParallelMetaReviewsExtractor.chunk_dataframe(games_list_df, NUM_PROCESSES)
-
-        # Create process pool and process chunks in parallel
-        with Pool(processes=NUM_PROCESSES) as pool:
-            # Create partial function with chunk_id
-            process_chunk_with_id = partial(
-                ParallelMetaReviewsExtractor.process_chunk
-            )
-            # Map chunks to processes with their IDs
-            all_results = pool.starmap(
-                process_chunk_with_id,
-                [(chunk, i) for i, chunk in enumerate(chunks)]
-            )
+        # Workers pull games one at a time, longest first
+        scheduler = ParallelMetaReviewsExtractor.run(games_list_df, NUM_PROCESSES, args.review_backend,
+                                                     args.scrape_profile, args.prune_window, tuple(args.formats),
+                                                     args.refresh, args.metrics_dir, args.metrics_format,
+                                                     args.profile_dir)
+        for line in scheduler.report():
+            print(line)
+
+        # Export the game details collected by every process
+        with GameDetailsStore() as game_store:
+            game_store.export(os.path.join(GAMES_REVIEWS_DIR, 'games.xlsx'),
+                              os.path.join(GAMES_REVIEWS_DIR, 'games.json'))
 
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
@@ -0,0 +1,116 @@
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set
+
+import pandas as pd
+
+from src.game_store import connect_sqlite
+
+logger = logging.getLogger(__name__)
+
+# Verification results buffered before one commit
+LOG_BATCH_SIZE = 25
+
+# Columns of the verification log, in export order
+LOG_COLUMNS = ['filename', 'url', 'ratings', 'reviews', 'file_reviews', 'processed_at']
+
+
+class VerificationLog:
+    """
+    Review-count verification results, kept in SQLite (WAL) next to the Excel log.
+
+    `add` buffers results and commits them `batch_size` at a time, so verifying a file never
+    rewrites the whole log. Each result keeps the content hash of the reviews it verified, so a
+    game is verified again only when its reviews change. The Excel file becomes a view written by `export`; an existing one is
+    imported the first time the store is opened.
+    """
+
+    def __init__(self, db_path: str, excel_path: str = None, batch_size: int = LOG_BATCH_SIZE):
+        self.db_path = db_path
+        self.excel_path = excel_path
+        self.batch_size = batch_size
+        self._pending: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+        self._connection = connect_sqlite(db_path)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS verifications (filename TEXT PRIMARY KEY, url TEXT, ratings TEXT, '
+            'reviews TEXT, file_reviews INTEGER, content_hash TEXT, processed_at REAL NOT NULL)'
+        )
+        self._connection.commit()
+
+        empty = self._connection.execute('SELECT COUNT(*) FROM verifications').fetchone()[0] == 0
+        if empty and excel_path and os.path.exists(excel_path):
+            self._import_excel(excel_path)
+
+    def _import_excel(self, excel_path: str) -> None:
+        log_df = pd.read_excel(excel_path)
+        entries = []
+        for record in log_df.to_dict(orient='records'):
+            processed_at = pd.Timestamp(record.get('processed_at')) if pd.notna(record.get('processed_at')) else None
+            record['processed_at'] = processed_at.timestamp() if processed_at is not None else time.time()
+            entries.append(record)
+        self._write(entries)
+        logger.info(f"Imported {len(entries)} verifications from {excel_path}")
+
+    def _write(self, entries: List[Dict[str, Any]]) -> None:
+        def text(value):
+            return None if value is None or (isinstance(value, float) and pd.isna(value)) else str(value)
+
+        rows = [(entry['filename'], entry.get('url'), text(entry.get('ratings')), text(entry.get('reviews')),
+                 entry.get('file_reviews'), text(entry.get('content_hash')), entry['processed_at'])
+                for entry in entries]
+        with self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO verifications (filename, url, ratings, reviews, file_reviews, content_hash, '
+                'processed_at) VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        """Record one verification; committed with the rest of its batch."""
+        entry = dict(entry, processed_at=entry.get('processed_at') or time.time())
+        with self._lock:
+            self._pending.append(entry)
+            if len(self._pending) >= self.batch_size:
+                self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._pending:
+            self._write(self._pending)
+            self._pending = []
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def processed_files(self) -> Set[str]:
+        with self._lock:
+            rows = self._connection.execute('SELECT filename FROM verifications').fetchall()
+            return {filename for (filename,) in rows} | {entry['filename'] for entry in self._pending}
+
+    def verified_hashes(self) -> Dict[str, Optional[str]]:
+        """Content hash of the reviews each file was verified with (None for results logged without one)."""
+        with self._lock:
+            hashes = dict(self._connection.execute('SELECT filename, content_hash FROM verifications').fetchall())
+            hashes.update({entry['filename']: entry.get('content_hash') for entry in self._pending})
+            return hashes
+
+    def export(self, excel_path: str = None) -> pd.DataFrame:
+        """Write the Excel view of the log, replacing the old file atomically."""
+        self.flush()
+        excel_path = excel_path or self.excel_path
+        with self._lock:
+            df = pd.read_sql_query(f"SELECT {', '.join(LOG_COLUMNS)} FROM verifications ORDER BY processed_at",
+                                   self._connection)
+        df['processed_at'] = pd.to_datetime(df['processed_at'], unit='s')
+        if excel_path:
+            root, ext = os.path.splitext(excel_path)
+            tmp_path = f"{root}.tmp{ext}"
+            df.to_excel(tmp_path, index=False)
+            os.replace(tmp_path, excel_path)
+        return df
+
+    def close(self) -> None:
+        self.flush()
+        self._connection.close()
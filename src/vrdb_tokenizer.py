@@ -0,0 +1,150 @@
+import json
+import re
+from typing import Any, Dict, List
+
+_STRING_PATTERN = r'"[^"\\]*(?:\\.[^"\\]*)*"|\'[^\'\\]*(?:\\.[^\'\\]*)*\'|`[^`\\]*(?:\\.[^`\\]*)*`'
+
+# An array holding no objects or arrays, read as one value
+FLAT_ARRAY_PATTERN = r'\[[^\[\]{}"\'`]*(?:(?:' + _STRING_PATTERN + r')[^\[\]{}"\'`]*)*\]'
+
+# A value read as one token: a string literal, a flat array or any other run (a number, null)
+_VALUE_PATTERN = _STRING_PATTERN + '|' + FLAT_ARRAY_PATTERN + r'|[^\s{}\[\],:"\'`]+'
+
+# One token of JS object literal syntax with the whitespace and comma after it: 1: a property key (bare
+# or double-quoted) and 2: its value, unless the value is a nested object or array; 3: a value on its
+# own (an array element); 4: a bracket
+_TOKEN_PATTERN = re.compile(
+    r'\s*(?:([A-Za-z_$][\w$]*|"[^"\\]*(?:\\.[^"\\]*)*")\s*:\s*(' + _VALUE_PATTERN + r')?'
+    r'|(' + _VALUE_PATTERN + r')|([{}\[\]]))\s*,?'
+)
+
+# Prefixes the legacy regex parser accepted for numeric fields
+_DECIMAL_PREFIX = re.compile(r'\d+(?:\.\d+)?')
+_INTEGER_PREFIX = re.compile(r'\d+')
+
+# Raw values recorded for nested objects and for arrays holding objects or arrays
+_NESTED_OBJECT = '{...}'
+_NESTED_ARRAY = '[...]'
+
+MANDATORY_FIELDS = ('id', 'name', 'genres', 'store_link')
+
+# Optional fields in output column order, with how their raw values are typed
+_AS_STRING, _AS_ARRAY, _AS_DECIMAL, _AS_INTEGER = range(4)
+OPTIONAL_FIELDS = (
+    ('developer', _AS_STRING),
+    ('publisher', _AS_STRING),
+    ('platforms', _AS_ARRAY),
+    ('release_date', _AS_STRING),
+    ('rating_score', _AS_DECIMAL),
+    ('rating_count', _AS_INTEGER),
+    ('game_mode', _AS_STRING),
+    ('languages', _AS_ARRAY),
+    ('age_rating', _AS_STRING),
+    ('space_required', _AS_STRING),
+    ('price_USD_amount', _AS_INTEGER),
+    ('price_USD_formatted', _AS_STRING),
+)
+
+
+def string_value(literal: str) -> str:
+    """Text of a double-quoted string literal, with its escapes (\\" and the like) decoded."""
+    if '\\' not in literal:
+        return literal[1:-1]
+    try:
+        return json.loads(literal)
+    except json.JSONDecodeError:
+        return literal[1:-1]
+
+
+def _array_value(raw: str) -> List[Any]:
+    # Plain string arrays without escapes are split directly, anything else goes through json
+    if raw[:2] == '["' and '\\' not in raw and raw.count('"') == 2 * raw.count('","') + 2:
+        return raw[2:-2].split('","')
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        return []
+
+
+def _to_game(obj: Dict[str, str]) -> Any:
+    """Type a parsed object as a game record, or return None if it is not one."""
+    game_id = obj.get('id', '')
+    name = obj.get('name', '')
+    store_link = obj['store_link']
+    genres = obj.get('genres', '')
+    if (game_id[:1] != '"' or not game_id[1:-1].isdecimal() or name[:1] != '"' or len(name) == 2
+            or store_link[:1] != '"' or genres[:1] != '[' or genres == _NESTED_ARRAY):
+        return None
+
+    game = {
+        'id': game_id[1:-1],
+        'name': string_value(name),
+        'genres': _array_value(genres),
+        'store_link': string_value(store_link),
+    }
+    for field, kind in OPTIONAL_FIELDS:
+        raw = obj.get(field)
+        if not raw:
+            continue
+        first = raw[0]
+        if kind == _AS_STRING:
+            if first == '"':
+                game[field] = string_value(raw)
+        elif kind == _AS_ARRAY:
+            if first == '[' and raw != _NESTED_ARRAY:
+                game[field] = _array_value(raw)
+        elif first.isdigit():
+            # rating_count and price_USD_amount only ever matched integer literals
+            if kind == _AS_DECIMAL:
+                number = _DECIMAL_PREFIX.match(raw).group(0)
+                game[field] = float(number) if '.' in number else int(number)
+            else:
+                game[field] = int(_INTEGER_PREFIX.match(raw).group(0))
+    return game
+
+
+def scan_games(text: str) -> List[Dict[str, Any]]:
+    """
+    Scan the VRDB SvelteKit payload and return every game as a typed record.
+
+    Everything from the first `resolve(` on is read token by token in one forward pass, keeping
+    a stack of the open object literals; flat arrays and string literals are single tokens, so
+    escaped quotes never end a value early. Any object carrying a digit-string `id`, a `name`, a
+    `genres` array and a `store_link`, in any order, is emitted with the field typing of the
+    regex parser: strings are unescaped, arrays are JSON-decoded (or [] when they are not plain
+    JSON) and numeric fields are int or float depending on their literal.
+    """
+    games = []
+    pos = text.find('resolve(')
+    if pos == -1:
+        return games
+
+    stack = []  # Enclosing objects (dicts of raw property values) and arrays (None)
+    top = None  # Innermost open object, None inside an array
+    key = None  # Property of `top` whose value is the next token (a nested object or array)
+    for property_key, property_value, value, bracket in _TOKEN_PATTERN.findall(text, pos):
+        if property_key:
+            if top is not None:
+                name = property_key[1:-1] if property_key[0] == '"' else property_key
+                if property_value:
+                    top[name] = property_value
+                else:
+                    key = name
+        elif value:
+            if key is not None:
+                top[key] = value
+                key = None
+        elif bracket == '{' or bracket == '[':
+            if key is not None:
+                top[key] = _NESTED_OBJECT if bracket == '{' else _NESTED_ARRAY
+            stack.append(top)
+            top = {} if bracket == '{' else None
+            key = None
+        elif bracket:
+            if top is not None and 'store_link' in top:
+                game = _to_game(top)
+                if game is not None:
+                    games.append(game)
+            top = stack.pop() if stack else None
+            key = None
+    return games
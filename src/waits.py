@@ -0,0 +1,143 @@
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from selenium.common import TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.wait import WebDriverWait
+
+from src.metrics import metrics
+
+
+# Longest any wait may take unless the site overrides it (seconds)
+DEFAULT_WAIT_TIMEOUT = 30.0
+
+# Per-site limits for each kind of wait (seconds)
+SITE_WAIT_TIMEOUTS = {
+    'www.meta.com': {
+        'page_load': 30.0,      # document.readyState complete
+        'details': 10.0,        # game details panel rendered
+        'settled': 5.0,         # DOM quiet before reading the details
+        'show_more': 10.0,      # "Show more reviews" button clickable
+        'reviews_loaded': 15.0,  # review count grows after a click
+        'retry': 25.0,          # button back after pagination stalled
+        'ratings': 20.0,        # ratings and reviews summary rendered
+    },
+}
+
+# How long the DOM must go without mutations to count as settled (seconds)
+DOM_QUIET_PERIOD = 1.0
+
+# How often wait conditions are re-checked (seconds)
+WAIT_POLL_INTERVAL = 0.25
+
+# Installs a MutationObserver once per page and returns the milliseconds since the last mutation
+_QUIET_FOR_JS = """
+if (window.__lastMutation === undefined) {
+    window.__lastMutation = performance.now();
+    new MutationObserver(() => { window.__lastMutation = performance.now(); })
+        .observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+return performance.now() - window.__lastMutation;
+"""
+
+_COUNT_JS = "return document.evaluate('count(' + arguments[0] + ')', document, null, XPathResult.NUMBER_TYPE, null)" \
+            ".numberValue;"
+
+
+def wait_timeout(url: str, name: str) -> float:
+    """Timeout of the `name` wait on the site serving `url`."""
+    return SITE_WAIT_TIMEOUTS.get(urlparse(url).netloc, {}).get(name, DEFAULT_WAIT_TIMEOUT)
+
+
+class WaitStats:
+    """
+    Time spent in each kind of wait, and how many of them timed out.
+
+    Every wait is also observed in the `wait_seconds` histogram, tagged with `labels`.
+    """
+
+    def __init__(self, **labels):
+        self.labels = labels
+        self.waits: Dict[str, list] = defaultdict(lambda: [0, 0.0, 0.0, 0])  # count, total, max, timeouts
+
+    def record(self, name: str, seconds: float, satisfied: bool) -> None:
+        metrics.observe('wait_seconds', seconds, wait=name, **self.labels)
+        if not satisfied:
+            metrics.inc('wait_timeouts_total', wait=name, **self.labels)
+        entry = self.waits[name]
+        entry[0] += 1
+        entry[1] += seconds
+        entry[2] = max(entry[2], seconds)
+        entry[3] += 0 if satisfied else 1
+
+    @property
+    def total(self) -> float:
+        return sum(entry[1] for entry in self.waits.values())
+
+    def summary(self) -> str:
+        parts = []
+        for name, (count, total, longest, timeouts) in self.waits.items():
+            part = f"{name} {count}x {total:.1f}s (max {longest:.1f}s"
+            part += f", {timeouts} timed out)" if timeouts else ")"
+            parts.append(part)
+        return f"Waited {self.total:.1f}s: " + ', '.join(parts) if parts else "No waits"
+
+
+class Waiter:
+    """
+    Waits on readiness signals of the page open in `driver` instead of sleeping.
+
+    Every wait is bounded by the per-site timeout for its name (see SITE_WAIT_TIMEOUTS) and
+    its duration is recorded in `stats`, timed out or not.
+    """
+
+    def __init__(self, driver, url: str, stats: Optional[WaitStats] = None):
+        self.driver = driver
+        self.url = url
+        self.stats = stats if stats is not None else WaitStats()
+
+    def until(self, name: str, condition: Callable[[Any], Any], timeout: Optional[float] = None,
+              raise_on_timeout: bool = False) -> Any:
+        """Result of `condition` once truthy, or None (TimeoutException if asked) after the timeout."""
+        timeout = wait_timeout(self.url, name) if timeout is None else timeout
+        started = time.monotonic()
+        try:
+            result = WebDriverWait(self.driver, timeout, poll_frequency=WAIT_POLL_INTERVAL).until(condition)
+        except TimeoutException:
+            self.stats.record(name, time.monotonic() - started, False)
+            if raise_on_timeout:
+                raise
+            return None
+        self.stats.record(name, time.monotonic() - started, True)
+        return result
+
+    def page_loaded(self, ready_states: Tuple[str, ...] = ('complete',), name: str = 'page_load') -> bool:
+        return bool(self.until(name, lambda driver: driver.execute_script('return document.readyState') in ready_states))
+
+    def present(self, name: str, locator: Tuple[str, str], **kwargs):
+        return self.until(name, EC.presence_of_element_located(locator), **kwargs)
+
+    def clickable(self, name: str, locator: Tuple[str, str], **kwargs):
+        return self.until(name, EC.element_to_be_clickable(locator), **kwargs)
+
+    def count(self, xpath: str) -> int:
+        return int(self.driver.execute_script(_COUNT_JS, xpath))
+
+    def grows(self, name: str, counter: Callable[[], int], previous: int, **kwargs) -> Optional[int]:
+        """Wait until `counter()` returns more than `previous`; returns the new value."""
+        def grown(driver):
+            count = counter()
+            return count if count > previous else False
+
+        return self.until(name, grown, **kwargs)
+
+    def count_grows(self, name: str, xpath: str, previous: int, **kwargs) -> Optional[int]:
+        """Wait until more than `previous` nodes match `xpath`; returns the new count."""
+        return self.grows(name, lambda: self.count(xpath), previous, **kwargs)
+
+    def dom_quiet(self, name: str = 'settled', quiet_period: float = DOM_QUIET_PERIOD, **kwargs) -> bool:
+        """Wait until no DOM mutation happened for `quiet_period` seconds."""
+        return bool(self.until(name, lambda driver: driver.execute_script(_QUIET_FOR_JS) >= quiet_period * 1000,
+                               **kwargs))
@@ -0,0 +1,176 @@
+import collections
+import itertools
+import logging
+import multiprocessing
+import queue
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# How often the scheduler checks on its workers while waiting for events (seconds)
+SCHEDULER_POLL_INTERVAL = 1.0
+
+# Times a task is handed out before a crash while processing it is blamed on the task itself
+MAX_TASK_ATTEMPTS = 2
+
+# Replacement processes started per worker slot before the slot is given up
+MAX_WORKER_RESTARTS = 5
+
+
+def _worker_main(worker_id: int, slot: int, make_worker: Callable[[int], Any], tasks, events) -> None:
+    """
+    Worker process loop: ask for a task, run it, report back, until told to stop.
+
+    `make_worker(slot)` builds the per-process state; it is called with each task and closed
+    (if it has a `close` method) when the process exits cleanly.
+    """
+    worker = make_worker(slot)
+    try:
+        while True:
+            events.put(('ready', worker_id))
+            task = tasks.get()
+            if task is None:
+                break
+            key, item = task
+            started = time.monotonic()
+            try:
+                worker(item)
+            except Exception as e:
+                logger.error(f"Worker {slot} - error processing {key}: {str(e)}")
+            events.put(('done', worker_id, key, time.monotonic() - started))
+    finally:
+        close = getattr(worker, 'close', None)
+        if close:
+            close()
+
+
+class WorkerStats:
+    def __init__(self, slot: int):
+        self.slot = slot
+        self.tasks = 0
+        self.busy = 0.0
+        self.restarts = 0
+        self.started = time.monotonic()
+        self.finished: Optional[float] = None
+
+    @property
+    def wall(self) -> float:
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def utilization(self) -> float:
+        return self.busy / self.wall if self.wall else 0.0
+
+
+class WorkScheduler:
+    """
+    Hands tasks out one at a time to a pool of worker processes.
+
+    Tasks are dispatched in the order given, so callers sort them longest-first to keep a few
+    long tasks from trailing at the end of the run. The scheduler remembers which task each
+    worker holds; when a worker process dies its task goes back to the front of the queue
+    (at most MAX_TASK_ATTEMPTS times) and a replacement worker takes over its slot. Events
+    carry a per-process id, so late messages from a dead worker never reach its replacement.
+    """
+
+    def __init__(self, make_worker: Callable[[int], Any], num_workers: int,
+                 max_attempts: int = MAX_TASK_ATTEMPTS):
+        self.make_worker = make_worker
+        self.num_workers = num_workers
+        self.max_attempts = max_attempts
+        self.stats: Dict[int, WorkerStats] = {}
+        self.failed: List[Any] = []
+        self._worker_ids = itertools.count()
+
+    def _spawn(self, slot: int, events):
+        worker_id = next(self._worker_ids)
+        tasks = multiprocessing.Queue()
+        process = multiprocessing.Process(target=_worker_main,
+                                          args=(worker_id, slot, self.make_worker, tasks, events),
+                                          name=f"worker-{slot}")
+        process.start()
+        return worker_id, (slot, process, tasks)
+
+    def run(self, tasks: Iterable[Tuple[Any, Any]]) -> Dict[int, WorkerStats]:
+        """Process `(key, item)` tasks; returns the per-worker stats."""
+        pending = collections.deque(tasks)
+        attempts = collections.Counter()
+        events = multiprocessing.Queue()
+        workers = {}
+        claims = {}
+
+        for slot in range(min(self.num_workers, len(pending)) or 1):
+            worker_id, worker = self._spawn(slot, events)
+            workers[worker_id] = worker
+            self.stats[slot] = WorkerStats(slot)
+
+        while workers:
+            # Wait for one event, then drain the rest so a finished task is never mistaken for
+            # the claim of a worker that has since exited
+            received = []
+            try:
+                received.append(events.get(timeout=SCHEDULER_POLL_INTERVAL))
+                while True:
+                    received.append(events.get_nowait())
+            except queue.Empty:
+                pass
+
+            for event in received:
+                worker_id = event[1]
+                if worker_id not in workers:
+                    continue
+                slot, _, worker_tasks = workers[worker_id]
+                if event[0] == 'ready':
+                    if pending:
+                        task = pending.popleft()
+                        attempts[task[0]] += 1
+                        claims[worker_id] = task
+                        worker_tasks.put(task)
+                    else:
+                        worker_tasks.put(None)
+                elif event[0] == 'done':
+                    claims.pop(worker_id, None)
+                    self.stats[slot].tasks += 1
+                    self.stats[slot].busy += event[3]
+
+            for worker_id, (slot, process, _) in list(workers.items()):
+                if process.is_alive():
+                    continue
+                process.join()
+                del workers[worker_id]
+                stats = self.stats[slot]
+                task = claims.pop(worker_id, None)
+                if task is not None:
+                    if attempts[task[0]] < self.max_attempts:
+                        logger.warning(f"Worker {slot} died (exit code {process.exitcode}) while processing "
+                                       f"{task[0]}; re-queueing it")
+                        pending.appendleft(task)
+                    else:
+                        logger.error(f"Giving up on {task[0]} after {attempts[task[0]]} worker crashes")
+                        self.failed.append(task[0])
+
+                if process.exitcode != 0 and pending and stats.restarts < MAX_WORKER_RESTARTS:
+                    stats.restarts += 1
+                    new_worker_id, worker = self._spawn(slot, events)
+                    workers[new_worker_id] = worker
+                else:
+                    stats.finished = time.monotonic()
+
+        # Left over only when every worker slot ran out of restarts
+        self.failed.extend(key for key, _ in pending)
+        return self.stats
+
+    def report(self) -> List[str]:
+        """One line per worker plus a total, describing how busy each worker was."""
+        lines = []
+        total_busy = total_wall = 0.0
+        for slot, stats in sorted(self.stats.items()):
+            total_busy += stats.busy
+            total_wall += stats.wall
+            lines.append(f"Worker {slot}: {stats.tasks} tasks, busy {stats.busy:.0f}s of {stats.wall:.0f}s "
+                         f"({stats.utilization:.0%}), {stats.restarts} restarts")
+        if total_wall:
+            lines.append(f"Overall utilization: {total_busy / total_wall:.0%}"
+                         + (f", {len(self.failed)} tasks failed" if self.failed else ""))
+        return lines
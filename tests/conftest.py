@@ -0,0 +1,180 @@
+import pytest
+from selenium.common import JavascriptException, NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from src import driver_pool, selenium_reviews_extractor
+from src.driver_pool import DriverPool
+from src.game_store import GameDetailsStore
+from src.output_formats import CSV
+from src.processed_index import ProcessedGamesIndex
+from src.review_cards import (AUTHOR_XPATH, CONTENT_XPATH, HARVESTED_ATTRIBUTE, HELPFULNESS_XPATH, SERIALIZE_REVIEWS_JS,
+                              STARS_CLASS, TIME_XPATH, TITLE_XPATH)
+from src.review_manifest import ReviewManifest
+from src.scrape_profile import ScrapeProfile
+from src.selenium_reviews_extractor import MetaReviewsExtractor
+
+
+class FakeSwitchTo:
+    def window(self, handle):
+        pass
+
+
+class FakeDriver:
+    """Stands in for webdriver.Chrome: answers the pool's health check and reset, fails `get` on demand."""
+
+    def __init__(self, options=None):
+        self.options = options
+        self.quit_called = False
+        self.fail_get = None  # Exception raised by the next `get`, once
+        self.window_handles = ['main']
+        self.switch_to = FakeSwitchTo()
+
+    def execute_script(self, script, *args):
+        return 1
+
+    def execute_cdp_cmd(self, command, params):
+        return {}
+
+    def get(self, url):
+        error, self.fail_get = self.fail_get, None
+        if error is not None:
+            raise error
+
+    def get_log(self, log_type):
+        return []
+
+    def get_cookies(self):
+        return []
+
+    def delete_all_cookies(self):
+        pass
+
+    def close(self):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def fake_chrome(monkeypatch):
+    """Make DriverPool start FakeDriver sessions; returns the list of started drivers."""
+    started = []
+
+    def start(options=None):
+        driver = FakeDriver(options)
+        started.append(driver)
+        return driver
+
+    monkeypatch.setattr(driver_pool.webdriver, 'Chrome', start)
+    return started
+
+
+class FakeElement:
+    def __init__(self, text='', children=()):
+        self.text = text
+        self.children = list(children)
+
+    def find_elements(self, by, value):
+        return self.children
+
+
+class FakeCard:
+    """A review card whose fields are found by the XPaths of review_cards"""
+
+    def __init__(self, number):
+        self.fields = {TITLE_XPATH: f"Title {number}", TIME_XPATH: '3 months ago', CONTENT_XPATH: f"Content {number}",
+                       AUTHOR_XPATH: f"player_{number}", HELPFULNESS_XPATH: '2 people found this helpful'}
+        self.rating = number % 5 + 1
+        self.harvested = False
+
+    @property
+    def text(self):
+        return '\n'.join(self.fields.values())
+
+    def find_element(self, by, value):
+        if by == By.CLASS_NAME and value == STARS_CLASS:
+            return FakeElement(children=[FakeElement() for _ in range(self.rating)])
+        if by == By.XPATH and value in self.fields:
+            return FakeElement(self.fields[value])
+        raise NoSuchElementException(value)
+
+    def serialize(self, field_xpaths):
+        review = {field: self.fields[xpath] for field, (xpath, line) in field_xpaths.items()}
+        review['rating'] = self.rating
+        return review
+
+
+class FakeStorePage(FakeDriver):
+    """FakeDriver showing review cards, read by SERIALIZE_REVIEWS_JS or WebDriver lookups and tagged once read."""
+
+    def __init__(self, options=None, script_fails=False):
+        super().__init__(options)
+        self.cards = []
+        self.script_fails = script_fails
+        self.serialize_calls = 0
+
+    def load(self, count):
+        self.cards += [FakeCard(len(self.cards) + number) for number in range(count)]
+
+    def _matching(self, xpath):
+        unharvested_only = f"[not(@{HARVESTED_ATTRIBUTE})]" in xpath
+        return [card for card in self.cards if not (unharvested_only and card.harvested)]
+
+    def find_elements(self, by, value):
+        return self._matching(value)
+
+    def execute_script(self, script, *args):
+        if script == SERIALIZE_REVIEWS_JS:
+            self.serialize_calls += 1
+            if self.script_fails:
+                raise JavascriptException('document.evaluate is not a function')
+            card_xpath, field_xpaths, stars_class, star_class, marker = args
+            cards = self._matching(card_xpath)
+            for card in cards:
+                card.harvested = card.harvested or bool(marker)
+            return [card.serialize(field_xpaths) for card in cards]
+        if HARVESTED_ATTRIBUTE in script:
+            for card in args[0]:
+                card.harvested = True
+        return super().execute_script(script, *args)
+
+
+class FakeWaiter:
+    """Waiter whose waits all succeed at once"""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+def review(number):
+    return {'title': f"Title {number}", 'rating': 5, 'time': '3 months ago', 'content': f"Content {number}",
+            'author': f"player_{number}", 'helpful_votes': 'N/A'}
+
+
+@pytest.fixture
+def make_extractor(fake_chrome, tmp_path, monkeypatch):
+    """Build MetaReviewsExtractors over FakeDriver sessions, stores in `tmp_path` and stubbed game details."""
+    extractors = []
+
+    def make(waiter=FakeWaiter, **kwargs):
+        monkeypatch.setattr(selenium_reviews_extractor, 'Waiter', waiter)
+        extractor = MetaReviewsExtractor(
+            driver_pool=DriverPool(lambda: None, size=1), profile=ScrapeProfile(measure=False),
+            game_store=GameDetailsStore(str(tmp_path / 'games.db'), flush_interval=0.05),
+            processed_index=ProcessedGamesIndex(str(tmp_path / 'index.db'), games_folder=str(tmp_path)),
+            review_manifest=ReviewManifest(str(tmp_path / 'manifest.db')), review_formats=(CSV,),
+            output_dir=str(tmp_path), **kwargs)
+        extractor.extract_additional_games_details = lambda url: {'Developer': 'Studio'}
+        extractor.extract_descriptions = lambda url: {}
+        extractors.append(extractor)
+        return extractor
+
+    yield make
+    for extractor in extractors:
+        extractor.close_game_store()
+        extractor.close_processed_index()
+        extractor.close_review_manifest()
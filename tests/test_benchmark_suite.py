@@ -0,0 +1,36 @@
+import json
+import os
+import subprocess
+import sys
+
+from benchmarks.suite import measure, record_fixtures
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_recorded_pages_are_used_as_they_are(tmp_path):
+    (tmp_path / 'vrdb_25.html').write_text('<html>recorded</html>')
+    fixtures = record_fixtures(str(tmp_path), [25, 50], [10])
+    assert (tmp_path / 'vrdb_25.html').read_text() == '<html>recorded</html>'
+    assert sorted(fixtures['vrdb']) == [25, 50]
+    assert os.path.exists(fixtures['store'][10])
+
+
+def test_measure_runs_setup_outside_the_timing():
+    calls = []
+    result = measure('work', 'fixture', 10, lambda: calls.append('run'), repeat=3, setup=lambda: calls.append('setup'))
+    assert calls == ['setup', 'run'] * 3
+    assert result['status'] == 'ok' and result['items'] == 10
+
+
+def test_suite_runs_offline_and_compares_with_an_earlier_run(tmp_path):
+    command = [sys.executable, '-m', 'benchmarks.suite', '--fixtures-dir', str(tmp_path / 'fixtures'),
+               '--vrdb-sizes', '25', '--review-sizes', '10', '--repeat', '1', '--no-browser']
+    subprocess.run(command + ['--output', str(tmp_path / 'before.json')], cwd=ROOT, check=True, capture_output=True)
+    results = json.loads((tmp_path / 'before.json').read_text())
+    assert {result['benchmark'] for result in results['results'] if result['status'] == 'ok'} == {
+        'extract_script_content', 'parse_game_data', 'save_to_files', 'save_game_reviews'}
+
+    compared = subprocess.run(command + ['--compare', str(tmp_path / 'before.json')], cwd=ROOT, check=True,
+                              capture_output=True, text=True)
+    assert f"vs {results['meta']['commit']}" in compared.stdout
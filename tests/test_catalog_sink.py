@@ -0,0 +1,30 @@
+import pandas as pd
+
+from src.catalog_sink import CatalogSink
+
+
+def games(*names):
+    return pd.DataFrame([{'id': str(number), 'name': name} for number, name in enumerate(names)])
+
+
+def test_spooled_pages_are_read_in_page_order_with_the_last_copy_winning(tmp_path):
+    sink = CatalogSink(str(tmp_path / 'catalog.ndjson'))
+    sink.reset()
+    sink.write_page(2, games('C'))
+    sink.write_page(1, games('A', 'B'))
+    sink.write_page(2, games('C updated'))
+    with open(sink.path, 'a', encoding='utf-8') as f:
+        f.write('{"page": 3, "games": [{"id"')  # Crash mid-write
+
+    assert sink.to_dataframe()['name'].tolist() == ['A', 'B', 'C updated']
+
+
+def test_compact_keeps_one_line_per_page_before_the_stop_page(tmp_path):
+    sink = CatalogSink(str(tmp_path / 'catalog.ndjson'))
+    sink.reset()
+    for page, name in ((1, 'A'), (2, 'B'), (2, 'B updated'), (3, 'Past the end')):
+        sink.write_page(page, games(name))
+
+    sink.compact(stop_page=3)
+    assert len((tmp_path / 'catalog.ndjson').read_text().splitlines()) == 2
+    assert sink.to_dataframe()['name'].tolist() == ['A', 'B updated']
@@ -0,0 +1,53 @@
+import json
+import random
+import time
+
+import pandas as pd
+import pytest
+
+from benchmarks.fixture_server import VRDBFixtureServer
+from src.crawl_pipeline import CrawlPipeline
+from src.games_list_extractor import VRDBExtractor
+from src.output_formats import JSON
+
+
+def page_frame(page):
+    return pd.DataFrame([{'id': str(page), 'name': f"Game {page}"}])
+
+
+def test_pages_are_written_in_order_and_stop_at_the_first_empty_page():
+    rng = random.Random(0)
+
+    def fetch_page(page):
+        time.sleep(rng.random() / 100)  # Pages finish out of order
+        return page
+
+    def parse_page(page, html_content):
+        return page_frame(page) if page <= 20 else pd.DataFrame()
+
+    written = []
+    pipeline = CrawlPipeline(fetch_page, parse_page, num_fetchers=4, num_parsers=2, queue_size=4)
+    assert pipeline.run(lambda page, games_df: written.append(page)) == 20
+    assert written == list(range(1, 21))
+
+
+def test_fetch_error_stops_the_crawl():
+    def fetch_page(page):
+        if page == 3:
+            raise ConnectionError('connection reset')
+        return page
+
+    pipeline = CrawlPipeline(fetch_page, lambda page, html_content: page_frame(page), num_fetchers=2)
+    with pytest.raises(ConnectionError):
+        pipeline.run(lambda page, games_df: None)
+
+
+def test_pipelined_crawl_writes_the_same_catalog_as_the_sequential_one(tmp_path):
+    with VRDBFixtureServer(num_pages=6, games_per_page=5) as server:
+        extractor = VRDBExtractor(base_url=server.base_url, output_formats=(JSON,))
+        extractor.run(str(tmp_path / 'sequential.xlsx'), str(tmp_path / 'sequential.json'))
+        extractor.run_pipelined(str(tmp_path / 'pipelined.xlsx'), str(tmp_path / 'pipelined.json'), num_fetchers=4)
+
+    sequential = json.loads((tmp_path / 'sequential.json').read_text())
+    assert len(sequential) == 30
+    assert json.loads((tmp_path / 'pipelined.json').read_text()) == sequential
@@ -0,0 +1,82 @@
+import pandas as pd
+import pytest
+
+from benchmarks.fixtures import make_vrdb_page
+from src.crawl_state import CrawlState
+from src.games_list_extractor import VRDBExtractor
+
+
+def test_unfinished_crawl_resumes_after_the_last_committed_page(tmp_path):
+    path = str(tmp_path / 'crawl_state.json')
+    state = CrawlState(path, save_interval=1).load()
+    state.start()
+    state.stage(1, hash='a', etag='"1"')
+    state.commit(1)
+    state.stage(2, hash='b')  # Fetched but never written
+
+    resumed = CrawlState(path).load()
+    assert resumed.resume_page() == 2
+    assert resumed.is_unchanged(1, 'a')
+    assert not resumed.is_unchanged(2, 'b')
+    assert resumed.conditional_headers(1) == {'If-None-Match': '"1"'}
+
+
+def test_finished_crawl_restarts_and_forgets_pages_past_the_end(tmp_path):
+    path = str(tmp_path / 'crawl_state.json')
+    state = CrawlState(path).load()
+    state.start()
+    for page in (1, 2, 3):
+        state.stage(page, hash=str(page))
+        state.commit(page)
+    state.finish(stop_page=3)
+
+    resumed = CrawlState(path).load()
+    assert resumed.resume_page() == 1
+    assert sorted(resumed.pages) == [1, 2]
+
+
+def test_commits_are_saved_every_interval_and_on_save(tmp_path):
+    path = str(tmp_path / 'crawl_state.json')
+    state = CrawlState(path, save_interval=2).load()
+    state.start()
+    for page in (1, 2, 3):
+        state.commit(page)
+    assert CrawlState(path).load().resume_page() == 3
+
+    state.save()
+    assert CrawlState(path).load().resume_page() == 4
+
+
+def test_full_crawl_discards_the_state_of_an_unfinished_incremental_crawl(tmp_path):
+    output_file = str(tmp_path / 'VR_Games_Data.xlsx')
+    extractor = VRDBExtractor()
+    state = CrawlState(extractor.state_path(output_file)).load()
+    state.start()
+    state.stage(1, hash='old', etag='"old"')
+    state.commit(1)
+    state.save()
+
+    sink, start_page = extractor._start_crawl(output_file, incremental=False)
+    assert start_page == 1
+    sink.write_page(1, pd.DataFrame([{'name': 'Game'}]))  # Interrupted after one page
+
+    _, start_page = extractor._start_crawl(output_file, incremental=True)
+    assert start_page == 1
+    assert extractor.crawl_state.conditional_headers(1) == {}
+    assert not extractor.crawl_state.is_unchanged(1, 'old')
+
+
+def test_interrupted_crawl_resumes_after_its_last_written_page(tmp_path, monkeypatch):
+    output_file = str(tmp_path / 'VR_Games_Data.xlsx')
+    extractor = VRDBExtractor()
+
+    def fetch_data(page):
+        if page == 4:
+            raise KeyboardInterrupt
+        return make_vrdb_page(page, num_games=2)
+
+    monkeypatch.setattr(extractor, 'fetch_data', fetch_data)
+    with pytest.raises(KeyboardInterrupt):
+        extractor.run(output_file, str(tmp_path / 'VR_Games_Data.json'), incremental=True)
+
+    assert CrawlState(extractor.state_path(output_file)).load().resume_page() == 4
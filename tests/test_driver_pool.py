@@ -0,0 +1,49 @@
+import pandas as pd
+import pytest
+from selenium.common import TimeoutException
+
+from src.driver_pool import DriverPool
+from src.processed_index import ProcessedGamesIndex
+from src.review_manifest import ReviewManifest
+from src.selenium_reviews_extractor import MetaReviewsExtractor
+from src.scrape_profile import ScrapeProfile
+
+
+def test_acquire_times_out_when_every_driver_is_in_use(fake_chrome):
+    pool = DriverPool(lambda: None, size=1)
+    pool.acquire()
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.2)
+
+
+def test_released_driver_is_reused(fake_chrome):
+    pool = DriverPool(lambda: None, size=1)
+    driver = pool.acquire()
+    pool.release(driver)
+    assert pool.acquire(timeout=0.2) is driver
+    assert len(fake_chrome) == 1
+
+
+def test_scrape_releases_driver_when_page_load_fails(fake_chrome, tmp_path):
+    pool = DriverPool(lambda: None, size=1, acquire_timeout=0.5)
+    extractor = MetaReviewsExtractor(driver_pool=pool, profile=ScrapeProfile(measure=False),
+                                     processed_index=ProcessedGamesIndex(str(tmp_path / 'index.db'),
+                                                                         games_folder=str(tmp_path)),
+                                     review_manifest=ReviewManifest(str(tmp_path / 'manifest.db')),
+                                     output_dir=str(tmp_path))
+    url = 'https://www.meta.com/experiences/123'
+    row = pd.Series({'name': 'Game', 'store_link': url})
+
+    driver = pool.acquire()
+    pool.release(driver)
+    driver.fail_get = TimeoutException('page load timed out')
+
+    with pytest.raises(TimeoutException):
+        extractor.scrape_reviews(url, row)
+
+    # The driver went back to the pool, and the failed load did not mark the game skipped
+    assert pool.acquire(timeout=0.2) is driver
+    assert extractor.processed_index.status(url) is None
+    assert not (tmp_path / 'skipped_games.txt').exists()
+    extractor.close_processed_index()
+    extractor.close_review_manifest()
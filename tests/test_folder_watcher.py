@@ -0,0 +1,46 @@
+import os
+import time
+
+from src.folder_watcher import FolderWatcher
+
+
+def write(path, content):
+    with open(path, 'w') as f:
+        f.write(content)
+
+
+def settle(path):
+    old = time.time() - 10
+    os.utime(path, (old, old))
+
+
+def test_new_files_are_reported_once_settled(tmp_path):
+    with FolderWatcher(str(tmp_path), suffix='.csv', debounce=1.0, poll_interval=0.01, use_events=False) as watcher:
+        path = tmp_path / 'game.csv'
+        write(path, 'a')
+        # Still being written: not handed out yet
+        assert watcher.wait_ready(timeout=0.1) == []
+
+        settle(path)
+        assert watcher.wait_ready(timeout=1.0) == ['game.csv']
+        # Reported only once until it changes again
+        assert watcher.wait_ready(timeout=0.1) == []
+
+
+def test_ignores_other_suffixes_and_atomic_write_temporaries(tmp_path):
+    with FolderWatcher(str(tmp_path), suffix='.csv', debounce=0.0, poll_interval=0.01, use_events=False) as watcher:
+        for name in ('notes.txt', 'game.tmp.csv', 'game.csv'):
+            write(tmp_path / name, 'a')
+            settle(tmp_path / name)
+        assert watcher.wait_ready(timeout=1.0) == ['game.csv']
+
+
+def test_files_present_at_start_are_not_reported(tmp_path):
+    write(tmp_path / 'old.csv', 'a')
+    settle(tmp_path / 'old.csv')
+    with FolderWatcher(str(tmp_path), suffix='.csv', debounce=0.0, poll_interval=0.01, use_events=False) as watcher:
+        assert watcher.wait_ready(timeout=0.1) == []
+
+        write(tmp_path / 'old.csv', 'ab')
+        settle(tmp_path / 'old.csv')
+        assert watcher.wait_ready(timeout=1.0) == ['old.csv']
@@ -0,0 +1,32 @@
+import json
+
+from src.game_store import GameDetailsStore
+
+
+def test_resubmitted_game_keeps_one_row(tmp_path):
+    with GameDetailsStore(str(tmp_path / 'games.db')) as store:
+        store.submit({'name': 'Game', 'store_link': 'https://www.meta.com/experiences/1', 'rating': 4.1})
+        store.submit({'name': 'Other', 'store_link': 'https://www.meta.com/experiences/2'})
+        store.submit({'name': 'Game', 'store_link': 'https://www.meta.com/experiences/1', 'rating': 4.3})
+
+    with GameDetailsStore(str(tmp_path / 'games.db')) as store:
+        records = store.records()
+        assert store.get('https://www.meta.com/experiences/1')['rating'] == 4.3
+        assert store.get('https://www.meta.com/experiences/3') is None
+    assert [record['name'] for record in records] == ['Game', 'Other']
+    assert records[0]['rating'] == 4.3
+
+
+def test_new_store_imports_earlier_export(tmp_path):
+    earlier = [{'name': 'Old', 'store_link': 'https://www.meta.com/experiences/1'}]
+    (tmp_path / 'games.json').write_text(json.dumps(earlier))
+
+    with GameDetailsStore(str(tmp_path / 'games.db')) as store:
+        store.submit({'name': 'New', 'store_link': 'https://www.meta.com/experiences/2'})
+    with GameDetailsStore(str(tmp_path / 'games.db')) as store:
+        store.export(str(tmp_path / 'games.xlsx'), str(tmp_path / 'games.json'))
+
+    # Earlier rows survive the export, and reopening does not import them again
+    exported = json.loads((tmp_path / 'games.json').read_text())
+    assert [record['name'] for record in exported] == ['Old', 'New']
+
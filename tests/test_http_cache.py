@@ -0,0 +1,48 @@
+import os
+
+import pytest
+
+from src.games_list_extractor import VRDBExtractor
+from src.http_cache import CacheMissError, ResponseCache
+
+URL = 'https://vrdb.app/games?page=1'
+
+
+def test_cached_response_is_fresh_until_its_ttl(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl=60)
+    assert cache.get(URL) is None
+    cache.put(URL, '<html>games</html>', etag='"v1"')
+
+    response = cache.get(URL)
+    assert response.body == '<html>games</html>'
+    assert response.fresh
+    assert response.validators() == {'If-None-Match': '"v1"'}
+    assert cache.stats['hits'] == 1 and cache.stats['misses'] == 1
+
+
+def test_stale_response_is_fresh_again_once_revalidated(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl=0)
+    cache.put(URL, 'body', last_modified='Mon, 02 Mar 2026 10:00:00 GMT')
+    assert not cache.get(URL).fresh
+
+    cache.ttl = 60
+    cache.touch(URL)
+    assert cache.get(URL).fresh
+    assert cache.stats['revalidated'] == 1
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ResponseCache(str(tmp_path), max_bytes=1)
+    cache.put(URL, os.urandom(64).hex())
+    assert cache.get(URL) is None
+    assert cache.stats['evictions'] == 1
+
+
+def test_offline_fetch_serves_stale_pages_and_raises_on_a_miss(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl=0, offline=True)
+    extractor = VRDBExtractor(base_url='https://vrdb.app/games', cache=cache)
+    cache.put('https://vrdb.app/games?page=1', 'page one')
+
+    assert extractor.fetch_data(1) == 'page one'
+    with pytest.raises(CacheMissError):
+        extractor.fetch_data(2)
@@ -0,0 +1,62 @@
+import time
+
+import pandas as pd
+import pytest
+
+from conftest import review
+from src.metrics import metrics
+from src.review_writer import stamp_reviews
+
+URL = 'https://www.meta.com/experiences/123'
+
+
+@pytest.fixture
+def extractor(make_extractor):
+    return make_extractor()
+
+
+def test_refresh_keeps_scrape_times_of_stored_reviews(extractor, monkeypatch):
+    # The last scrape saved 30 reviews, before scrape times were kept per review
+    extractor.scrape_stats = {'started_at': 100.0, 'finished_at': 200.0, 'clicks': 0}
+    extractor.save_game_reviews([review(number) for number in range(30)], '123')
+
+    # The store now lists one new review ahead of the stored ones
+    monkeypatch.setattr(extractor, 'harvest_new_reviews', lambda url: stamp_reviews([review(30), review(0)]))
+    started = time.time()
+    reviews = extractor.scrape_reviews(URL, pd.Series({'name': 'Game', 'store_link': URL}), incremental=True)
+
+    assert [item['author'] for item in reviews] == ['player_30'] + [f"player_{number}" for number in range(30)]
+    assert reviews[0]['scraped_at'] >= started
+    assert all(item['scraped_at'] == 200.0 for item in reviews[1:])
+
+    extractor.save_game_reviews(reviews, '123')
+    stored = extractor.stored_reviews('123')
+    assert [item['scraped_at'] for item in stored[1:]] == [200.0] * 30
+
+
+def test_refresh_does_not_resubmit_unchanged_details(extractor, monkeypatch):
+    submitted = []
+    submit = extractor.game_store.submit
+    monkeypatch.setattr(extractor.game_store, 'submit', lambda data: (submitted.append(data), submit(data)))
+    monkeypatch.setattr(extractor, 'paginate_reviews', lambda url, reviews, *args: reviews.extend(
+        stamp_reviews([review(number) for number in range(30)])))
+    row = pd.Series({'name': 'Game', 'store_link': URL})
+
+    extractor.scrape_reviews(URL, row)
+    extractor.game_store.flush()
+    extractor.scrape_reviews(URL, row, incremental=True)
+    assert len(submitted) == 1
+
+    extractor.extract_additional_games_details = lambda url: {'Developer': 'Other Studio'}
+    extractor.scrape_reviews(URL, row, incremental=True)
+    assert len(submitted) == 2
+
+
+def test_scrape_times_stages_without_a_game_label(extractor, monkeypatch):
+    monkeypatch.setattr(extractor, 'paginate_reviews', lambda url, reviews, *args: reviews.extend(
+        stamp_reviews([review(number) for number in range(30)])))
+    extractor.scrape_reviews(URL, pd.Series({'name': 'Game', 'store_link': URL}))
+
+    assert {'page_load', 'details', 'pagination'} <= set(extractor.stage_seconds)
+    snapshot = metrics.snapshot()
+    assert not any('game' in series['labels'] for series in snapshot['counters'] + snapshot['histograms'])
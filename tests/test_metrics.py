@@ -0,0 +1,42 @@
+import json
+
+from src.metrics import Metrics, MetricsWriter
+
+
+def test_records_are_kept_out_of_the_prometheus_series(tmp_path):
+    registry = Metrics()
+    registry.observe('review_game_seconds', 2.0)
+    registry.record('game_1', status='processed', seconds=2.0, stages={'save': 0.5})
+    registry.record('game_1', status='processed', seconds=3.0, stages={'save': 0.5})
+
+    registry.write(str(tmp_path / 'metrics.prom'))
+    assert 'game_1' not in (tmp_path / 'metrics.prom').read_text()
+
+    registry.write(str(tmp_path / 'metrics.json'))
+    snapshot = json.loads((tmp_path / 'metrics.json').read_text())
+    assert snapshot['records'] == {'game_1': {'status': 'processed', 'seconds': 3.0, 'stages': {'save': 0.5}}}
+    assert [histogram['labels'] for histogram in snapshot['histograms']] == [{}]
+
+
+def test_writer_writes_on_close_only_before_its_interval(tmp_path):
+    registry = Metrics()
+    path = tmp_path / 'metrics.json'
+    writer = MetricsWriter(str(path), interval=60, registry=registry)
+    registry.inc('reviews_scraped_total', 30)
+    assert not path.exists()
+
+    writer.close()
+    assert json.loads(path.read_text())['counters'][0]['value'] == 30
+    writer.close()
+
+
+def test_writer_writes_on_its_interval(tmp_path):
+    registry = Metrics()
+    path = tmp_path / 'metrics.prom'
+    writer = MetricsWriter(str(path), interval=0.05, registry=registry)
+    registry.inc('reviews_scraped_total', 30)
+    try:
+        writer._stop.wait(0.5)
+        assert 'reviews_scraped_total 30' in path.read_text()
+    finally:
+        writer.close()
@@ -0,0 +1,65 @@
+import pytest
+
+from conftest import FakeWaiter, review
+from src.review_writer import review_fingerprint
+
+URL = 'https://www.meta.com/experiences/123'
+
+
+class FakeButton:
+    def click(self):
+        pass
+
+
+class EndlessWaiter(FakeWaiter):
+    """Waiter of a store page whose "Show more reviews" button runs out only after SAFETY_CLICKS clicks"""
+
+    SAFETY_CLICKS = 1000
+
+    def __init__(self, *args, **kwargs):
+        self.loaded = 0
+
+    def clickable(self, *args, **kwargs):
+        return FakeButton() if self.loaded < self.SAFETY_CLICKS * 10 else None
+
+    def grows(self, *args, **kwargs):
+        self.loaded += 10
+        return self.loaded
+
+
+@pytest.fixture
+def extractor(make_extractor):
+    extractor = make_extractor()
+    harvested = iter(range(10 ** 6))
+    extractor.harvest_new_reviews = lambda url: [review(next(harvested))]
+    extractor.start_driver()
+    yield extractor
+    extractor.close_driver()
+
+
+def test_pruned_pagination_stops_at_the_click_cap(extractor):
+    reviews = []
+    extractor.paginate_reviews(URL, reviews, EndlessWaiter(), extractor.setup_logger('123'), MAX_SMR_CLICKS=25,
+                               prune_window=5)
+    assert extractor.scrape_stats['clicks'] == 26
+
+
+def test_incremental_pagination_stops_at_the_click_cap(extractor):
+    # No harvested batch ever reaches a stored review
+    reviews = []
+    extractor.paginate_reviews(URL, reviews, EndlessWaiter(), extractor.setup_logger('123'), MAX_SMR_CLICKS=25,
+                               known={'stored review'})
+    assert extractor.scrape_stats['clicks'] == 26
+    assert len(reviews) == 28  # One before the first click, one per click and one after the last
+
+
+def test_incremental_pagination_stops_at_the_first_stored_review(extractor):
+    stored = review(3)
+    batches = iter([[review(0)], [review(1), review(2)], [stored, review(4)]])
+    extractor.harvest_new_reviews = lambda url: next(batches)
+    reviews = []
+    extractor.paginate_reviews(URL, reviews, EndlessWaiter(), extractor.setup_logger('123'),
+                               known={review_fingerprint(stored)})
+    # The batch holding the stored review is the last one, only its unknown reviews are kept
+    assert [item['author'] for item in reviews] == ['player_0', 'player_1', 'player_2', 'player_4']
+    assert extractor.scrape_stats['clicks'] == 2
@@ -0,0 +1,36 @@
+from src.processed_index import PROCESSED, SKIPPED, ProcessedGamesIndex
+from src.review_manifest import ReviewManifest
+
+LINK = 'https://www.meta.com/experiences/{}?ranking_trace=1'
+
+
+def test_index_is_built_once_from_the_existing_outputs(tmp_path):
+    manifest = ReviewManifest(str(tmp_path / 'review_manifest.db'))
+    manifest.record('1', 30, {}, 'hash')
+    manifest.close()
+    (tmp_path / 'xlsx_games_reviews').mkdir()
+    (tmp_path / 'xlsx_games_reviews' / '2.xlsx').write_bytes(b'')
+    (tmp_path / 'skipped_games.txt').write_text("Skipping game: 3 (Reviews: 4)\nSkipping game: 4\n")
+
+    index = ProcessedGamesIndex(str(tmp_path / 'processed_games.db'), games_folder=str(tmp_path))
+    assert [index.status(LINK.format(game)) for game in '12345'] == [PROCESSED, PROCESSED, SKIPPED, SKIPPED, None]
+    index.close()
+
+    # Outputs appearing later are recorded by the scrapers, not by rebuilding the index
+    (tmp_path / 'xlsx_games_reviews' / '5.xlsx').write_bytes(b'')
+    index = ProcessedGamesIndex(str(tmp_path / 'processed_games.db'), games_folder=str(tmp_path))
+    assert not index.is_processed(LINK.format(5))
+    index.close()
+
+
+def test_marks_are_shared_by_every_opened_index(tmp_path):
+    db_path = str(tmp_path / 'processed_games.db')
+    scraper = ProcessedGamesIndex(db_path, games_folder=str(tmp_path))
+    other = ProcessedGamesIndex(db_path, games_folder=str(tmp_path))
+
+    scraper.mark_skipped(LINK.format(7), 3)
+    assert other.status(LINK.format(7)) == SKIPPED
+    scraper.mark_processed(LINK.format(7), 40)
+    assert other.status('https://www.meta.com/experiences/7') == PROCESSED
+    scraper.close()
+    other.close()
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+
+from src.review_analytics import game_aggregates, load_reviews, parse_helpful_votes, parse_review_times
+from src.review_manifest import ReviewManifest
+from src.review_writer import write_reviews
+
+
+def test_helpful_votes_only_count_the_helpful_wording():
+    votes = pd.Series(['12 people found this helpful', '1 person found this helpful', '1.2K people found this helpful',
+                       '1,024 people found this helpful', 'player_123', 'Played 40 hours', 'N/A', '', None, '7'])
+    assert parse_helpful_votes(votes).tolist() == [12, 1, 1200, 1024, 0, 0, 0, 0, 0, 7]
+
+
+def test_relative_times_count_back_from_each_scrape_time():
+    scraped_at = pd.Series(pd.to_datetime(['2026-03-10', '2026-03-20', '2026-03-20'], utc=True))
+    reviewed_at = parse_review_times(pd.Series(['3 days ago', 'yesterday', '2025-12-01']), scraped_at)
+    assert reviewed_at.tolist() == [pd.Timestamp('2026-03-07', tz='UTC'), pd.Timestamp('2026-03-19', tz='UTC'),
+                                    pd.Timestamp('2025-12-01', tz='UTC')]
+
+
+def test_game_aggregates():
+    scraped_at = pd.Timestamp('2026-03-20', tz='UTC')
+    reviews = pd.DataFrame({
+        'game_id': ['1', '1', '1', '2'],
+        'rating': np.array([5, 3, 0, 1], dtype=np.int8),
+        'reviewed_at': pd.to_datetime(['2026-03-19', '2026-01-01', '2026-03-01', '2026-03-18'], utc=True),
+        'helpful_count': [1, 0, 0, 0],
+        'scraped_at': scraped_at,
+    })
+    stats = game_aggregates(reviews)
+    assert stats.loc['1', 'review_count'] == 3
+    assert stats.loc['1', 'mean_rating'] == 4.0
+    assert stats.loc['1', 'helpful_weighted_rating'] == (5 * 2 + 3) / 3
+    assert stats.loc['1', 'recent_reviews'] == 2
+    assert stats.loc['2', ['rating_1', 'rating_5']].tolist() == [1, 0]
+
+
+def test_load_reviews_anchors_rows_without_scrape_time_at_the_manifest(tmp_path):
+    manifest = ReviewManifest(str(tmp_path / 'review_manifest.db'))
+    manifest.record('1', 2, {}, 'hash', scrape_finished=pd.Timestamp('2026-03-20', tz='UTC').timestamp())
+    manifest.close()
+    row_scraped_at = pd.Timestamp('2026-02-01', tz='UTC').timestamp()
+    write_reviews([{'title': 'Old', 'rating': 4, 'time': '2 days ago', 'helpful_votes': 'N/A',
+                    'scraped_at': row_scraped_at},
+                   {'title': 'Legacy', 'rating': 2, 'time': '2 days ago', 'helpful_votes': 'N/A', 'scraped_at': ''}],
+                  csv_path=str(tmp_path / 'csv_games_reviews' / '1_2.csv'))
+
+    reviews = load_reviews(str(tmp_path))
+    assert reviews['reviewed_at'].tolist() == [pd.Timestamp('2026-01-30', tz='UTC'),
+                                               pd.Timestamp('2026-03-18', tz='UTC')]
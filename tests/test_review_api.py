@@ -0,0 +1,67 @@
+import pandas as pd
+import pytest
+
+from benchmarks.review_api_server import ReviewApiFixtureServer
+from conftest import FakeWaiter, review
+from src import review_api, selenium_reviews_extractor
+from src.review_api import CapturedReviewRequest, ReviewApiClient, ReviewApiError
+from src.review_writer import stamp_reviews
+from src.selenium_reviews_extractor import REVIEW_BACKEND_API
+
+URL = 'https://www.meta.com/experiences/123'
+
+POST_DATA = 'doc_id=1&variables={"id":"123","after":null}&review_query=1'
+
+
+class FakeButton:
+    def click(self):
+        pass
+
+
+class ButtonWaiter(FakeWaiter):
+    """Waiter that finds the "Show more reviews" button and no review cards"""
+
+    def clickable(self, *args, **kwargs):
+        return FakeButton()
+
+    def count(self, *args, **kwargs):
+        return 0
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+        self.content = text.encode('utf-8')
+
+    def raise_for_status(self):
+        pass
+
+
+def test_client_pages_through_every_review():
+    with ReviewApiFixtureServer(num_reviews=25, page_size=10) as server:
+        client = ReviewApiClient(CapturedReviewRequest(server.url, {}, POST_DATA))
+        reviews = client.fetch_all()
+        client.close()
+    assert len(reviews) == 25
+    assert client.requests_sent == 3
+
+
+@pytest.mark.parametrize('body', ['{bad', 'for (;;);<html>{</html>', '<html>Log in</html>'])
+def test_unreadable_response_raises_review_api_error(monkeypatch, body):
+    monkeypatch.setattr(review_api.requests.Session, 'post', lambda *args, **kwargs: FakeResponse(body))
+    client = ReviewApiClient(CapturedReviewRequest('https://www.meta.com/api/graphql/', {}, POST_DATA))
+    with pytest.raises(ReviewApiError):
+        client.fetch_page(None)
+
+
+def test_unreadable_response_falls_back_to_browser_pagination(make_extractor, monkeypatch):
+    extractor = make_extractor(waiter=ButtonWaiter, review_backend=REVIEW_BACKEND_API)
+    monkeypatch.setattr(selenium_reviews_extractor, 'capture_review_request',
+                        lambda driver, entries: CapturedReviewRequest('https://www.meta.com/api/graphql/', {},
+                                                                      POST_DATA))
+    monkeypatch.setattr(review_api.requests.Session, 'post', lambda *args, **kwargs: FakeResponse('{bad'))
+    monkeypatch.setattr(extractor, 'paginate_reviews', lambda url, reviews, *args: reviews.extend(
+        stamp_reviews([review(number) for number in range(30)])))
+
+    reviews = extractor.scrape_reviews(URL, pd.Series({'name': 'Game', 'store_link': URL}))
+    assert [item['author'] for item in reviews] == [f"player_{number}" for number in range(30)]
@@ -0,0 +1,30 @@
+from conftest import FakeStorePage
+from src.review_cards import EXTRACT_WITH_SCRIPT, EXTRACT_WITH_WEBDRIVER, REVIEW_FIELDS
+
+URL = 'https://www.meta.com/experiences/123'
+
+
+def test_script_reads_every_card_in_one_call_like_webdriver_lookups(make_extractor):
+    page = FakeStorePage()
+    page.load(20)
+    extractor = make_extractor(extraction_mode=EXTRACT_WITH_SCRIPT)
+    extractor.driver = page
+    serialized = extractor.extract_reviews(URL)
+    assert page.serialize_calls == 1
+
+    extractor.extraction_mode = EXTRACT_WITH_WEBDRIVER
+    assert extractor.extract_reviews(URL) == serialized
+    assert len(serialized) == 20
+    assert list(serialized[0]) == REVIEW_FIELDS
+
+
+def test_failed_script_falls_back_to_webdriver_lookups(make_extractor):
+    page = FakeStorePage(script_fails=True)
+    page.load(3)
+    extractor = make_extractor(extraction_mode=EXTRACT_WITH_SCRIPT)
+    extractor.driver = page
+
+    assert [review['rating'] for review in extractor.extract_reviews(URL)] == [1, 2, 3]
+    assert [review['author'] for review in extractor.harvest_new_reviews(URL)] == ['player_0', 'player_1',
+                                                                                 'player_2']
+    assert extractor.harvest_new_reviews(URL) == []
@@ -0,0 +1,20 @@
+import pytest
+
+from conftest import FakeStorePage
+from src.review_cards import EXTRACT_WITH_SCRIPT, EXTRACT_WITH_WEBDRIVER
+
+URL = 'https://www.meta.com/experiences/123'
+
+
+@pytest.mark.parametrize('extraction_mode', [EXTRACT_WITH_SCRIPT, EXTRACT_WITH_WEBDRIVER])
+def test_each_card_is_harvested_once(make_extractor, extraction_mode):
+    extractor = make_extractor(extraction_mode=extraction_mode)
+    extractor.driver = page = FakeStorePage()
+
+    page.load(3)
+    assert [review['author'] for review in extractor.harvest_new_reviews(URL)] == ['player_0', 'player_1',
+                                                                                 'player_2']
+    page.load(2)
+    assert [review['author'] for review in extractor.harvest_new_reviews(URL)] == ['player_3', 'player_4']
+    assert extractor.harvest_new_reviews(URL) == []
+    assert all(card.harvested for card in page.cards)
@@ -0,0 +1,20 @@
+from src.review_manifest import ReviewManifest
+
+
+def test_manifest_answers_counts_and_change_checks(tmp_path):
+    csv_path = tmp_path / 'game_1.csv'
+    csv_path.write_text('title\n')
+    manifest = ReviewManifest(str(tmp_path / 'review_manifest.db'))
+    manifest.record('game', 1, {'csv': str(csv_path)}, 'hash', scrape_started=10.0, scrape_finished=20.0)
+    manifest.record('other', 4, {}, 'hash')
+    manifest.record('game', 2, {'csv': str(csv_path)}, 'hash', scrape_started=30.0, scrape_finished=40.0)
+
+    assert manifest.review_counts() == {'game': 2, 'other': 4}
+    assert manifest.review_count('missing') is None
+    assert manifest.scrape_times()['game'] == 40.0
+    assert manifest.is_unchanged('game', 'hash')
+    assert not manifest.is_unchanged('game', 'other hash')
+
+    csv_path.unlink()
+    assert not manifest.is_unchanged('game', 'hash')
+    manifest.close()
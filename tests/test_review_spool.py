@@ -0,0 +1,37 @@
+import pandas as pd
+
+from src.review_writer import ReviewSpool, reviews_digest
+
+
+def review(number):
+    return {'title': f"Title {number}", 'rating': 5, 'time': '3 months ago', 'content': f"Content {number}",
+            'author': f"player_{number}", 'helpful_votes': 'N/A'}
+
+
+def test_resumed_spool_skips_replayed_reviews_and_drops_a_torn_batch(tmp_path):
+    spool = ReviewSpool('game', directory=str(tmp_path))
+    spool.extend([review(0), review(1)])
+    spool.extend([review(2)])
+    with open(spool.path, 'a', encoding='utf-8') as f:
+        f.write('{"batch": 2, "reviews": [{"title"')  # Crash mid-write
+
+    resumed = ReviewSpool('game', directory=str(tmp_path))
+    assert resumed.resumed == 3
+    # The new run pages through the store from the start again
+    resumed.extend([review(0), review(1)])
+    resumed.extend([review(2), review(3)])
+
+    reviews = [review(number) for number in range(4)]
+    assert list(resumed) == reviews
+    assert resumed.content_hash == reviews_digest(reviews).hexdigest()
+
+
+def test_finalize_writes_the_outputs_and_removes_the_spool(tmp_path):
+    spool = ReviewSpool('game', directory=str(tmp_path / 'spool'))
+    spool.extend([review(0), review(1)])
+    csv_path = str(tmp_path / 'game.csv')
+
+    assert spool.finalize(csv_path=csv_path) == 2
+    assert pd.read_csv(csv_path)['author'].tolist() == ['player_0', 'player_1']
+    assert len(spool) == 0
+    assert not (tmp_path / 'spool' / 'game.ndjson').exists()
@@ -0,0 +1,68 @@
+from src import reviews_verifier
+from src.review_manifest import ReviewManifest
+from src.review_writer import write_reviews
+from src.reviews_verifier import MetaReviewScraper
+from src.verification_log import VerificationLog
+
+
+def test_games_are_listed_from_the_manifest(tmp_path):
+    manifest = ReviewManifest(str(tmp_path / 'review_manifest.db'))
+    for game in ('1', '2', '3'):
+        manifest.record(game, 30, {'parquet': str(tmp_path / f"{game}.parquet")}, 'hash')
+    # An older log names the game's Excel file
+    log = VerificationLog(str(tmp_path / 'log.db'))
+    log.add({'filename': '1.xlsx', 'url': 'https://www.meta.com/experiences/1'})
+    log.close()
+    (tmp_path / 'games.xlsx').write_bytes(b'')
+
+    scraper = MetaReviewScraper(str(tmp_path), str(tmp_path / 'log.xlsx'), workers=1, manifest=manifest)
+    assert scraper.new_games() == ['2', '3']
+
+
+def test_excel_migration_reads_only_per_game_review_files(tmp_path):
+    write_reviews([{'title': 'Title', 'rating': 5, 'content': str(number)} for number in range(3)],
+                  xlsx_path=str(tmp_path / 'xlsx_games_reviews' / '5.xlsx'))
+    # Not review files; unreadable, so opening them would fail the migration
+    (tmp_path / 'games.xlsx').write_bytes(b'not a workbook')
+    (tmp_path / 'VR_Games_data.xlsx').write_bytes(b'not a workbook')
+
+    manifest = ReviewManifest(str(tmp_path / 'review_manifest.db'))
+    scraper = MetaReviewScraper(str(tmp_path), str(tmp_path / 'log.xlsx'), workers=1, manifest=manifest)
+    assert scraper.migrate_excel_reviews() == 1
+    assert scraper.migrate_excel_reviews() == 0
+    assert scraper.new_games() == ['5']
+    assert manifest.review_count('5') == 3
+
+
+def test_games_are_verified_concurrently_and_logged(tmp_path, monkeypatch):
+    manifest = ReviewManifest(str(tmp_path / 'review_manifest.db'))
+    for game in ('1', '2', '3'):
+        manifest.record(game, 30, {}, 'hash')
+    scraper = MetaReviewScraper(str(tmp_path), str(tmp_path / 'log.xlsx'), workers=2, manifest=manifest)
+    monkeypatch.setattr(scraper, 'extract_reviews', lambda url: ('40', '30'))
+    # A clock too coarse to see the run take any time
+    monkeypatch.setattr(reviews_verifier.time, 'monotonic', lambda: 100.0)
+
+    assert scraper.process_files() == 3
+    assert scraper.new_games() == []
+    assert sorted(scraper.log.processed_files()) == ['1', '2', '3']
+
+
+def test_only_games_saved_with_other_reviews_are_verified_again(tmp_path, monkeypatch):
+    manifest = ReviewManifest(str(tmp_path / 'review_manifest.db'))
+    for game in ('1', '2'):
+        manifest.record(game, 30, {}, 'hash')
+    scraper = MetaReviewScraper(str(tmp_path), str(tmp_path / 'log.xlsx'), workers=1, manifest=manifest)
+    monkeypatch.setattr(scraper, 'extract_reviews', lambda url: ('40', '30'))
+    assert scraper.process_files() == 2
+
+    # Game 1 is refreshed with the same review count but other reviews, game 2 with the same reviews
+    manifest.record('1', 30, {}, 'refreshed hash')
+    manifest.record('2', 30, {}, 'hash')
+    assert scraper.new_games() == ['1']
+    assert scraper.process_files() == 1
+    assert scraper.new_games() == []
+
+    # A restarted verifier knows which reviews each game was verified with
+    restarted = MetaReviewScraper(str(tmp_path), str(tmp_path / 'log.xlsx'), workers=1, manifest=manifest)
+    assert restarted.new_games() == []
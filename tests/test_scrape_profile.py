@@ -0,0 +1,45 @@
+import json
+
+from src.scrape_profile import SCRAPE_PROFILES, network_bytes
+
+
+class CdpDriver:
+    def __init__(self):
+        self.commands = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append((command, params))
+        return {}
+
+
+def log_entry(method, **params):
+    return {'message': json.dumps({'message': {'method': method, 'params': params}})}
+
+
+def test_lean_profile_blocks_heavy_resources_and_loads_eagerly():
+    lean = SCRAPE_PROFILES['lean']
+    options = lean.chrome_options()
+    assert options.page_load_strategy == 'eager'
+    assert options.experimental_options['prefs'] == {'profile.managed_default_content_settings.images': 2}
+    assert lean.ready_states == ('interactive', 'complete')
+
+    driver = CdpDriver()
+    lean.apply(driver)
+    blocked = dict(driver.commands)['Network.setBlockedURLs']['urls']
+    assert {'*.png', '*.mp4', '*.woff2', '*google-analytics.com*'} <= set(blocked)
+
+
+def test_full_profile_blocks_nothing():
+    full = SCRAPE_PROFILES['full']
+    driver = CdpDriver()
+    full.apply(driver)
+    assert driver.commands == []
+    assert full.chrome_options().page_load_strategy == 'normal'
+    assert full.ready_states == ('complete',)
+
+
+def test_network_bytes_counts_finished_responses():
+    entries = [log_entry('Network.requestWillBeSent', requestId='1'),
+               log_entry('Network.loadingFinished', requestId='1', encodedDataLength=1500),
+               log_entry('Network.loadingFinished', requestId='2', encodedDataLength=500)]
+    assert network_bytes(entries) == (2000, 2)
@@ -0,0 +1,28 @@
+import pytest
+
+from benchmarks.fixtures import make_vrdb_page
+from src.games_list_extractor import VRDBExtractor
+
+
+@pytest.fixture(scope='module')
+def extractor():
+    return VRDBExtractor()
+
+
+@pytest.mark.parametrize('page', [make_vrdb_page(1, 25), make_vrdb_page(2, 0)])
+def test_scanned_script_matches_the_dom(extractor, page):
+    soup_script = extractor.extract_script_content_soup(page)
+    assert extractor.scan_script_content(page) == soup_script
+    assert extractor.scan_script_content(page.encode('utf-8')) == soup_script
+
+
+def test_marker_outside_a_script_falls_back_to_the_dom(extractor):
+    page = ('<html><body><p>resolve({id:1 is how the data starts</p>'
+            '<script>__sveltekit.resolve({id:1,data:{games:[]}})</script></body></html>')
+    assert extractor.scan_script_content(page) is None
+    assert extractor.extract_script_content(page) == '__sveltekit.resolve({id:1,data:{games:[]}})'
+
+
+def test_page_without_the_payload_raises_value_error(extractor):
+    with pytest.raises(ValueError):
+        extractor.extract_script_content('<html><script>console.log(1)</script></html>')
@@ -0,0 +1,52 @@
+import json
+
+import pandas as pd
+import pytest
+
+from benchmarks.bench_parse import BASELINE_PAGE, BASELINE_PARSED, parsed_as_json
+from benchmarks.fixtures import make_vrdb_page
+from benchmarks.suite import record_fixtures
+from src.games_list_extractor import VRDBExtractor
+
+
+@pytest.fixture(scope='module')
+def extractor():
+    return VRDBExtractor()
+
+
+def test_parsers_match_the_original_parser_on_the_recorded_page(extractor):
+    with open(BASELINE_PAGE, encoding='utf-8') as f:
+        script_content = extractor.extract_script_content(f.read())
+    with open(BASELINE_PARSED, encoding='utf-8') as f:
+        expected = json.load(f)
+    assert parsed_as_json(extractor.parse_game_data(script_content)) == expected
+    assert parsed_as_json(extractor.parse_game_data_regex(script_content)) == expected
+
+
+def test_parsers_agree_on_recorded_pages(extractor, tmp_path):
+    fixtures = record_fixtures(str(tmp_path), [1, 25, 500], [])
+    for path in fixtures['vrdb'].values():
+        with open(path, encoding='utf-8') as f:
+            script_content = extractor.extract_script_content(f.read())
+        pd.testing.assert_frame_equal(extractor.parse_game_data(script_content),
+                                      extractor.parse_game_data_regex(script_content))
+
+
+@pytest.mark.parametrize('num_developers', [0, 100])
+def test_parsers_agree_on_escaped_names_and_shuffled_keys(extractor, num_developers):
+    for page in range(1, 6):
+        script_content = extractor.extract_script_content(
+            make_vrdb_page(page, 50, num_developers=num_developers, quirks=True))
+        scanned = extractor.parse_game_data(script_content)
+        assert len(scanned) == 50
+        pd.testing.assert_frame_equal(scanned, extractor.parse_game_data_regex(script_content))
+
+
+def test_escaped_quotes_and_key_order(extractor):
+    text = ('resolve({id:1,data:{games:[{store_link:"https://www.meta.com/experiences/7",'
+            'name:"The \\"Best\\" C:\\\\ Game",genres:["Puzzle"],id:"7",rating_score:4.5}]}})')
+    for parse in (extractor.parse_game_data, extractor.parse_game_data_regex):
+        assert parse(text).to_dict(orient='records') == [{
+            'store_link': 'https://www.meta.com/experiences/7', 'name': 'The "Best" C:\\ Game',
+            'genres': ['Puzzle'], 'id': '7', 'rating_score': 4.5,
+        }]
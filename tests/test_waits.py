@@ -0,0 +1,50 @@
+import time
+
+import pytest
+from selenium.common import TimeoutException
+
+from src.waits import DEFAULT_WAIT_TIMEOUT, Waiter, WaitStats, wait_timeout
+
+URL = 'https://www.meta.com/experiences/123'
+
+
+class ReadyStateDriver:
+    """Driver whose document becomes ready after `loading_checks` checks"""
+
+    def __init__(self, loading_checks):
+        self.loading_checks = loading_checks
+        self.checks = 0
+
+    def execute_script(self, script, *args):
+        self.checks += 1
+        return 'loading' if self.checks <= self.loading_checks else 'complete'
+
+
+def test_page_load_returns_once_the_document_is_ready():
+    stats = WaitStats()
+    started = time.monotonic()
+    assert Waiter(ReadyStateDriver(loading_checks=2), URL, stats).page_loaded()
+    assert time.monotonic() - started < 2
+    count, total, longest, timeouts = stats.waits['page_load']
+    assert (count, timeouts) == (1, 0)
+
+
+def test_timed_out_wait_is_recorded_and_raised_only_when_asked():
+    stats = WaitStats()
+    waiter = Waiter(ReadyStateDriver(loading_checks=10 ** 6), URL, stats)
+    assert waiter.until('page_load', lambda driver: driver.execute_script('') == 'complete', timeout=0.3) is None
+    with pytest.raises(TimeoutException):
+        waiter.until('page_load', lambda driver: False, timeout=0.3, raise_on_timeout=True)
+    assert stats.waits['page_load'][3] == 2
+    assert '2 timed out' in stats.summary()
+
+
+def test_grows_returns_the_new_count():
+    counts = iter([5, 5, 8])
+    waiter = Waiter(None, URL)
+    assert waiter.grows('reviews_loaded', lambda: next(counts), 5) == 8
+
+
+def test_timeouts_are_set_per_site():
+    assert wait_timeout(URL, 'settled') == 5.0
+    assert wait_timeout('https://vrdb.app/games', 'settled') == DEFAULT_WAIT_TIMEOUT
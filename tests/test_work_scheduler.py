@@ -0,0 +1,42 @@
+import os
+from functools import partial
+
+from src.work_scheduler import WorkScheduler
+
+
+class RecordingWorker:
+    """Appends each task to a file; exits the process on the tasks named in `crash_on`."""
+
+    def __init__(self, log_path, crash_on, slot):
+        self.log_path = log_path
+        self.crash_on = crash_on
+
+    def __call__(self, item):
+        with open(self.log_path, 'a', encoding='utf-8') as f:
+            f.write(f"{item}\n")
+        if item in self.crash_on:
+            os._exit(1)
+
+
+def make_worker(log_path, crash_on=()):
+    return partial(RecordingWorker, log_path, crash_on)
+
+
+def test_every_task_runs_once(tmp_path):
+    log_path = str(tmp_path / 'tasks.log')
+    scheduler = WorkScheduler(make_worker(log_path), num_workers=2)
+    stats = scheduler.run([(item, item) for item in 'abcde'])
+
+    assert sorted(open(log_path).read().split()) == list('abcde')
+    assert sum(worker.tasks for worker in stats.values()) == 5
+    assert scheduler.failed == []
+
+
+def test_task_that_crashes_its_worker_is_retried_then_given_up(tmp_path):
+    log_path = str(tmp_path / 'tasks.log')
+    scheduler = WorkScheduler(make_worker(log_path, crash_on=('b',)), num_workers=1, max_attempts=2)
+    scheduler.run([(item, item) for item in 'abc'])
+
+    assert sorted(open(log_path).read().split()) == ['a', 'b', 'b', 'c']
+    assert scheduler.failed == ['b']
+    assert scheduler.stats[0].restarts == 2